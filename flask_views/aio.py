@@ -0,0 +1,128 @@
+"""
+Async variants of the views.
+
+.. note:: This module requires Python 3.7 or higher.
+
+"""
+from __future__ import absolute_import
+
+import asyncio
+import contextvars
+import functools
+
+from flask_views.base import TemplateView
+from flask_views.json import JSONView
+
+
+async def run_sync(func, *args, **kwargs):
+    """
+    Run a blocking function in the default executor of the event loop.
+
+    The current context is copied to the executor thread, so the Flask
+    application and request contexts stay available to ``func``.
+
+    :param func:
+        The (blocking) function to run.
+
+    :return:
+        The value returned by ``func``.
+
+    """
+    loop = asyncio.get_event_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        None, functools.partial(context.run, func, *args, **kwargs))
+
+
+def coroutine_function(coroutine):
+    """
+    Return a coroutine function awaiting the given coroutine.
+
+    This is used to pass an already created coroutine to an API expecting
+    a coroutine function, like :py:meth:`!flask.Flask.ensure_sync`.
+
+    :param coroutine:
+        The coroutine to await.
+
+    :return:
+        A coroutine function without arguments, returning the value
+        returned by ``coroutine``.
+
+    """
+    async def await_coroutine():
+        return await coroutine
+    return await_coroutine
+
+
+class AsyncTemplateView(TemplateView):
+    """
+    Async view class for rendering templates.
+
+    This class inherits from:
+
+    * :py:class:`~flask_views.base.TemplateView`
+
+    The :py:meth:`~.AsyncTemplateView.get_context_data` method is a coroutine,
+    so you are able to ``await`` in your own implementation. Example usage::
+
+        class IndexTemplateView(AsyncTemplateView):
+            template_name = 'index.html'
+
+            async def get_context_data(self, **kwargs):
+                context = await super().get_context_data(**kwargs)
+                context['news'] = await fetch_news()
+                return context
+
+    """
+    async def get_context_data(self, **kwargs):
+        """
+        Get context data for rendering the template.
+
+        :return:
+            Output of :py:meth:`.TemplateView.get_context_data`.
+
+        """
+        return super(AsyncTemplateView, self).get_context_data(**kwargs)
+
+    async def get(self, *args, **kwargs):
+        """
+        Render the template on request.
+
+        :return:
+            Output of :py:meth:`.TemplateResponseMixin.render_to_response`.
+
+        """
+        return self.render_to_response(await self.get_context_data(**kwargs))
+
+
+class AsyncJSONView(JSONView):
+    """
+    Async view class for rendering JSON responses.
+
+    This class inherits from:
+
+    * :py:class:`~flask_views.json.JSONView`
+
+    Like :py:class:`.AsyncTemplateView`, the
+    :py:meth:`~.AsyncJSONView.get_context_data` method is a coroutine.
+
+    """
+    async def get_context_data(self, **kwargs):
+        """
+        Get context data for rendering the JSON response.
+
+        :return:
+            Output of :py:meth:`.JSONView.get_context_data`.
+
+        """
+        return super(AsyncJSONView, self).get_context_data(**kwargs)
+
+    async def get(self, *args, **kwargs):
+        """
+        Render the JSON response on GET request.
+
+        :return:
+            Output of :py:meth:`.JSONResponseMixin.render_to_response`.
+
+        """
+        return self.render_to_response(await self.get_context_data(**kwargs))
@@ -1,8 +1,112 @@
-from flask import render_template
+import copy
+import functools
+import threading
+from time import time
+
+from flask import (
+    copy_current_request_context,
+    current_app,
+    make_response,
+    render_template,
+    request,
+    stream_with_context,
+)
 from flask.views import MethodView
+from markupsafe import Markup
 
+from flask_views.cache import LRUCache, SingleFlight, get_tag_version
+
+try:
+    from inspect import iscoroutine
+except ImportError:  # Python < 3.5
+    def iscoroutine(obj):
+        return False
+
+
+def memoize(method):
+    """
+    Decorator storing the return value of a view method for the request.
+
+    The method is only called once per view instance. Since Flask creates a
+    new view instance for every request, this means once per request.
+    Example usage::
+
+        class ArticleListView(ListView):
+
+            @memoize
+            def get_filter_fields(self):
+                return {'category': get_category(self.kwargs['slug'])}
+
+    Overriding a memoized method in a subclass works as usual. The override
+    is only memoized when it is decorated as well.
+
+    A ``dict``, ``list`` or ``set`` is copied on every call, so callers may
+    modify the returned value. Do not memoize methods returning other
+    mutable objects (Eg: a ``QuerySet``, which caches its results).
+
+    :param method:
+        A method without arguments (besides ``self``).
+
+    """
+    @functools.wraps(method)
+    def wrapper(self):
+        try:
+            memoized = self.__dict__['_memoized']
+        except KeyError:
+            memoized = self.__dict__['_memoized'] = {}
+
+        try:
+            value = memoized[method]
+        except KeyError:
+            value = memoized[method] = method(self)
+
+        if isinstance(value, (dict, list, set)):
+            return copy.copy(value)
+        return value
+
+    return wrapper
+
+
+def get_function(method):
+    """
+    Return the function of the given (unbound) method.
+    """
+    return getattr(method, '__func__', method)
+
+
+def to_utc(value):
+    """
+    Return the given ``datetime`` as naive UTC ``datetime``.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.replace(tzinfo=None) - value.utcoffset()
+
+
+class ImproperlyConfigured(Exception):
+    """
+    Raised when a view class is not configured correctly.
+    """
+
+
+class ViewType(type(MethodView)):
+    """
+    Metaclass of :py:class:`.View`.
+
+    This checks the configuration of the view class when it is defined (see
+    :py:meth:`.View.check_configuration`), so invalid settings fail at import
+    time instead of at request time.
 
-class View(MethodView):
+    """
+    def __init__(cls, name, bases, attrs):
+        super(ViewType, cls).__init__(name, bases, attrs)
+
+        check_configuration = getattr(cls, 'check_configuration', None)
+        if check_configuration is not None:
+            check_configuration()
+
+
+class View(ViewType('ViewBase', (MethodView,), {'__module__': __name__})):
     """
     View which will dispatch requests based on request method.
 
@@ -21,19 +125,138 @@ class View(MethodView):
     When you have a URL route ``'/<user>/'`` and you GET ``/john/``, it
     will return ``'Hello john'``.
 
+    Request method handlers may also be coroutine functions (``async def``),
+    in which case the returned coroutine is awaited before the response is
+    returned. See :py:mod:`flask_views.aio` for async variants of the views.
+
+    The configuration of the view class is checked when the class is defined
+    and when :py:meth:`~.View.as_view` is called (Eg: when registering the
+    URL route). A misconfigured view raises :py:exc:`.ImproperlyConfigured`.
+
     """
+    @classmethod
+    def check_configuration(cls, concrete=False):
+        """
+        Check the configuration of the view class.
+
+        This calls the ``get_configuration_errors`` class methods defined by
+        the view class and its base classes (Eg: the mixins). These return a
+        ``list`` of error messages and receive the ``concrete`` argument, so
+        settings which are only required for a view which is used (Eg:
+        ``document_class``) are only checked when ``concrete`` is ``True``.
+
+        :param concrete:
+            ``True`` when the view class is used for handling requests,
+            ``False`` when it is only defined (and could be a base class).
+
+        :raise:
+            :py:exc:`.ImproperlyConfigured` when there are errors.
+
+        """
+        errors = []
+        for klass in reversed(cls.__mro__):
+            hook = klass.__dict__.get('get_configuration_errors')
+            if hook is not None:
+                errors.extend(hook.__get__(None, cls)(concrete))
+
+        if errors:
+            raise ImproperlyConfigured('{0}.{1}: {2}'.format(
+                cls.__module__, cls.__name__, ' '.join(errors)))
+
+    @classmethod
+    def as_view(cls, name, *class_args, **class_kwargs):
+        """
+        Return the view function for registering the URL route.
+
+        :raise:
+            :py:exc:`.ImproperlyConfigured` when the view class is not
+            configured correctly.
+
+        :return:
+            Output of :py:meth:`!flask.views.View.as_view`.
+
+        """
+        cls.check_configuration(concrete=True)
+        return super(View, cls).as_view(name, *class_args, **class_kwargs)
+
     def dispatch_request(self, *args, **kwargs):
         """
         Dispatch the request based on HTTP method.
 
         This sets the arguments and keyword-arguments passed by the
         URL route dispatcher to ``self.args`` and ``self.kwargs``, then it will
-        dispatch the request to the right method.
+        dispatch the request to the right method. When the method returns a
+        coroutine, it is run by :py:meth:`.View.run_coroutine`.
 
         """
         self.args = args
         self.kwargs = kwargs
-        return super(View, self).dispatch_request(*args, **kwargs)
+        response = super(View, self).dispatch_request(*args, **kwargs)
+
+        if iscoroutine(response):
+            return self.run_coroutine(response)
+
+        return response
+
+    def get_media_type(self):
+        """
+        Return the media type negotiated for the current request.
+
+        Views rendering a different media type depending on the ``Accept``
+        header override this, so the cached responses (see
+        :py:class:`.CachedResponseMixin`) are stored per media type.
+
+        :return:
+            A ``str``, or ``None`` (default) when the response is not
+            negotiated.
+
+        """
+        return None
+
+    def get_vary_args(self):
+        """
+        Return the URL parameters handled by the view itself.
+
+        Views changing the response depending on a URL parameter of their
+        own (Eg: a field selection) override this, so the cached responses
+        (see :py:class:`.CachedResponseMixin`) are stored per value.
+
+        :return:
+            A ``list`` of ``(name, value)`` tuples. By default an empty
+            ``list``.
+
+        """
+        return []
+
+    def run_coroutine(self, coroutine):
+        """
+        Run the coroutine returned by an ``async`` request method handler.
+
+        The coroutine is run by :py:meth:`!flask.Flask.ensure_sync`, so it
+        is handled like any other ``async`` view of the application (this
+        requires Flask 2.0 or higher with the ``async`` extra installed).
+        With older Flask versions, it is run to completion in a new event
+        loop. Override this method to run it in an event loop of your own.
+
+        :param coroutine:
+            The coroutine returned by the request method handler.
+
+        :return:
+            The value returned by the coroutine.
+
+        """
+        ensure_sync = getattr(current_app, 'ensure_sync', None)
+        if ensure_sync is not None:
+            from flask_views.aio import coroutine_function
+            return ensure_sync(coroutine_function(coroutine))()
+
+        import asyncio
+
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
 
 
 class TemplateResponseMixin(object):
@@ -52,6 +275,61 @@ class TemplateResponseMixin(object):
     Set this variable to the template you want to render.
     """
 
+    stream = False
+    """
+    Set this to ``True`` to stream the rendered template. The template is
+    rendered while the response is sent, so the client receives the first
+    part of the page (Eg: the header) before the rest is rendered. The
+    request context stays available while rendering.
+
+    .. note:: Errors raised while rendering can not change the status code
+        of a streamed response, since it has already been sent.
+
+    """
+
+    stream_buffer_size = 5
+    """
+    An ``int`` representing the number of template chunks which are buffered
+    before they are sent when streaming. Set this to ``0`` to send every
+    chunk immediately.
+    """
+
+    fragment_cache = None
+    """
+    Set this to a cache backend (see :py:mod:`flask_views.cache`) to make the
+    ``cache_fragment`` helper available in the template. The output of the
+    wrapped block is cached, so it is only rendered when it is not in the
+    cache. Example::
+
+        {% call cache_fragment('comments', article.comment_count) %}
+            {% for comment in article.comments %}...{% endfor %}
+        {% endcall %}
+
+    The cache key is generated out of the template name, the fragment name
+    and the other arguments. See
+    :py:meth:`~.TemplateResponseMixin.cache_fragment`.
+    """
+
+    fragment_cache_timeout = 300
+    """
+    An ``int`` representing the number of seconds a fragment is cached.
+    """
+
+    @classmethod
+    def get_configuration_errors(cls, concrete):
+        """
+        Return the configuration errors of the view class.
+
+        :return:
+            A ``list`` of error messages.
+
+        """
+        if concrete and cls.template_name is None and get_function(
+                cls.render_to_response) is get_function(
+                    TemplateResponseMixin.render_to_response):
+            return ['template_name is not set.']
+        return []
+
     def render_to_response(self, context_data={}):
         """
         Render template with the given context data.
@@ -60,11 +338,471 @@ class TemplateResponseMixin(object):
             A ``dict`` containing the context data. Optional.
 
         :return:
-            The rendered template as a string.
+            The rendered template as a string, or the output of
+            :py:meth:`~.TemplateResponseMixin.stream_template` when
+            :py:attr:`~.TemplateResponseMixin.stream` is ``True``.
 
         """
+        if self.fragment_cache is not None:
+            context_data = dict(
+                context_data, cache_fragment=self.cache_fragment)
+
+        if self.stream:
+            return self.stream_template(context_data)
         return render_template(self.template_name, **context_data)
 
+    def get_fragment_cache_key(self, name, vary):
+        """
+        Return the cache key for a template fragment.
+
+        :param name:
+            A ``str`` representing the name of the fragment.
+
+        :param vary:
+            A ``list`` of values the fragment depends on.
+
+        :return:
+            A ``str`` representing the cache key.
+
+        """
+        return u'flask_views.fragment:{0}:{1}:{2}'.format(
+            self.template_name,
+            name,
+            u'&'.join(u'{0}'.format(value) for value in vary),
+        )
+
+    def cache_fragment(self, name, *vary, **kwargs):
+        """
+        Return the cached output of a template block.
+
+        This is available as ``cache_fragment`` in the template context when
+        :py:attr:`~.TemplateResponseMixin.fragment_cache` is set, and must
+        be used with a ``{% call %}`` block.
+
+        :param name:
+            A ``str`` representing the name of the fragment.
+
+        :param vary:
+            The values the fragment depends on (Eg: a version number).
+
+        :return:
+            A :py:class:`!markupsafe.Markup` object containing the output of
+            the block.
+
+        """
+        cache_key = self.get_fragment_cache_key(name, list(vary))
+        value = self.fragment_cache.get(cache_key)
+
+        if value is None:
+            value = kwargs['caller']()
+            self.fragment_cache.set(
+                cache_key, value, self.fragment_cache_timeout)
+
+        return Markup(value)
+
+    def stream_template(self, context_data={}):
+        """
+        Render a streamed response of the template with the given context data.
+
+        :param context_data:
+            A ``dict`` containing the context data. Optional.
+
+        :return:
+            Output of :py:meth:`!flask.current_app.response_class` containing
+            the :py:class:`!jinja2.environment.TemplateStream`.
+
+        """
+        app = current_app._get_current_object()
+        context = dict(context_data)
+        app.update_template_context(context)
+
+        template_stream = app.jinja_env.get_or_select_template(
+            self.template_name).stream(context)
+        if self.stream_buffer_size:
+            template_stream.enable_buffering(self.stream_buffer_size)
+
+        return app.response_class(stream_with_context(template_stream))
+
+
+class ConditionalResponseMixin(object):
+    """
+    Mixin class for conditional GET requests.
+
+    This adds ``ETag`` and ``Last-Modified`` headers to the responses of
+    ``GET`` and ``HEAD`` requests. When the client already has the current
+    version (``If-None-Match`` or ``If-Modified-Since`` request header), a
+    ``304 Not Modified`` response is returned without dispatching the request
+    to the handler, so the response is never rendered.
+
+    Implement :py:meth:`~.ConditionalResponseMixin.get_etag` and / or
+    :py:meth:`~.ConditionalResponseMixin.get_last_modified` (or
+    :py:meth:`~.ConditionalResponseMixin.get_validators`). Example usage::
+
+        class IndexView(ConditionalResponseMixin, TemplateView):
+            template_name = 'index.html'
+
+            def get_last_modified(self):
+                return get_news_last_modified()
+
+    This class must be put before :py:class:`.View` in the list of base
+    classes.
+
+    """
+    def get_etag(self):
+        """
+        Return the ETag for the response.
+
+        :return:
+            A value which changes when the response changes (converted to
+            ``str``), or ``None``.
+
+        """
+        return None
+
+    def get_last_modified(self):
+        """
+        Return the last modification time of the response.
+
+        :return:
+            A ``datetime`` (naive datetimes are assumed to be UTC), or
+            ``None``.
+
+        """
+        return None
+
+    def get_validators(self):
+        """
+        Return the validators for the response.
+
+        Override this method when the ETag and last modification time are
+        retrieved at once.
+
+        :return:
+            A ``tuple`` containing the output of
+            :py:meth:`~.ConditionalResponseMixin.get_etag` and
+            :py:meth:`~.ConditionalResponseMixin.get_last_modified`.
+
+        """
+        return self.get_etag(), self.get_last_modified()
+
+    def is_not_modified(self, etag, last_modified):
+        """
+        Return if the client already has the current version.
+
+        When the request contains an ``If-None-Match`` header, only the ETag is
+        compared (using the weak comparison, as required for ``GET`` and
+        ``HEAD`` requests). Else the ``If-Modified-Since`` header is compared
+        with the last modification time.
+
+        :return:
+            ``True`` when a ``304 Not Modified`` response should be returned.
+
+        """
+        if request.if_none_match:
+            return etag is not None and request.if_none_match.contains_weak(
+                str(etag))
+
+        if request.if_modified_since and last_modified is not None:
+            return to_utc(last_modified).replace(microsecond=0) <= to_utc(
+                request.if_modified_since)
+
+        return False
+
+    def dispatch_request(self, *args, **kwargs):
+        """
+        Dispatch the request, unless the client has the current version.
+
+        :return:
+            A ``304 Not Modified`` response or the response of the handler,
+            including the ``ETag`` and ``Last-Modified`` headers.
+
+        """
+        if request.method not in ('GET', 'HEAD'):
+            return super(ConditionalResponseMixin, self).dispatch_request(
+                *args, **kwargs)
+
+        self.args = args
+        self.kwargs = kwargs
+        etag, last_modified = self.get_validators()
+
+        if self.is_not_modified(etag, last_modified):
+            response = current_app.response_class(status=304)
+        else:
+            response = make_response(
+                super(ConditionalResponseMixin, self).dispatch_request(
+                    *args, **kwargs))
+
+        if etag is not None:
+            response.set_etag(str(etag))
+        if last_modified is not None:
+            response.last_modified = last_modified
+
+        return response
+
+
+class CachedResponseMixin(object):
+    """
+    Mixin class for caching the rendered responses.
+
+    The complete responses of successful ``GET`` and ``HEAD`` requests are
+    stored in :py:attr:`~.CachedResponseMixin.response_cache`. As long as the
+    response is in the cache, the request is not dispatched to the handler,
+    so no context data is retrieved and no template is rendered. Example
+    usage::
+
+        class IndexView(CachedResponseMixin, TemplateView):
+            template_name = 'index.html'
+            response_cache_timeout = 60
+            response_cache_vary_headers = ['Accept-Language']
+
+    The cache key is generated out of the view class, the URL route
+    arguments, the URL parameters in
+    :py:attr:`~.CachedResponseMixin.response_cache_vary_args`, the request
+    headers in :py:attr:`~.CachedResponseMixin.response_cache_vary_headers`,
+    the URL parameters handled by the view (see
+    :py:meth:`.View.get_vary_args`), the negotiated media type (see
+    :py:meth:`.View.get_media_type`) and the
+    versions of the tags returned by
+    :py:meth:`~.CachedResponseMixin.get_response_cache_tags`. Use
+    :py:func:`flask_views.cache.invalidate_tag` to invalidate all the
+    responses depending on a tag.
+
+    Concurrent requests for a response which is not in the cache are
+    coalesced within a process: only one of them renders the response and
+    the others wait for it. When
+    :py:attr:`~.CachedResponseMixin.response_cache_stale_timeout` is set, an
+    expired response is returned for that many seconds while it is rendered
+    again in the background (stale-while-revalidate).
+
+    This class must be put before :py:class:`.View` in the list of base
+    classes.
+
+    .. warning:: Only use this for responses which are the same for all the
+        users (Eg: pages for anonymous users).
+
+    """
+    response_cache = LRUCache()
+    """
+    The cache backend in which the responses are stored. See
+    :py:mod:`flask_views.cache`.
+    """
+
+    response_cache_timeout = 300
+    """
+    An ``int`` representing the number of seconds a response is cached.
+    """
+
+    response_cache_stale_timeout = 0
+    """
+    An ``int`` representing the number of seconds an expired response is
+    still returned, while a single request renders it again in the
+    background. ``0`` (default) disables this.
+    """
+
+    response_single_flight = SingleFlight()
+    """
+    The :py:class:`~flask_views.cache.SingleFlight` instance coalescing the
+    concurrent renderings of the same response. Set this to ``None`` to
+    disable coalescing.
+    """
+
+    response_cache_vary_args = []
+    """
+    A ``list`` of URL parameters which change the response (Eg:
+    ``['sort']``).
+    """
+
+    response_cache_vary_headers = []
+    """
+    A ``list`` of request headers which change the response (Eg:
+    ``['Accept-Language']``).
+    """
+
+    def get_response_cache_tags(self):
+        """
+        Return the tags the response depends on.
+
+        :return:
+            A ``list`` of ``str`` objects. By default an empty ``list``.
+
+        """
+        return []
+
+    def get_response_cache_vary(self):
+        """
+        Return the request values which change the response.
+
+        :return:
+            A ``list`` of ``(name, value)`` tuples.
+
+        """
+        vary = sorted(self.kwargs.items())
+        vary.extend(
+            (name, request.args.get(name))
+            for name in self.response_cache_vary_args
+        )
+        vary.extend(
+            (name.lower(), request.headers.get(name))
+            for name in self.response_cache_vary_headers
+        )
+        vary.extend(self.get_vary_args())
+
+        media_type = self.get_media_type()
+        if media_type is not None:
+            vary.append(('media_type', media_type))
+        return vary
+
+    def get_response_cache_key(self):
+        """
+        Return the cache key for the current request.
+
+        :return:
+            A ``str`` representing the cache key.
+
+        """
+        vary = self.get_response_cache_vary()
+        vary.extend(
+            (u'tag:{0}'.format(tag),
+                get_tag_version(self.response_cache, tag))
+            for tag in self.get_response_cache_tags()
+        )
+
+        return u'flask_views.response:{0}.{1}:{2}'.format(
+            self.__class__.__module__,
+            self.__class__.__name__,
+            u'&'.join(u'{0}={1}'.format(key, value) for key, value in vary),
+        )
+
+    def is_response_cacheable(self, response):
+        """
+        Return if the given response can be stored in the cache.
+
+        :return:
+            ``True`` for non-streamed ``200 OK`` responses which do not set
+            cookies, else ``False``.
+
+        """
+        return (
+            response.status_code == 200 and
+            not response.is_streamed and
+            'Set-Cookie' not in response.headers
+        )
+
+    def build_response(self, cache_key):
+        """
+        Dispatch the request and store the response in the cache.
+
+        :param cache_key:
+            The cache key for the current request.
+
+        :return:
+            A ``tuple`` containing the response and the cache entry (``None``
+            when the response is not cacheable).
+
+        """
+        response = make_response(
+            super(CachedResponseMixin, self).dispatch_request(
+                *self.args, **self.kwargs))
+
+        if not self.is_response_cacheable(response):
+            return response, None
+
+        timeout = self.response_cache_timeout
+        entry = (
+            response.get_data(),
+            response.status_code,
+            list(response.headers.items()),
+            time() + timeout if timeout else None,
+        )
+        self.response_cache.set(
+            cache_key,
+            entry,
+            timeout + self.response_cache_stale_timeout if timeout else 0,
+        )
+        return response, entry
+
+    def revalidate_response(self, cache_key):
+        """
+        Render the expired response for ``cache_key`` in the background.
+
+        The response is rendered in a new thread with a copy of the request
+        context, unless it is already being rendered. The response is claimed
+        atomically in
+        :py:attr:`~.CachedResponseMixin.response_single_flight`, so
+        concurrent requests for it wait for the result. When rendering
+        fails, the expired response is removed from the cache. Override this
+        method to render it in a task queue of your own.
+
+        :param cache_key:
+            The cache key for the current request.
+
+        """
+        single_flight = self.response_single_flight
+        if single_flight is not None and not single_flight.claim(cache_key):
+            return
+
+        def revalidate():
+            result = []
+            try:
+                result.append(self.build_response(cache_key))
+            except Exception:
+                self.response_cache.delete(cache_key)
+                current_app.logger.exception(
+                    'Revalidating cached response failed')
+            finally:
+                if single_flight is not None:
+                    single_flight.release(cache_key, *result)
+
+        try:
+            thread = threading.Thread(
+                target=copy_current_request_context(revalidate))
+            thread.daemon = True
+            thread.start()
+        except Exception:
+            if single_flight is not None:
+                single_flight.release(cache_key)
+            raise
+
+    def dispatch_request(self, *args, **kwargs):
+        """
+        Return the cached response, or dispatch the request and cache it.
+
+        :return:
+            An instance of the response class.
+
+        """
+        if self.response_cache is None or request.method not in (
+                'GET', 'HEAD'):
+            return super(CachedResponseMixin, self).dispatch_request(
+                *args, **kwargs)
+
+        self.args = args
+        self.kwargs = kwargs
+        cache_key = self.get_response_cache_key()
+        cached = self.response_cache.get(cache_key)
+
+        if cached is not None:
+            data, status, headers, fresh_until = cached
+            if fresh_until is not None and fresh_until <= time():
+                self.revalidate_response(cache_key)
+            return current_app.response_class(
+                data, status=status, headers=headers)
+
+        if self.response_single_flight is None:
+            return self.build_response(cache_key)[0]
+
+        (response, entry), coalesced = self.response_single_flight.do(
+            cache_key, lambda: self.build_response(cache_key))
+
+        if not coalesced:
+            return response
+
+        if entry is None:
+            return self.build_response(cache_key)[0]
+
+        data, status, headers, fresh_until = entry
+        return current_app.response_class(data, status=status, headers=headers)
+
 
 class TemplateView(TemplateResponseMixin, View):
     """
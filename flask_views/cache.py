@@ -0,0 +1,342 @@
+"""
+Cache backends used by the views.
+
+The backends implement the same interface as the Werkzeug cache classes
+(``get``, ``set``, ``delete`` and ``clear``), so an instance of one of the
+:py:mod:`!werkzeug.contrib.cache` classes can be used as well.
+
+"""
+import errno
+import os
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from hashlib import md5
+from time import time
+
+try:
+    import cPickle as pickle
+except ImportError:  # Python 3
+    import pickle
+
+
+_missing = object()
+
+
+def get_tag_version(cache, tag):
+    """
+    Return the current version of ``tag``.
+
+    The version can be made part of the cache keys of the items depending on
+    ``tag``, so that these items can be invalidated at once by
+    :py:func:`.invalidate_tag`, without knowing their keys.
+
+    :param cache:
+        The cache backend in which the version is stored.
+
+    :param tag:
+        A ``str`` identifying a group of items.
+
+    :return:
+        A ``str`` representing the version.
+
+    """
+    key = u'flask_views.tag:{0}'.format(tag)
+    version = cache.get(key)
+
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(key, version, timeout=0)
+
+    return version
+
+
+def invalidate_tag(cache, tag):
+    """
+    Invalidate all the items depending on ``tag``.
+
+    :param cache:
+        The cache backend in which the version is stored.
+
+    :param tag:
+        A ``str`` identifying a group of items.
+
+    """
+    cache.set(u'flask_views.tag:{0}'.format(tag), uuid.uuid4().hex, timeout=0)
+
+
+class SingleFlight(object):
+    """
+    Coalesce concurrent calls for the same key within a process.
+
+    While a function is running for a key, other threads calling
+    :py:meth:`~.SingleFlight.do` with the same key wait for it to finish and
+    receive its result, instead of running the function themselves. Example
+    usage::
+
+        single_flight = SingleFlight()
+        value, coalesced = single_flight.do('key', expensive_function)
+
+    :param timeout:
+        The number of seconds a thread waits for the result of another
+        thread, before it runs the function itself. ``None`` waits without
+        timeout.
+
+    """
+    def __init__(self, timeout=30):
+        self.timeout = timeout
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def is_running(self, key):
+        """
+        Return if a function is running for ``key``.
+        """
+        with self._lock:
+            return key in self._calls
+
+    def _claim(self, key):
+        """
+        Return the call for ``key`` and if it has been claimed by the caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                return call, False
+            call = self._calls[key] = {'event': threading.Event()}
+            return call, True
+
+    def claim(self, key):
+        """
+        Claim ``key`` for a call which is made by the caller.
+
+        Checking and claiming the key is atomic, so only one thread claims
+        it. The caller must call :py:meth:`~.SingleFlight.release` when the
+        call has finished (Eg: in a background thread). In the meantime,
+        :py:meth:`~.SingleFlight.do` waits for its result.
+
+        :return:
+            ``True`` when the key has been claimed, ``False`` when a call is
+            already running for ``key``.
+
+        """
+        return self._claim(key)[1]
+
+    def release(self, key, value=_missing):
+        """
+        Release ``key`` after the call has finished.
+
+        :param value:
+            The result of the call, which is returned to the waiting threads.
+            When not given (Eg: the call failed), the waiting threads run the
+            function themselves.
+
+        """
+        with self._lock:
+            call = self._calls.pop(key)
+
+        if value is not _missing:
+            call['value'] = value
+        call['event'].set()
+
+    def do(self, key, func):
+        """
+        Run ``func``, unless it is already running for ``key``.
+
+        When the function running in the other thread raises an exception,
+        or does not finish within :py:attr:`~.SingleFlight.timeout` seconds,
+        ``func`` is run in the current thread.
+
+        :param key:
+            The key identifying the call.
+
+        :param func:
+            A function without arguments.
+
+        :return:
+            A ``tuple`` containing the value returned by the function and
+            ``True`` when this value was returned to another thread as well
+            (the current thread waited for it), else ``False``.
+
+        """
+        call, leader = self._claim(key)
+
+        if not leader:
+            if call['event'].wait(self.timeout) and 'value' in call:
+                return call['value'], True
+            return func(), False
+
+        value = _missing
+        try:
+            value = func()
+        finally:
+            self.release(key, value)
+
+        return value, False
+
+
+class BaseCache(object):
+    """
+    Base class for cache backends.
+
+    :param default_timeout:
+        The timeout (in seconds) used when no timeout is given to
+        :py:meth:`~.BaseCache.set`. ``0`` means that the items never expire.
+
+    """
+    def __init__(self, default_timeout=300):
+        self.default_timeout = default_timeout
+
+    def get(self, key):
+        """
+        Return the value stored under ``key``, or ``None``.
+        """
+        return None
+
+    def set(self, key, value, timeout=None):
+        """
+        Store ``value`` under ``key`` for ``timeout`` seconds.
+        """
+
+    def delete(self, key):
+        """
+        Remove ``key`` from the cache.
+        """
+
+    def clear(self):
+        """
+        Remove all the items from the cache.
+        """
+
+    def get_expires(self, timeout):
+        """
+        Return the expiration timestamp for the given timeout.
+
+        :return:
+            A ``float`` or ``None`` when the item should never expire.
+
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+        if not timeout:
+            return None
+        return time() + timeout
+
+
+class LRUCache(BaseCache):
+    """
+    In-process cache with a maximum number of items.
+
+    When the cache is full, the least recently used item is removed. This
+    cache is thread-safe, but is not shared between processes.
+
+    :param max_entries:
+        The maximum number of items in the cache.
+
+    :param default_timeout:
+        See :py:class:`.BaseCache`.
+
+    """
+    def __init__(self, max_entries=1000, default_timeout=300):
+        super(LRUCache, self).__init__(default_timeout)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                expires, value = self._entries.pop(key)
+            except KeyError:
+                return None
+
+            if expires is not None and expires <= time():
+                return None
+
+            self._entries[key] = (expires, value)
+            return value
+
+    def set(self, key, value, timeout=None):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (self.get_expires(timeout), value)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class FileSystemCache(BaseCache):
+    """
+    Cache storing the items as files in a local directory.
+
+    The items are pickled, so they are shared between the processes (and
+    survive restarts) on the same host.
+
+    :param cache_dir:
+        The directory in which the items are stored. It will be created if it
+        does not exist.
+
+    :param default_timeout:
+        See :py:class:`.BaseCache`.
+
+    """
+    def __init__(self, cache_dir, default_timeout=300):
+        super(FileSystemCache, self).__init__(default_timeout)
+        self.cache_dir = cache_dir
+
+        try:
+            os.makedirs(cache_dir)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+    def get_filename(self, key):
+        """
+        Return the path of the file in which ``key`` is stored.
+        """
+        if not isinstance(key, bytes):
+            key = key.encode('utf-8')
+        return os.path.join(self.cache_dir, md5(key).hexdigest())
+
+    def get(self, key):
+        filename = self.get_filename(key)
+        try:
+            with open(filename, 'rb') as f:
+                expires, value = pickle.load(f)
+        except (IOError, OSError, EOFError, pickle.PickleError):
+            return None
+
+        if expires is not None and expires <= time():
+            self.delete(key)
+            return None
+
+        return value
+
+    def set(self, key, value, timeout=None):
+        fd, tmp_filename = tempfile.mkstemp(dir=self.cache_dir)
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(
+                (self.get_expires(timeout), value), f, pickle.HIGHEST_PROTOCOL)
+        os.rename(tmp_filename, self.get_filename(key))
+
+    def delete(self, key):
+        try:
+            os.remove(self.get_filename(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        for filename in os.listdir(self.cache_dir):
+            try:
+                os.remove(os.path.join(self.cache_dir, filename))
+            except OSError:
+                pass
@@ -0,0 +1,102 @@
+"""
+Async variants of the Mongoengine views.
+
+Mongoengine itself is blocking, therefore the database queries are run in the
+default executor of the event loop by :py:func:`flask_views.aio.run_sync`.
+
+.. note:: This module requires Python 3.7 or higher.
+
+"""
+from __future__ import absolute_import
+
+from flask_views.aio import run_sync
+from flask_views.base import TemplateResponseMixin
+from flask_views.db.mongoengine.detail import BaseDetailView
+from flask_views.db.mongoengine.list import BaseListView
+
+
+class AsyncBaseDetailView(BaseDetailView):
+    """
+    Async base detail view.
+
+    This class inherits from:
+
+    * :py:class:`.BaseDetailView`
+
+    """
+    async def get(self, *args, **kwargs):
+        """
+        Handler for GET requests.
+
+        The object is retrieved in the executor, so the event loop is not
+        blocked while waiting for the database.
+
+        :return:
+            Ouput of ``render_to_response`` method implementation.
+
+        """
+        self.object = await run_sync(self.get_object)
+        return self.render_to_response(self.get_context_data())
+
+
+class AsyncDetailView(TemplateResponseMixin, AsyncBaseDetailView):
+    """
+    Async detail view for rendering an object.
+
+    This class inherits from:
+
+    * :py:class:`.TemplateResponseMixin`
+    * :py:class:`.AsyncBaseDetailView`
+
+    """
+
+
+class AsyncBaseListView(BaseListView):
+    """
+    Async base list view.
+
+    This class inherits from:
+
+    * :py:class:`.BaseListView`
+
+    """
+    def get_paginated_object_list(self):
+        """
+        Return paginated list of objects.
+
+        The ``QuerySet`` is evaluated, so that no queries are performed
+        while rendering the response.
+
+        :return:
+            A ``list`` of objects.
+
+        """
+        return list(
+            super(AsyncBaseListView, self).get_paginated_object_list())
+
+    async def get(self, *args, **kwargs):
+        """
+        Handler for GET requests.
+
+        The context data (and thus the list of objects) is retrieved in the
+        executor, so the event loop is not blocked while waiting for the
+        database.
+
+        :return:
+            Ouput of ``render_to_response`` method implementation.
+
+        """
+        context_data = await run_sync(self.get_context_data)
+        return self.render_to_response(context_data)
+
+
+class AsyncListView(TemplateResponseMixin, AsyncBaseListView):
+    """
+    Async list view for rendering a list of objects.
+
+    This class inherits from:
+
+    * :py:class:`.TemplateResponseMixin`
+    * :py:class:`.AsyncBaseListView`
+
+    """
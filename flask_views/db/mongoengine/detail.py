@@ -1,6 +1,81 @@
-from flask import abort
+from datetime import datetime
+from hashlib import md5
 
-from flask_views.base import View, TemplateResponseMixin
+from bson import json_util
+from flask import abort, request
+
+from flask_views.base import (
+    CachedResponseMixin,
+    ConditionalResponseMixin,
+    TemplateResponseMixin,
+    View,
+    memoize,
+)
+from flask_views.cache import get_tag_version, invalidate_tag
+
+
+def get_document_tag(document_class):
+    """
+    Return the cache tag for the given document class.
+
+    :return:
+        A ``str`` containing the module and name of the document class.
+
+    """
+    return u'{0}.{1}'.format(
+        document_class.__module__, document_class.__name__)
+
+
+def get_object_tag(document_class, pk):
+    """
+    Return the cache tag for the object with the given primary key.
+
+    :return:
+        A ``str`` containing the tag of the document class and the primary
+        key.
+
+    """
+    return u'{0}:{1}'.format(get_document_tag(document_class), pk)
+
+
+def invalidate_document_tag(cache, document_class):
+    """
+    Invalidate the cached items depending on the given document class.
+
+    :param cache:
+        The cache backend in which the version of the tag is stored, or
+        ``None``.
+
+    :param document_class:
+        The document class, or ``None``.
+
+    """
+    if cache is None or document_class is None:
+        return
+
+    invalidate_tag(cache, get_document_tag(document_class))
+
+
+def invalidate_object_tags(cache, document_class, pks):
+    """
+    Invalidate the cached items depending on the given objects.
+
+    :param cache:
+        The cache backend in which the versions of the tags are stored, or
+        ``None``.
+
+    :param document_class:
+        The document class of the objects.
+
+    :param pks:
+        An iterable of the primary keys of the objects.
+
+    """
+    if cache is None:
+        return
+
+    for pk in pks:
+        invalidate_tag(cache, get_object_tag(document_class, pk))
 
 
 class SingleObjectMixin(object):
@@ -40,6 +115,119 @@ class SingleObjectMixin(object):
     available as ``page``).
 
     """
+
+    only_fields = None
+    """
+    A ``list`` of fieldnames to retrieve from the database. When ``None``
+    (default), all the fields are retrieved. Example::
+
+        only_fields = ['title', 'slug', 'author']
+
+    """
+
+    exclude_fields = None
+    """
+    A ``list`` of fieldnames which should not be retrieved from the database
+    (Eg: large embedded documents which are not displayed).
+    """
+
+    object_cache = None
+    """
+    Set this to a cache backend (see :py:mod:`flask_views.cache`) to cache
+    the retrieved objects. The cache key is generated out of the document
+    class and the query for the object (the ``QuerySet`` returned by
+    :py:meth:`~.SingleObjectMixin.get_queryset` filtered by the lookup
+    arguments). Example::
+
+        object_cache = LRUCache(max_entries=10000)
+
+    Every cached object is stored with the version of the tag of its primary
+    key (see :py:func:`.get_object_tag`), so it is invalidated by its
+    primary key, whatever the lookup. Cached objects are invalidated when
+    they are saved by
+    :py:class:`~flask_views.db.mongoengine.edit.ModelFormMixin` or deleted by
+    :py:class:`~flask_views.db.mongoengine.edit.DeletionMixin`. Changes made
+    by other code are visible after
+    :py:attr:`~.SingleObjectMixin.object_cache_timeout` seconds.
+
+    .. note:: The object cache is not used when only a part of the fields is
+        retrieved (see :py:attr:`~.SingleObjectMixin.only_fields` and
+        :py:attr:`~.SingleObjectMixin.exclude_fields`). See
+        :py:meth:`~.SingleObjectMixin.use_object_cache`.
+
+    """
+
+    object_cache_timeout = 300
+    """
+    An ``int`` representing the number of seconds an object is cached.
+    """
+
+    not_found_cache = None
+    """
+    Set this to a cache backend (see :py:mod:`flask_views.cache`) to
+    remember lookups that did not match any object. Repeated requests for the
+    same non-existing object are then answered with a 404 without querying
+    the database.
+
+    Entries are invalidated when an object of the document class is saved
+    by :py:class:`~flask_views.db.mongoengine.edit.ModelFormMixin`.
+
+    """
+
+    not_found_cache_timeout = 30
+    """
+    An ``int`` representing the number of seconds a lookup without result is
+    remembered. Keep this short, since objects created by other code are only
+    visible after this timeout.
+    """
+
+    version_field = None
+    """
+    The name of a field which changes every time the object is saved (Eg: an
+    incrementing version number or a last modified timestamp). This is
+    required by features which need to know if an object has been changed,
+    like the encoded response cache of
+    :py:class:`~flask_views.db.mongoengine.json.JSONDetailView`.
+    """
+
+    version_argument = 'version'
+    """
+    A ``str`` representing the form field or URL parameter containing the
+    version of the object the client has loaded. When not given, the
+    ``If-Match`` request header is used. See
+    :py:meth:`~.SingleObjectMixin.get_client_version`.
+    """
+
+    response_cache = CachedResponseMixin.response_cache
+    """
+    The cache backend of the cached responses depending on the document class
+    (see :py:class:`.CachedDetailMixin` and
+    :py:class:`~flask_views.db.mongoengine.list.CachedListMixin`). These
+    responses are invalidated when an object is saved by
+    :py:class:`~flask_views.db.mongoengine.edit.ModelFormMixin` or deleted by
+    :py:class:`~flask_views.db.mongoengine.edit.DeletionMixin`. When you
+    change :py:attr:`.CachedResponseMixin.response_cache`, set this to the
+    same backend in the edit views.
+    """
+
+    @classmethod
+    def get_configuration_errors(cls, concrete):
+        """
+        Return the configuration errors of the view class.
+
+        :return:
+            A ``list`` of error messages.
+
+        """
+        errors = []
+
+        if not isinstance(cls.get_fields, dict):
+            errors.append('get_fields must be a dict.')
+        if concrete and cls.document_class is None:
+            errors.append('document_class is not set.')
+
+        return errors
+
     def get_context_object_name(self):
         """
         Return the context object name.
@@ -57,20 +245,192 @@ class SingleObjectMixin(object):
 
         return self.document_class.__name__.lower()
 
+    @memoize
+    def get_only_fields(self):
+        """
+        Return the fieldnames to retrieve from the database.
+
+        :return:
+            :py:attr:`~.SingleObjectMixin.only_fields`.
+
+        """
+        return self.only_fields
+
     def get_queryset(self):
         """
         Return ``QuerySet`` class used to retrieve objects.
 
+        The fields configured by :py:meth:`~.SingleObjectMixin.get_only_fields`
+        and :py:attr:`~.SingleObjectMixin.exclude_fields` are applied.
+
         :return:
             An instance of :py:class:`!mongoengine.queryset.QuerySet`.
 
         """
-        return self.document_class.objects
+        queryset = self.document_class.objects
+        only_fields = self.get_only_fields()
+
+        if only_fields:
+            queryset = queryset.only(*only_fields)
+        if self.exclude_fields:
+            queryset = queryset.exclude(*self.exclude_fields)
+
+        return queryset
+
+    @memoize
+    def get_lookup_args(self):
+        """
+        Return the arguments for retrieving the object.
+
+        For generating this dictionary, the configuration in
+        :py:attr:`~.SingleObjectMixin.get_fields` is used.
+
+        :return:
+            A ``dict`` with as the key the fieldname and as value the value to
+            lookup.
+
+        """
+        lookup_args = {}
+
+        for field_name, mapping_name in self.get_fields.items():
+            lookup_args[field_name] = self.kwargs.get(mapping_name, None)
+
+        return lookup_args
+
+    def get_object_cache_key(self, lookup_args):
+        """
+        Return the cache key for the given lookup arguments.
+
+        :param lookup_args:
+            A ``dict`` as returned by
+            :py:meth:`~.SingleObjectMixin.get_lookup_args`.
+
+        :return:
+            A ``str`` generated out of the document class and the query of
+            the ``QuerySet`` returned by
+            :py:meth:`~.SingleObjectMixin.get_queryset` filtered by
+            ``lookup_args``, so views restricting the ``QuerySet`` do not
+            share objects.
+
+        """
+        query = json_util.dumps(
+            self.get_queryset().filter(**lookup_args)._query, sort_keys=True)
+        return u'flask_views.object:{0}:{1}'.format(
+            get_document_tag(self.document_class),
+            md5(query.encode('utf-8')).hexdigest(),
+        )
+
+    def invalidate_object_cache(self, obj=None):
+        """
+        Invalidate the cached object, for all the lookups matching it.
+
+        :param obj:
+            An instance of the document class. Defaults to ``self.object``.
+
+        """
+        if obj is None:
+            obj = self.object
+
+        invalidate_object_tags(
+            self.object_cache, self.document_class, [obj.pk])
+
+    def get_not_found_cache_key(self, lookup_args):
+        """
+        Return the not-found cache key for the given lookup arguments.
+
+        :param lookup_args:
+            A ``dict`` as returned by
+            :py:meth:`~.SingleObjectMixin.get_lookup_args`.
+
+        :return:
+            A ``str`` generated out of the object cache key (see
+            :py:meth:`~.SingleObjectMixin.get_object_cache_key`) and the
+            version of the tag of the document class.
+
+        """
+        return u'{0}:not_found:{1}'.format(
+            self.get_object_cache_key(lookup_args),
+            get_tag_version(
+                self.not_found_cache, get_document_tag(self.document_class)),
+        )
+
+    def abort_if_not_found_cached(self, lookup_args):
+        """
+        Abort when the lookup did not match an object before.
+
+        :param lookup_args:
+            A ``dict`` as returned by
+            :py:meth:`~.SingleObjectMixin.get_lookup_args`.
+
+        :raise:
+            :py:exc:`!werkzeug.exceptions.NotFound` when the lookup is in
+            the :py:attr:`~.SingleObjectMixin.not_found_cache`.
+
+        """
+        if self.not_found_cache is not None and self.not_found_cache.get(
+                self.get_not_found_cache_key(lookup_args)):
+            abort(404)
+
+    def abort_not_found(self, lookup_args):
+        """
+        Store the lookup in the not-found cache and abort.
+
+        :param lookup_args:
+            A ``dict`` as returned by
+            :py:meth:`~.SingleObjectMixin.get_lookup_args`.
+
+        :raise:
+            :py:exc:`!werkzeug.exceptions.NotFound`.
+
+        """
+        if self.not_found_cache is not None:
+            self.not_found_cache.set(
+                self.get_not_found_cache_key(lookup_args),
+                True,
+                timeout=self.not_found_cache_timeout,
+            )
+        abort(404)
+
+    def invalidate_not_found_cache(self):
+        """
+        Invalidate the not-found lookups of the document class.
+
+        A saved object could match any lookup of any view (the lookups are
+        cached by query), so all the lookups of the document class are
+        invalidated.
+
+        """
+        invalidate_document_tag(self.not_found_cache, self.document_class)
+
+    def invalidate_response_cache(self):
+        """
+        Invalidate the cached responses depending on the document class.
+        """
+        invalidate_document_tag(self.response_cache, self.document_class)
+
+    def use_object_cache(self):
+        """
+        Return if the object cache should be used for this request.
+
+        :return:
+            ``True`` when :py:attr:`~.SingleObjectMixin.object_cache` is set
+            and all the fields of the object are retrieved, else ``False``.
+
+        """
+        if self.object_cache is None:
+            return False
+
+        return not (self.get_only_fields() or self.exclude_fields)
 
     def get_object(self):
         """
         Retrieve the object from the database.
 
+        When :py:attr:`~.SingleObjectMixin.object_cache` is set, the object
+        is retrieved from the cache if available. When
+        :py:attr:`~.SingleObjectMixin.not_found_cache` is set and the lookup
+        did not match an object before, the database is not queried.
+
         :return:
             An instance of the model class containing the retrieved object.
 
@@ -79,15 +439,128 @@ class SingleObjectMixin(object):
             exist.
 
         """
-        lookup_args = {}
+        lookup_args = self.get_lookup_args()
+        object_cache = self.object_cache if self.use_object_cache() else None
 
-        for field_name, mapping_name in self.get_fields.items():
-            lookup_args[field_name] = self.kwargs.get(mapping_name, None)
+        if object_cache is not None:
+            cache_key = self.get_object_cache_key(lookup_args)
+            entry = object_cache.get(cache_key)
+            if entry is not None:
+                pk, version, son = entry
+                if version == get_tag_version(
+                        object_cache, get_object_tag(self.document_class, pk)):
+                    return self.document_class._from_son(son)
+
+        self.abort_if_not_found_cached(lookup_args)
 
         try:
-            return self.get_queryset().get(**lookup_args)
+            obj = self.get_queryset().get(**lookup_args)
         except self.document_class.DoesNotExist:
-            abort(404)
+            self.abort_not_found(lookup_args)
+
+        if object_cache is not None:
+            version = get_tag_version(
+                object_cache, get_object_tag(self.document_class, obj.pk))
+            object_cache.set(
+                cache_key,
+                (obj.pk, version, obj.to_mongo()),
+                timeout=self.object_cache_timeout,
+            )
+
+        return obj
+
+    def get_client_version(self):
+        """
+        Return the version of the object the client has loaded.
+
+        :return:
+            The value of the :py:attr:`~.SingleObjectMixin.version_field`
+            sent by the client, or ``None``.
+
+        """
+        value = request.form.get(
+            self.version_argument, request.args.get(self.version_argument))
+
+        if not value and request.if_match:
+            value = next(iter(request.if_match), None)
+
+        if not value:
+            return None
+
+        return self.document_class._fields[self.version_field].to_python(
+            value)
+
+    def get_next_version(self, version):
+        """
+        Return the version following the given version.
+
+        :return:
+            The current UTC time when ``version`` is a ``datetime``, else
+            ``version`` incremented by one.
+
+        """
+        if isinstance(version, datetime):
+            return datetime.utcnow()
+        return (version or 0) + 1
+
+    def get_raw_query(self, field_values):
+        """
+        Return a raw (PyMongo) query matching the given field values.
+
+        :param field_values:
+            A ``dict`` containing the field names mapped against the values.
+
+        :return:
+            A ``dict`` containing the database field names mapped against the
+            converted values.
+
+        """
+        document_fields = self.document_class._fields
+        return dict(
+            (document_fields[field_name].db_field,
+                document_fields[field_name].to_mongo(value))
+            for field_name, value in field_values.items()
+        )
+
+    def get_object_values(self, *field_names):
+        """
+        Return the values of the given fields of the object.
+
+        When the object cache is used, the values are read from the (cached)
+        object, which is then set as ``self.object``. Else only the given
+        fields are retrieved from the database, which is a lot cheaper than
+        retrieving the whole object. The not-found cache is used in both
+        cases.
+
+        :param field_names:
+            The names of the fields.
+
+        :return:
+            A ``list`` containing the values in the order of
+            ``field_names``.
+
+        :raise:
+            :py:exc:`!werkzeug.exceptions.NotFound` when the document does not
+            exist.
+
+        """
+        if self.use_object_cache():
+            self.object = self.get_object()
+            return [getattr(self.object, name) for name in field_names]
+
+        lookup_args = self.get_lookup_args()
+        self.abort_if_not_found_cached(lookup_args)
+
+        queryset = self.get_queryset().filter(**lookup_args)
+        db_fields = [
+            self.document_class._fields[name].db_field for name in field_names]
+        son = queryset._collection.find_one(
+            queryset._query, dict((db_field, 1) for db_field in db_fields))
+
+        if son is None:
+            self.abort_not_found(lookup_args)
+
+        return [son.get(db_field) for db_field in db_fields]
 
     def get_context_data(self, **kwargs):
         """
@@ -101,6 +574,87 @@ class SingleObjectMixin(object):
         return kwargs
 
 
+class ConditionalDetailMixin(ConditionalResponseMixin):
+    """
+    Mixin for conditional GET requests for a single object.
+
+    This class inherits from:
+
+    * :py:class:`.ConditionalResponseMixin`
+
+    The ETag is the value of the
+    :py:attr:`~.SingleObjectMixin.version_field` and the last modification
+    time is the value of the
+    :py:attr:`~.ConditionalDetailMixin.last_modified_field` of the object.
+    Both are retrieved with a single query for only these fields, so the
+    object itself is not retrieved when a ``304 Not Modified`` response is
+    returned. Example usage::
+
+        class ArticleView(ConditionalDetailMixin, DetailView):
+            document_class = Article
+            template_name = 'article_detail.html'
+            version_field = 'version'
+            last_modified_field = 'updated_at'
+
+    """
+    last_modified_field = None
+    """
+    The name of the ``DateTimeField`` containing the last modification time
+    of the object.
+    """
+
+    def get_validators(self):
+        """
+        Return the validators for the response.
+
+        :return:
+            A ``tuple`` containing the version and the last modification time
+            of the object (``None`` when the field is not configured).
+
+        """
+        field_names = [
+            field_name for field_name in (
+                self.version_field, self.last_modified_field)
+            if field_name
+        ]
+
+        if not field_names:
+            return None, None
+
+        values = dict(zip(field_names, self.get_object_values(*field_names)))
+        return (
+            values.get(self.version_field),
+            values.get(self.last_modified_field),
+        )
+
+
+class CachedDetailMixin(CachedResponseMixin):
+    """
+    Mixin for caching the rendered responses for a single object.
+
+    This class inherits from:
+
+    * :py:class:`.CachedResponseMixin`
+
+    The cached responses are invalidated when an object of the document class
+    is saved or deleted by the edit views. Example usage::
+
+        class ArticleView(CachedDetailMixin, DetailView):
+            document_class = Article
+            template_name = 'article_detail.html'
+
+    """
+    def get_response_cache_tags(self):
+        """
+        Return the tags the response depends on.
+
+        :return:
+            A ``list`` containing the tag of the document class.
+
+        """
+        return [get_document_tag(self.document_class)]
+
+
 class BaseDetailView(SingleObjectMixin, View):
     """
     Base detail view.
@@ -153,4 +707,29 @@ class DetailView(TemplateResponseMixin, BaseDetailView):
             document_class = Article
             template_name = 'article_detail.html'
 
+    When :py:attr:`~.TemplateResponseMixin.fragment_cache` is set, the keys
+    of the cached fragments contain the context object name, the id and the
+    value of the :py:attr:`~.SingleObjectMixin.version_field` of the object,
+    so the fragments are rendered again when the object has been changed::
+
+        {% call cache_fragment('body') %}
+            {{ article.body|markdown }}
+        {% endcall %}
+
     """
+    def get_fragment_cache_key(self, name, vary):
+        """
+        Return the cache key for a template fragment.
+
+        :return:
+            Output of :py:meth:`.TemplateResponseMixin.get_fragment_cache_key`
+            with the context object name, the id and the version of the
+            object added to ``vary``.
+
+        """
+        object_vary = [self.get_context_object_name(), self.object.pk]
+        if self.version_field:
+            object_vary.append(getattr(self.object, self.version_field))
+
+        return super(DetailView, self).get_fragment_cache_key(
+            name, object_vary + vary)
@@ -1,7 +1,20 @@
-from flask import redirect
+import re
+
+from flask import abort, redirect, request
+from mongoengine.errors import SaveConditionError, ValidationError
+from pymongo import InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
+from werkzeug.datastructures import MultiDict
 
 from flask_views.base import TemplateResponseMixin, View
-from flask_views.db.mongoengine.detail import BaseDetailView, SingleObjectMixin
+from flask_views.db.mongoengine.detail import (
+    BaseDetailView,
+    SingleObjectMixin,
+    invalidate_document_tag,
+    invalidate_object_tags,
+)
+from flask_views.db.mongoengine.json import JSONResponseMixin
+from flask_views.db.mongoengine.list import MultipleObjectMixin
 from flask_views.edit import FormMixin, ProcessFormMixin
 
 
@@ -15,6 +28,109 @@ class ModelFormMixin(FormMixin, SingleObjectMixin):
     * :py:class:`.SingleObjectMixin`
 
     """
+    partial_update = False
+    """
+    Set this to ``True`` to update only the changed fields of an existing
+    object, instead of saving the complete object. The form fields are
+    compared with the object and the changed ones are written with a single
+    ``$set`` / ``$unset`` update (only these fields are validated). When
+    nothing has been changed, the database is not updated at all.
+
+    .. note:: The ``save`` signals and ``clean`` method of the document are
+        not called in this mode.
+
+    """
+
+    optimistic_locking = False
+    """
+    Set this to ``True`` to reject updates of objects which have been changed
+    since the client loaded them. The object is only updated when its
+    :py:attr:`~.SingleObjectMixin.version_field` still matches the version
+    sent by the client (see
+    :py:meth:`~.SingleObjectMixin.get_client_version`), and the version is
+    set to the next version (see
+    :py:meth:`~.SingleObjectMixin.get_next_version`) with the same write.
+    Add the version as hidden field to the form. A conflict is handled by
+    :py:meth:`~.ModelFormMixin.handle_conflict`.
+    """
+
+    conflict_message = None
+    """
+    The error message added to the version form field on a conflict. When
+    ``None`` (default), a conflict results in a ``409 Conflict`` response.
+    """
+
+    count_cache = MultipleObjectMixin.count_cache
+    """
+    The cache backend of the cached counts of the list views. See
+    :py:attr:`.MultipleObjectMixin.count_cache`.
+    """
+
+    @classmethod
+    def get_configuration_errors(cls, concrete):
+        """
+        Return the configuration errors of the view class.
+
+        :return:
+            A ``list`` of error messages.
+
+        """
+        if cls.optimistic_locking and not cls.version_field:
+            return ['optimistic_locking requires version_field to be set.']
+        return []
+
+    def handle_conflict(self, form):
+        """
+        Handle an update of an object which has been changed by someone else.
+
+        When :py:attr:`~.ModelFormMixin.conflict_message` is set and the form
+        contains the version field, the message is added to the errors of
+        this field and the form is shown again.
+
+        :raise:
+            :py:exc:`!werkzeug.exceptions.Conflict` when the error can not be
+            shown in the form.
+
+        :return:
+            Output returned by :py:meth:`.FormMixin.form_invalid`.
+
+        """
+        version_field = getattr(form, self.version_argument, None)
+
+        if self.conflict_message is None or version_field is None:
+            abort(409)
+
+        version_field.errors = list(version_field.errors) + [
+            self.conflict_message]
+        return self.form_invalid(form)
+
+    def handle_validation_error(self, form, error):
+        """
+        Handle a valid form containing data which is invalid for the document.
+
+        The error message is added to the errors of the form field of the
+        invalid document field and the form is shown again.
+
+        :param error:
+            Instance of :py:exc:`!mongoengine.ValidationError`.
+
+        :raise:
+            ``error`` when the form does not contain the invalid field.
+
+        :return:
+            Output returned by :py:meth:`.FormMixin.form_invalid`.
+
+        """
+        form_field = None
+        if error.field_name:
+            form_field = getattr(form, error.field_name, None)
+
+        if form_field is None:
+            raise error
+
+        form_field.errors = list(form_field.errors) + [error.message]
+        return self.form_invalid(form)
+
     def get_form_kwargs(self):
         """
         Return parameters for creating the form instance.
@@ -30,21 +146,239 @@ class ModelFormMixin(FormMixin, SingleObjectMixin):
         kwargs['obj'] = self.object
         return kwargs
 
+    def get_changed_fields(self, form):
+        """
+        Return the form fields which differ from the object.
+
+        The form fields are matched by their name without the form prefix.
+        Form fields which are not a field of the document class are ignored.
+
+        :param form:
+            Instance of the form class.
+
+        :return:
+            A ``dict`` containing the field names mapped against the new
+            values.
+
+        """
+        document_fields = self.document_class._fields
+        changed_fields = {}
+
+        for form_field in form:
+            field_name = form_field.short_name
+            if field_name not in document_fields:
+                continue
+            if getattr(self.object, field_name) != form_field.data:
+                changed_fields[field_name] = form_field.data
+
+        return changed_fields
+
+    def get_update(self, field_values):
+        """
+        Return the update document for the given field values.
+
+        Fields set to ``None`` are removed with ``$unset`` (unless they are
+        required), the other fields are validated and written with ``$set``.
+
+        :param field_values:
+            A ``dict`` containing the field names mapped against the values.
+
+        :raise:
+            :py:exc:`!mongoengine.ValidationError` when a value is invalid or
+            a required field is set to ``None``.
+
+        :return:
+            A ``dict`` containing the ``$set`` and / or ``$unset`` operators.
+
+        """
+        document_fields = self.document_class._fields
+        set_data = {}
+        unset_data = {}
+
+        for field_name, value in field_values.items():
+            document_field = document_fields[field_name]
+
+            if value is None:
+                if document_field.required:
+                    raise ValidationError(
+                        'Field is required', field_name=field_name)
+                unset_data[document_field.db_field] = 1
+            else:
+                document_field.validate(value)
+                set_data[document_field.db_field] = document_field.to_mongo(
+                    value)
+
+        update = {}
+        if set_data:
+            update['$set'] = set_data
+        if unset_data:
+            update['$unset'] = unset_data
+        return update
+
+    def update_object(self, changed_fields, condition=None):
+        """
+        Update the changed fields of the object with a single update.
+
+        :param changed_fields:
+            A ``dict`` as returned by
+            :py:meth:`~.ModelFormMixin.get_changed_fields`.
+
+        :param condition:
+            A ``dict`` containing the field names mapped against the values
+            the object must have in the database to be updated. Optional.
+
+        :raise:
+            :py:exc:`!mongoengine.ValidationError` when a value is invalid.
+
+        :return:
+            ``True`` when the object has been updated, ``False`` when it did
+            not match the condition.
+
+        """
+        update = self.get_update(changed_fields)
+
+        for field_name, value in changed_fields.items():
+            setattr(self.object, field_name, value)
+
+        query = {'_id': self.object.pk}
+        if condition:
+            query.update(self.get_raw_query(condition))
+
+        result = self.document_class._get_collection().update_one(
+            query, update)
+        return bool(result.matched_count)
+
+    def save_object(self, form):
+        """
+        Populate the existing object with the form data and save it.
+
+        When :py:attr:`~.ModelFormMixin.optimistic_locking` is ``True``, the
+        object is only saved when the version in the database matches the
+        version sent by the client.
+
+        :return:
+            ``True`` when the object has been saved, ``False`` on a conflict.
+
+        """
+        version = None
+        if self.optimistic_locking:
+            version = self.get_client_version()
+            if version is None:
+                return False
+
+        form.populate_obj(self.object)
+
+        if version is None:
+            self.object.save()
+            return True
+
+        setattr(
+            self.object, self.version_field, self.get_next_version(version))
+        try:
+            self.object.save(save_condition={self.version_field: version})
+        except SaveConditionError:
+            return False
+        return True
+
+    def update_changed_fields(self, changed_fields):
+        """
+        Update the fields of the existing object changed by the form.
+
+        See :py:attr:`~.ModelFormMixin.partial_update`. When
+        :py:attr:`~.ModelFormMixin.optimistic_locking` is ``True``, the
+        version is set to the next version within the same update.
+
+        :param changed_fields:
+            A ``dict`` as returned by
+            :py:meth:`~.ModelFormMixin.get_changed_fields`.
+
+        :return:
+            ``True`` when the object has been updated, ``False`` on a
+            conflict.
+
+        """
+        condition = None
+        if self.optimistic_locking:
+            version = self.get_client_version()
+            if version is None:
+                return False
+            changed_fields[self.version_field] = self.get_next_version(
+                version)
+            condition = {self.version_field: version}
+
+        return self.update_object(changed_fields, condition)
+
+    def write_object(self, form):
+        """
+        Write the form data to the database.
+
+        When editing an object, the object will be updated and saved (or only
+        the changed fields are updated, see
+        :py:attr:`~.ModelFormMixin.partial_update`), else a new object will
+        be created, saved and set to ``self.object``.
+
+        :raise:
+            :py:exc:`!mongoengine.ValidationError` when a value of a partial
+            update is invalid.
+
+        :return:
+            ``True`` when the object has been written, ``False`` on a version
+            conflict (see :py:attr:`~.ModelFormMixin.optimistic_locking`) and
+            ``None`` when no field has been changed.
+
+        """
+        if not self.object:
+            document = self.document_class()
+            form.populate_obj(document)
+            document.save()
+            self.object = document
+            return True
+
+        if self.partial_update:
+            changed_fields = self.get_changed_fields(form)
+            if not changed_fields:
+                return None
+            return self.update_changed_fields(changed_fields)
+
+        return self.save_object(form)
+
+    def invalidate_count_cache(self):
+        """
+        Invalidate the cached counts of the document class, for all queries.
+        """
+        invalidate_document_tag(self.count_cache, self.document_class)
+
     def form_valid(self, form):
         """
         Handle a valid form submission.
 
-        When editing an object, the object will be updated and saved, else
-        a new object will be created and saved.
+        The form data is written by
+        :py:meth:`~.ModelFormMixin.write_object`. A version conflict is
+        handled by :py:meth:`~.ModelFormMixin.handle_conflict`, invalid
+        values by :py:meth:`~.ModelFormMixin.handle_validation_error`.
+
+        A written object is invalidated in the object cache (by its primary
+        key, so for all the lookups) and the not-found lookups, cached
+        responses and cached counts depending on the document class are
+        invalidated.
 
         :return:
             Output returned by :py:meth:`.FormMixin.form_valid`.
 
         """
-        if not self.object:
-            self.object = self.document_class()
-        form.populate_obj(self.object)
-        self.object.save()
+        try:
+            written = self.write_object(form)
+        except ValidationError as e:
+            return self.handle_validation_error(form, e)
+
+        if written is False:
+            return self.handle_conflict(form)
+
+        if written:
+            self.invalidate_object_cache()
+            self.invalidate_not_found_cache()
+            self.invalidate_response_cache()
+            self.invalidate_count_cache()
         return super(ModelFormMixin, self).form_valid(form)
 
     def get_context_data(self, **kwargs):
@@ -144,6 +478,16 @@ class BaseUpdateView(ModelFormMixin, ProcessFormMixin, View):
     See :py:class:`.UpdateView` for an usage example.
 
     """
+    atomic_update = False
+    """
+    Set this to ``True`` to update the object with a single
+    ``find_one_and_update`` on POST requests, instead of retrieving it,
+    updating it and saving it. The form is created and validated without the
+    object, so only use this for forms which do not need the existing object
+    for validation. On an invalid form the object is retrieved to render
+    the form.
+    """
+
     def get(self, *args, **kwargs):
         """
         Handler for GET requests.
@@ -154,10 +498,110 @@ class BaseUpdateView(ModelFormMixin, ProcessFormMixin, View):
     def post(self, *args, **kwargs):
         """
         Handler for POST requests.
+
+        The object is not retrieved when
+        :py:attr:`~.BaseUpdateView.atomic_update` is ``True``.
+
         """
-        self.object = self.get_object()
+        if self.atomic_update:
+            self.object = None
+        else:
+            self.object = self.get_object()
         return super(BaseUpdateView, self).post(*args, **kwargs)
 
+    def find_and_update_object(self, form):
+        """
+        Update the object matching the lookup arguments with the form data.
+
+        The document fields of the form are written with a single
+        ``find_one_and_update``, which returns the updated object. When
+        :py:attr:`~.ModelFormMixin.optimistic_locking` is ``True``, the
+        version sent by the client is added to the query and the version is
+        set to the next version.
+
+        :param form:
+            Instance of the form class.
+
+        :raise:
+            :py:exc:`!werkzeug.exceptions.NotFound` when no object matches
+            the lookup arguments.
+
+        :return:
+            An instance of the document class containing the updated object,
+            or ``None`` on a version conflict.
+
+        """
+        document_fields = self.document_class._fields
+        field_values = dict(
+            (form_field.short_name, form_field.data) for form_field in form
+            if form_field.short_name in document_fields
+        )
+
+        queryset = self.get_queryset().filter(**self.get_lookup_args())
+        query = queryset._query
+
+        if self.optimistic_locking:
+            version = self.get_client_version()
+            if version is None:
+                return None
+            field_values[self.version_field] = self.get_next_version(version)
+            query = dict(query, **self.get_raw_query(
+                {self.version_field: version}))
+
+        collection = self.document_class._get_collection()
+        son = collection.find_one_and_update(
+            query,
+            self.get_update(field_values),
+            projection=queryset._loaded_fields.as_dict() or None,
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if son is not None:
+            return self.document_class._from_son(son)
+
+        if query is queryset._query or collection.find_one(
+                queryset._query, {'_id': 1}) is None:
+            abort(404)
+
+        return None
+
+    def write_object(self, form):
+        """
+        Write the form data to the database.
+
+        When :py:attr:`~.BaseUpdateView.atomic_update` is ``True``, the
+        object is updated by
+        :py:meth:`~.BaseUpdateView.find_and_update_object` and set to
+        ``self.object``, else this calls
+        :py:meth:`.ModelFormMixin.write_object`.
+
+        :return:
+            ``True`` when the object has been written, ``False`` on a version
+            conflict and ``None`` when no field has been changed.
+
+        """
+        if not self.atomic_update:
+            return super(BaseUpdateView, self).write_object(form)
+
+        self.object = self.find_and_update_object(form)
+        return self.object is not None
+
+    def form_invalid(self, form):
+        """
+        Handle an invalid form submission.
+
+        When :py:attr:`~.BaseUpdateView.atomic_update` is ``True``, the
+        object has not been retrieved yet, so it is retrieved first (which
+        aborts with a 404 when it does not exist).
+
+        :return:
+            Output returned by :py:meth:`.FormMixin.form_invalid`.
+
+        """
+        if self.atomic_update and self.object is None:
+            self.object = self.get_object()
+        return super(BaseUpdateView, self).form_invalid(form)
+
 
 class UpdateView(TemplateResponseMixin, BaseUpdateView):
     """
@@ -186,9 +630,14 @@ class UpdateView(TemplateResponseMixin, BaseUpdateView):
     """
 
 
-class DeletionMixin(object):
+class DeletionMixin(SingleObjectMixin):
     """
     Mixin class for deleting a single object.
+
+    This class inherits from:
+
+    * :py:class:`.SingleObjectMixin`
+
     """
     success_url = None
     """
@@ -196,6 +645,25 @@ class DeletionMixin(object):
     deletion.
     """
 
+    optimistic_locking = False
+    """
+    Set this to ``True`` to reject the deletion of objects which have been
+    changed since the client loaded them. The object is deleted with a
+    single ``delete_one`` which matches the version sent by the client (see
+    :py:meth:`~.SingleObjectMixin.get_client_version`), else a
+    ``409 Conflict`` response is returned.
+
+    .. note:: The ``delete`` signals and delete rules of the document are not
+        applied in this mode.
+
+    """
+
+    count_cache = MultipleObjectMixin.count_cache
+    """
+    The cache backend of the cached counts of the list views. See
+    :py:attr:`.MultipleObjectMixin.count_cache`.
+    """
+
     def get_success_url(self):
         """
         Return success URL.
@@ -211,16 +679,70 @@ class DeletionMixin(object):
         """
         return self.success_url
 
+    @classmethod
+    def get_configuration_errors(cls, concrete):
+        """
+        Return the configuration errors of the view class.
+
+        :return:
+            A ``list`` of error messages.
+
+        """
+        if cls.optimistic_locking and not cls.version_field:
+            return ['optimistic_locking requires version_field to be set.']
+        return []
+
+    def invalidate_count_cache(self):
+        """
+        Invalidate the cached counts of the document class, for all queries.
+        """
+        invalidate_document_tag(self.count_cache, self.document_class)
+
+    def delete_object_with_version(self):
+        """
+        Delete the object when it still has the version sent by the client.
+
+        :raise:
+            :py:exc:`!werkzeug.exceptions.Conflict` when the version does not
+            match.
+
+        """
+        version = self.get_client_version()
+        if version is None:
+            abort(409)
+
+        query = {'_id': self.object.pk}
+        query.update(self.get_raw_query({self.version_field: version}))
+
+        result = self.document_class._get_collection().delete_one(query)
+        if not result.deleted_count:
+            abort(409)
+
     def delete(self, *args, **kwargs):
         """
         Delete object and redirect user to configured success URL.
 
+        The object is removed from the object cache as well and the cached
+        responses and counts depending on the document class are
+        invalidated.
+
+        :raise:
+            :py:exc:`!werkzeug.exceptions.Conflict` when
+            :py:attr:`~.DeletionMixin.optimistic_locking` is ``True`` and the
+            object has been changed.
+
         :return:
             Redirect to URL returned by
             :py:meth:`~.DeletionMixin.get_success_url`.
 
         """
-        self.object.delete()
+        if self.optimistic_locking:
+            self.delete_object_with_version()
+        else:
+            self.object.delete()
+        self.invalidate_object_cache()
+        self.invalidate_response_cache()
+        self.invalidate_count_cache()
         return redirect(self.get_success_url())
 
 
@@ -275,3 +797,742 @@ class DeleteView(TemplateResponseMixin, BaseDeleteView):
             template_name = 'article_delete.html'
 
     """
+
+
+class BulkFormMixin(ModelFormMixin):
+    """
+    Mixin for validating and writing multiple objects on a single request.
+
+    This class inherits from:
+
+    * :py:class:`.ModelFormMixin`
+
+    The items are read from a JSON array of objects, or from form data using
+    repeated prefixes (Eg: ``items-0-title``, ``items-1-title``, see
+    :py:attr:`~.BulkFormMixin.form_prefix`). Each item is validated by an
+    instance of the form class and all the valid items are written with a
+    single unordered ``bulk_write``. The write operation of an item is
+    returned by the ``get_write_operation(form, formdata)`` method, which is
+    implemented by the views (see
+    :py:meth:`.BaseBulkCreateView.get_write_operation`).
+
+    The context data contains a ``list`` of ``errors``, each containing the
+    ``index`` of the item (as submitted) and a ``dict`` of ``errors`` by
+    fieldname. Errors
+    which do not belong to a field (Eg: a duplicate key error returned by
+    the database) are stored under ``'__all__'``.
+
+    .. note:: The ``save`` signals are not sent. When an item is written,
+        the existing objects matched by the write operations (see
+        :py:meth:`~.BulkFormMixin.get_matched_ids`) are evicted from the
+        object cache and the not-found lookups, cached responses and cached
+        counts depending on the document class are invalidated.
+
+    """
+    methods = ['POST']
+
+    form_prefix = 'items'
+    """
+    The prefix of the form fields for submitting the items as form data. The
+    fields of an item are prefixed by ``'{prefix}-{index}-'`` and the items
+    are ordered by index.
+    """
+
+    max_items = 1000
+    """
+    An ``int`` representing the maximum number of items per request. When
+    more items are submitted, a ``413 Request Entity Too Large`` response is
+    returned.
+    """
+
+    @classmethod
+    def get_configuration_errors(cls, concrete):
+        """
+        Return the configuration errors of the view class.
+
+        :return:
+            A ``list`` of error messages.
+
+        """
+        if concrete and not hasattr(cls, 'get_write_operation'):
+            return ['get_write_operation is not implemented.']
+        return []
+
+    def get_item_data(self):
+        """
+        Return the data of the submitted items.
+
+        :raise:
+            :py:exc:`!werkzeug.exceptions.BadRequest` when the JSON data is
+            not an array of objects.
+
+        :return:
+            A ``list`` of ``(index, formdata)`` tuples, one for each item,
+            containing the index of the item within the array (or the index
+            of the form field prefix) and a
+            :py:class:`!werkzeug.datastructures.MultiDict` containing the
+            data of the item.
+
+        """
+        if request.is_json:
+            items = request.get_json(silent=True)
+            if not isinstance(items, list) or not all(
+                    isinstance(item, dict) for item in items):
+                abort(400)
+            return list(enumerate(MultiDict(item) for item in items))
+
+        pattern = re.compile(
+            r'^{0}-(\d+)-(.+)$'.format(re.escape(self.form_prefix)))
+        items = {}
+
+        for key, values in request.form.lists():
+            match = pattern.match(key)
+            if match is not None:
+                index, field_name = match.groups()
+                items.setdefault(int(index), MultiDict()).setlist(
+                    field_name, values)
+
+        return [(index, items[index]) for index in sorted(items)]
+
+    def get_item_form(self, formdata):
+        """
+        Return an instance of the form class for the given item.
+
+        :param formdata:
+            A :py:class:`!werkzeug.datastructures.MultiDict` containing the
+            data of the item.
+
+        :return:
+            Instance of :py:attr:`~flask_views.edit.FormMixin.form_class`.
+
+        """
+        return self.form_class(formdata=formdata, **self.get_initial())
+
+    def get_validation_errors(self, error):
+        """
+        Return the errors of the given validation error by fieldname.
+
+        :param error:
+            Instance of :py:exc:`!mongoengine.ValidationError`.
+
+        :return:
+            A ``dict`` containing the fieldnames mapped against a ``list`` of
+            error messages.
+
+        """
+        errors = error.to_dict() or {
+            error.field_name or '__all__': error.message}
+
+        return dict(
+            (field_name, messages if isinstance(messages, dict) else [
+                messages])
+            for field_name, messages in errors.items()
+        )
+
+    def get_matched_ids(self, operations):
+        """
+        Return the primary keys of the existing objects matched by the given
+        write operations.
+
+        :param operations:
+            A ``list`` of PyMongo write operations.
+
+        :return:
+            A ``list`` of primary keys. By default an empty ``list``, since
+            inserts do not match existing objects.
+
+        """
+        return []
+
+    def write_operations(self, operations):
+        """
+        Execute the given write operations with a single unordered
+        ``bulk_write``.
+
+        :param operations:
+            A ``list`` of PyMongo write operations.
+
+        :return:
+            A ``dict`` containing the result of the bulk write, including the
+            ``writeErrors`` (see :py:attr:`!BulkWriteResult.bulk_api_result`).
+
+        """
+        if not operations:
+            return {
+                'nInserted': 0,
+                'nMatched': 0,
+                'nModified': 0,
+                'writeErrors': [],
+            }
+
+        try:
+            result = self.document_class._get_collection().bulk_write(
+                operations, ordered=False)
+        except BulkWriteError as e:
+            return e.details
+
+        return result.bulk_api_result
+
+    def get_result_data(self, result):
+        """
+        Return the context data for the result of the bulk write.
+
+        :param result:
+            A ``dict`` as returned by
+            :py:meth:`~.BulkFormMixin.write_operations`.
+
+        :return:
+            A ``dict`` containing the context data.
+
+        """
+        return {}
+
+    def get_context_data(self, **kwargs):
+        """
+        Return context data for rendering the response.
+
+        :return:
+            Output of :py:meth:`.FormMixin.get_context_data`.
+
+        """
+        return super(ModelFormMixin, self).get_context_data(**kwargs)
+
+    def post(self, *args, **kwargs):
+        """
+        Handler for POST requests.
+
+        The items returned by :py:meth:`~.BulkFormMixin.get_item_data` are
+        validated and the write operations of the valid items are executed.
+
+        :raise:
+            :py:exc:`!werkzeug.exceptions.RequestEntityTooLarge` when more
+            than :py:attr:`~.BulkFormMixin.max_items` items are submitted.
+
+        :return:
+            Output of ``render_to_response`` method implementation.
+
+        """
+        self.object = None
+        items = self.get_item_data()
+
+        if len(items) > self.max_items:
+            abort(413)
+
+        errors = {}
+        indexes = []
+        operations = []
+
+        for index, formdata in items:
+            form = self.get_item_form(formdata)
+            if not form.validate():
+                errors[index] = form.errors
+                continue
+
+            try:
+                operation = self.get_write_operation(form, formdata)
+            except ValidationError as e:
+                errors[index] = self.get_validation_errors(e)
+                continue
+
+            if operation is not None:
+                indexes.append(index)
+                operations.append(operation)
+
+        ids = self.get_matched_ids(operations)
+        result = self.write_operations(operations)
+
+        for write_error in result['writeErrors']:
+            errors[indexes[write_error['index']]] = {
+                '__all__': [write_error['errmsg']]}
+
+        if len(result['writeErrors']) < len(operations):
+            invalidate_object_tags(
+                self.object_cache, self.document_class, ids)
+            self.invalidate_not_found_cache()
+            self.invalidate_response_cache()
+            self.invalidate_count_cache()
+
+        context = self.get_result_data(result)
+        context['errors'] = [
+            {'index': index, 'errors': errors[index]}
+            for index in sorted(errors)
+        ]
+        return self.render_to_response(self.get_context_data(**context))
+
+
+class BaseBulkCreateView(BulkFormMixin, View):
+    """
+    Base view for creating multiple objects with a single bulk write.
+
+    This class inherits from:
+
+    * :py:class:`.BulkFormMixin`
+    * :py:class:`.View`
+
+    This implements all logic for creating the objects, but does not
+    implement the rendering of responses. See :py:class:`.BulkCreateView`
+    for an usage example.
+
+    """
+    def get_write_operation(self, form, formdata):
+        """
+        Return the insert operation for the given valid item.
+
+        A new object is populated with the form data and validated (including
+        the ``clean`` method of the document).
+
+        :param form:
+            Instance of the form class.
+
+        :param formdata:
+            A :py:class:`!werkzeug.datastructures.MultiDict` containing the
+            data of the item.
+
+        :raise:
+            :py:exc:`!mongoengine.ValidationError` when the item is invalid.
+
+        :return:
+            Instance of :py:class:`!pymongo.InsertOne`.
+
+        """
+        document = self.document_class()
+        form.populate_obj(document)
+        document.validate()
+        return InsertOne(document.to_mongo())
+
+    def get_result_data(self, result):
+        """
+        Return the context data for the result of the bulk write.
+
+        :return:
+            A ``dict`` containing the number of ``created`` objects.
+
+        """
+        return {'created': result['nInserted']}
+
+
+class BulkCreateView(JSONResponseMixin, BaseBulkCreateView):
+    """
+    View for creating multiple objects, rendering a JSON response.
+
+    This class inherits from:
+
+    * :py:class:`~flask_views.db.mongoengine.json.JSONResponseMixin`
+    * :py:class:`.BaseBulkCreateView`
+
+    Usage example::
+
+        class PostBulkCreateView(BulkCreateView):
+            form_class = PostForm
+            document_class = Post
+
+    Posting ``[{"title": "First"}, {"title": ""}]`` would create the first
+    post and return::
+
+        {
+            "created": 1,
+            "errors": [
+                {"index": 1, "errors": {"title": ["This field is required."]}}
+            ]
+        }
+
+    """
+
+
+class BaseBulkUpdateView(BulkFormMixin, View):
+    """
+    Base view for updating multiple objects with a single bulk write.
+
+    This class inherits from:
+
+    * :py:class:`.BulkFormMixin`
+    * :py:class:`.View`
+
+    Each item must contain the value of the
+    :py:attr:`~.BaseBulkUpdateView.lookup_field` of the object to update.
+    The document fields are updated with a ``$set`` / ``$unset`` update (see
+    :py:meth:`.ModelFormMixin.get_update`). The form is validated without
+    the existing object, so the fields which may be left out of an item
+    should not be required by the form. See :py:class:`.BulkUpdateView` for
+    an usage example.
+
+    :py:attr:`~.ModelFormMixin.optimistic_locking` is not supported, since
+    the conflicting items can not be told apart from the items which do not
+    match an object.
+
+    """
+    lookup_field = 'id'
+    """
+    The fieldname identifying the object to update.
+    """
+
+    partial_update = True
+    """
+    When ``True`` (default), only the document fields present in an item are
+    updated. Set this to ``False`` to update all the document fields of the
+    form, using the form defaults for the fields left out of an item.
+    """
+
+    @classmethod
+    def get_configuration_errors(cls, concrete):
+        """
+        Return the configuration errors of the view class.
+
+        :return:
+            A ``list`` of error messages.
+
+        """
+        if cls.optimistic_locking:
+            return ['optimistic_locking is not supported by bulk updates.']
+        return []
+
+    def get_write_operation(self, form, formdata):
+        """
+        Return the update operation for the given valid item.
+
+        The object is matched by the value of the
+        :py:attr:`~.BaseBulkUpdateView.lookup_field` within the ``QuerySet``
+        returned by :py:meth:`.SingleObjectMixin.get_queryset`.
+
+        :param form:
+            Instance of the form class.
+
+        :param formdata:
+            A :py:class:`!werkzeug.datastructures.MultiDict` containing the
+            data of the item.
+
+        :raise:
+            :py:exc:`!mongoengine.ValidationError` when the lookup value is
+            missing or a value is invalid.
+
+        :return:
+            Instance of :py:class:`!pymongo.UpdateOne`, or ``None`` when
+            there is no document field to update.
+
+        """
+        lookup_value = formdata.get(self.lookup_field)
+        if lookup_value in (None, ''):
+            raise ValidationError(
+                'This field is required.', field_name=self.lookup_field)
+
+        document_fields = self.document_class._fields
+        field_values = dict(
+            (form_field.short_name, form_field.data) for form_field in form
+            if form_field.short_name in document_fields and
+            form_field.short_name != self.lookup_field and
+            (not self.partial_update or form_field.short_name in formdata)
+        )
+        if not field_values:
+            return None
+
+        query = self.get_queryset().filter(
+            **{self.lookup_field: lookup_value})._query
+        return UpdateOne(query, self.get_update(field_values))
+
+    def get_matched_ids(self, operations):
+        """
+        Return the primary keys of the objects matched by the given update
+        operations.
+
+        The ids are only retrieved (with a single query, before the objects
+        are updated) when :py:attr:`~.SingleObjectMixin.object_cache` is set.
+
+        :param operations:
+            A ``list`` of :py:class:`!pymongo.UpdateOne` instances.
+
+        :return:
+            A ``list`` of primary keys.
+
+        """
+        if self.object_cache is None or not operations:
+            return []
+
+        collection = self.document_class._get_collection()
+        return [son['_id'] for son in collection.find(
+            {'$or': [operation._filter for operation in operations]},
+            {'_id': 1},
+        )]
+
+    def get_result_data(self, result):
+        """
+        Return the context data for the result of the bulk write.
+
+        :return:
+            A ``dict`` containing the number of ``matched`` and ``modified``
+            objects.
+
+        """
+        return {
+            'matched': result['nMatched'],
+            'modified': result['nModified'],
+        }
+
+
+class BulkUpdateView(JSONResponseMixin, BaseBulkUpdateView):
+    """
+    View for updating multiple objects, rendering a JSON response.
+
+    This class inherits from:
+
+    * :py:class:`~flask_views.db.mongoengine.json.JSONResponseMixin`
+    * :py:class:`.BaseBulkUpdateView`
+
+    Usage example::
+
+        class PostBulkUpdateView(BulkUpdateView):
+            form_class = PostForm
+            document_class = Post
+
+    Posting ``[{"id": "...", "title": "New title"}]`` would update the
+    title of the given post.
+
+    """
+
+
+class BulkDeletionMixin(MultipleObjectMixin):
+    """
+    Mixin class for deleting multiple objects with a single ``delete_many``.
+
+    This class inherits from:
+
+    * :py:class:`~flask_views.db.mongoengine.list.MultipleObjectMixin`
+
+    The objects are selected by the filter configured in
+    :py:attr:`~.MultipleObjectMixin.filter_fields`, optionally restricted to
+    a list of ids (see :py:attr:`~.BulkDeletionMixin.ids_argument`). When
+    no ids are given and the result is not filtered, a ``400 Bad Request``
+    response is returned, so a request can not delete the whole collection
+    by accident.
+
+    The objects are never retrieved from the database (only their ids, when
+    :py:attr:`~.BulkDeletionMixin.object_cache` or
+    :py:attr:`~.BulkDeletionMixin.encoded_cache` is set).
+
+    .. note:: The ``delete`` signals and delete rules of the document are not
+        applied. The deleted objects are evicted from the object and encoded
+        caches and the cached responses and counts depending on the document
+        class are invalidated.
+
+    """
+    methods = ['POST', 'DELETE']
+
+    ids_argument = 'ids'
+    """
+    A ``str`` representing the key of the list of ids in the JSON object, or
+    the repeated form field containing the ids.
+    """
+
+    max_items = 1000
+    """
+    An ``int`` representing the maximum number of ids per request. When more
+    ids are submitted, a ``413 Request Entity Too Large`` response is
+    returned.
+    """
+
+    dry_run_argument = 'dry_run'
+    """
+    A ``str`` representing the URL parameter for a dry run (Eg:
+    ``?dry_run=1``). On a dry run, the matching objects are counted instead
+    of deleted.
+    """
+
+    response_cache = SingleObjectMixin.response_cache
+    """
+    The cache backend of the cached responses depending on the document
+    class. See :py:attr:`.SingleObjectMixin.response_cache`.
+    """
+
+    object_cache = None
+    """
+    Set this to the :py:attr:`~.SingleObjectMixin.object_cache` of the
+    detail views, to evict the deleted objects from it.
+    """
+
+    encoded_cache = None
+    """
+    Set this to the
+    :py:attr:`~flask_views.db.mongoengine.json.JSONDetailView.encoded_cache`
+    of the JSON detail views, to evict the deleted objects from it.
+    """
+
+    def get_ids(self):
+        """
+        Return the ids of the objects to delete.
+
+        :raise:
+            :py:exc:`!werkzeug.exceptions.BadRequest` when the JSON data is
+            not an object or the ids are not a list.
+
+        :return:
+            A ``list`` of ids, or ``None`` when no ids are given.
+
+        """
+        if request.is_json:
+            data = request.get_json(silent=True)
+            if not isinstance(data, dict):
+                abort(400)
+            ids = data.get(self.ids_argument)
+            if ids is not None and not isinstance(ids, list):
+                abort(400)
+            return ids
+
+        if self.ids_argument in request.form:
+            return request.form.getlist(self.ids_argument)
+
+        return None
+
+    def is_dry_run(self):
+        """
+        Return if the request is a dry run.
+
+        :return:
+            ``True`` when the :py:attr:`~.BulkDeletionMixin.dry_run_argument`
+            URL parameter is set (and not ``0`` or ``false``).
+
+        """
+        value = request.args.get(self.dry_run_argument, '')
+        return value.lower() not in ('', '0', 'false')
+
+    def get_delete_query(self):
+        """
+        Return the raw (PyMongo) query matching the objects to delete.
+
+        :raise:
+            :py:exc:`!werkzeug.exceptions.BadRequest` when the query would
+            match all the objects or an id is invalid.
+
+            :py:exc:`!werkzeug.exceptions.RequestEntityTooLarge` when more
+            than :py:attr:`~.BulkDeletionMixin.max_items` ids are given.
+
+        :return:
+            A ``dict`` containing the query.
+
+        """
+        ids = self.get_ids()
+        queryset = self.get_filtered_queryset()
+
+        if ids is None:
+            if not self.get_filter_fields():
+                abort(400)
+        elif len(ids) > self.max_items:
+            abort(413)
+        else:
+            queryset = queryset.filter(pk__in=ids)
+
+        try:
+            return queryset._query
+        except ValidationError:
+            abort(400)
+
+    def get_context_data(self, **kwargs):
+        """
+        Return context data for rendering the response.
+
+        :return:
+            A ``dict`` containing the given keyword arguments.
+
+        """
+        return kwargs
+
+    def invalidate_response_cache(self):
+        """
+        Invalidate the cached responses depending on the document class.
+        """
+        invalidate_document_tag(self.response_cache, self.document_class)
+
+    def invalidate_object_caches(self, ids):
+        """
+        Evict the objects with the given ids from the object and encoded
+        caches.
+
+        :param ids:
+            A ``list`` containing the primary keys of the objects.
+
+        """
+        for cache in (self.object_cache, self.encoded_cache):
+            invalidate_object_tags(cache, self.document_class, ids)
+
+    def delete(self, *args, **kwargs):
+        """
+        Delete the matching objects with a single ``delete_many``.
+
+        On a dry run (see :py:meth:`~.BulkDeletionMixin.is_dry_run`), the
+        matching objects are counted instead.
+
+        :return:
+            Output of ``render_to_response`` method implementation, with the
+            number of ``deleted`` objects and ``dry_run`` in the context.
+
+        """
+        query = self.get_delete_query()
+        collection = self.document_class._get_collection()
+        dry_run = self.is_dry_run()
+        ids = []
+
+        if dry_run:
+            deleted = collection.count_documents(query)
+        else:
+            if self.object_cache is not None or (
+                    self.encoded_cache is not None):
+                ids = [son['_id'] for son in collection.find(
+                    query, {'_id': 1})]
+            deleted = collection.delete_many(query).deleted_count
+
+        if deleted and not dry_run:
+            self.invalidate_object_caches(ids)
+            self.invalidate_response_cache()
+            self.invalidate_count_cache()
+
+        return self.render_to_response(
+            self.get_context_data(deleted=deleted, dry_run=dry_run))
+
+    def post(self, *args, **kwargs):
+        """
+        Handler for POST requests.
+
+        :return:
+            Output of :py:meth:`~.BulkDeletionMixin.delete`.
+
+        """
+        return self.delete(*args, **kwargs)
+
+
+class BaseBulkDeleteView(BulkDeletionMixin, View):
+    """
+    Base view class for deleting multiple objects.
+
+    This class inherits from:
+
+    * :py:class:`.BulkDeletionMixin`
+    * :py:class:`.View`
+
+    This class implements all logic for deleting the objects, but does not
+    implement rendering responses. See :py:class:`.BulkDeleteView` for an
+    usage example.
+
+    """
+
+
+class BulkDeleteView(JSONResponseMixin, BaseBulkDeleteView):
+    """
+    View class for deleting multiple objects, rendering a JSON response.
+
+    This class inherits from:
+
+    * :py:class:`~flask_views.db.mongoengine.json.JSONResponseMixin`
+    * :py:class:`.BaseBulkDeleteView`
+
+    Usage example::
+
+        class ArticleBulkDeleteView(BulkDeleteView):
+            filter_fields = {
+                'category': 'category',
+            }
+            document_class = Article
+
+    Posting ``{"ids": ["...", "..."]}`` to ``/news/delete/`` would delete the
+    given articles within the news category and return
+    ``{"deleted": 2, "dry_run": false}``. Without ids, all the articles of the
+    category would be deleted.
+
+    """
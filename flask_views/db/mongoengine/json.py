@@ -1,19 +1,232 @@
 from __future__ import absolute_import
 
 import json
-from collections import Iterable
+from datetime import date, datetime
 
-from pymongo.objectid import ObjectId
+from bson.dbref import DBRef
+from bson.decimal128 import Decimal128
+from bson.objectid import ObjectId
+from flask import abort, current_app, request
+from mongoengine import fields
+from mongoengine.base import BaseDocument
 
-from flask_views.db.mongoengine.detail import BaseDetailView
+try:
+    from collections.abc import Iterable
+except ImportError:  # Python 2
+    from collections import Iterable
+
+from flask_views.base import memoize
+from flask_views.cache import get_tag_version
+from flask_views.db.mongoengine.detail import BaseDetailView, get_object_tag
+from flask_views.db.mongoengine.list import BaseListView
 from flask_views.json import JSONResponseMixin as JSONResponseMixinBase
+from flask_views.json import text_type, to_bytes
+
+
+_document_encoders = {}
+
+
+def encode_value(value):
+    """
+    Return ``value`` converted to JSON serializable types.
+
+    ``ObjectId`` and ``DBRef`` objects are converted to the id as string,
+    ``Decimal128`` objects to string (to keep the precision), ``datetime``
+    and ``date`` objects to ISO 8601 strings and documents by
+    :py:func:`.encode_document`.
+
+    """
+    if isinstance(value, BaseDocument):
+        return encode_document(value)
+    if isinstance(value, ObjectId):
+        return text_type(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, DBRef):
+        return text_type(value.id)
+    if isinstance(value, Decimal128):
+        return text_type(value)
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    if isinstance(value, dict):
+        return dict((key, encode_value(item)) for key, item in value.items())
+    return value
+
+
+def get_field_converter(field):
+    """
+    Return the function for converting values of the given field.
+
+    :param field:
+        An instance of a Mongoengine field class.
+
+    :return:
+        A function converting the (non ``None``) field value to JSON
+        serializable types, or ``None`` when the value does not need to be
+        converted.
+
+    """
+    if isinstance(field, (fields.DateTimeField, fields.ComplexDateTimeField)):
+        return lambda value: value.isoformat()
+
+    if isinstance(field, (
+            fields.StringField, fields.IntField, fields.FloatField,
+            fields.BooleanField)):
+        return None
+
+    if isinstance(field, fields.ObjectIdField):
+        return text_type
+
+    if isinstance(field, fields.EmbeddedDocumentField):
+        return lambda value: get_document_encoder(type(value))(value)
+
+    if isinstance(field, (fields.ListField, fields.DictField)):
+        item_converter = encode_value
+        if getattr(field, 'field', None) is not None:
+            item_converter = get_field_converter(field.field) or (
+                lambda value: value)
+
+        def convert_item(value):
+            if value is None:
+                return None
+            return item_converter(value)
+
+        if isinstance(field, fields.ListField):
+            return lambda value: [convert_item(item) for item in value]
+        return lambda value: dict(
+            (key, convert_item(item)) for key, item in value.items())
+
+    return encode_value
+
+
+def is_attribute_field(field):
+    """
+    Return if values of the given field must be read by attribute access.
+
+    This is the case for (lists or dicts of) references, which are
+    dereferenced on attribute access, and for fields which store their value
+    in a different format (Eg: ``ComplexDateTimeField``).
+
+    """
+    if isinstance(field, (
+            fields.ReferenceField, fields.GenericReferenceField,
+            fields.ComplexDateTimeField)):
+        return True
+
+    if isinstance(field, (fields.ListField, fields.DictField)):
+        return getattr(field, 'field', None) is not None and (
+            is_attribute_field(field.field))
+
+    return False
+
+
+def compile_document_encoder(document_class):
+    """
+    Return a function for encoding documents of the given class.
+
+    The fields of the document class are inspected once, so encoding a
+    document only needs to convert the values which are not JSON serializable
+    by itself.
+
+    .. note:: The values of reference fields are retrieved by attribute
+        access, so references are dereferenced as usual. Most other values
+        are read from the document data directly (see
+        :py:func:`.is_attribute_field`).
+
+    The dynamic fields of a ``DynamicDocument`` are not known in advance, so
+    these are encoded by :py:func:`.encode_value` for every document.
+
+    :param document_class:
+        A Mongoengine ``Document`` or ``EmbeddedDocument`` class.
+
+    :return:
+        A function returning a ``dict`` for a given document.
+
+    """
+    field_names = getattr(document_class, '_fields_ordered', None) or sorted(
+        document_class._fields)
+    data_fields = []
+    attribute_fields = []
+
+    for field_name in field_names:
+        field = document_class._fields[field_name]
+        converter = get_field_converter(field)
+        if is_attribute_field(field):
+            attribute_fields.append((field_name, converter))
+        else:
+            data_fields.append((field_name, converter))
+
+    dynamic = getattr(document_class, '_dynamic', False)
+
+    def encode(document):
+        data = document._data
+        out = {}
+
+        for field_name, converter in data_fields:
+            value = data.get(field_name)
+            if converter is not None and value is not None:
+                value = converter(value)
+            out[field_name] = value
+
+        for field_name, converter in attribute_fields:
+            value = getattr(document, field_name)
+            if value is not None:
+                value = converter(value)
+            out[field_name] = value
+
+        if dynamic:
+            for field_name in document._dynamic_fields:
+                out[field_name] = encode_value(getattr(document, field_name))
+
+        return out
+
+    return encode
+
+
+def get_document_encoder(document_class):
+    """
+    Return the (cached) function for encoding documents of the given class.
+
+    See :py:func:`.compile_document_encoder`.
+
+    """
+    try:
+        return _document_encoders[document_class]
+    except KeyError:
+        encoder = compile_document_encoder(document_class)
+        _document_encoders[document_class] = encoder
+        return encoder
+
+
+def encode_document(document):
+    """
+    Return a ``dict`` with the JSON serializable data of ``document``.
+    """
+    return get_document_encoder(type(document))(document)
 
 
 class MongoengineEncoder(json.JSONEncoder):
     """
     Custom JSON encoder implementation for encoding Mongoengine documents.
+
+    Documents are encoded by :py:func:`.encode_document`, using an encode
+    function compiled once per document class. Besides documents, this
+    encodes ``ObjectId``, ``DBRef`` and ``Decimal128`` objects like
+    :py:func:`.encode_value` and ``datetime`` / ``date`` objects as ISO 8601
+    string, so it can be used for encoding the raw ``dict`` objects returned
+    by :py:meth:`!QuerySet.as_pymongo` as well.
+
     """
     def default(self, obj):
+        if isinstance(obj, BaseDocument):
+            return encode_document(obj)
+
+        if isinstance(obj, DBRef):
+            return text_type(obj.id)
+
+        if isinstance(obj, Decimal128):
+            return text_type(obj)
+
         if isinstance(obj, Iterable):
             out = {}
             for key in obj:
@@ -21,7 +234,10 @@ class MongoengineEncoder(json.JSONEncoder):
             return out
 
         if isinstance(obj, ObjectId):
-            return unicode(obj)
+            return text_type(obj)
+
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
 
         return json.JSONEncoder.default(self, obj)
 
@@ -37,6 +253,147 @@ class JSONResponseMixin(JSONResponseMixinBase):
     """
     encoder_class = MongoengineEncoder
 
+    as_pymongo = False
+    """
+    Set this to ``True`` to retrieve the objects as raw ``dict`` objects
+    (:py:meth:`!QuerySet.as_pymongo`) instead of document instances. This
+    skips creating the documents, which is much faster for read-only views.
+
+    .. note:: The keys of the returned objects are the database fieldnames
+        (Eg: ``_id`` instead of ``id``) and the object cache is not used.
+
+    """
+
+    fields_argument = 'fields'
+    """
+    A ``str`` representing the URL parameter with a comma-separated list of
+    fieldnames to return (Eg: ``?fields=title,slug``).
+    """
+
+    allowed_fields = None
+    """
+    A ``list`` of fieldnames which may be requested by the
+    :py:attr:`~.JSONResponseMixin.fields_argument` URL parameter. When
+    ``None`` (default), the URL parameter is ignored.
+    """
+
+    @memoize
+    def get_only_fields(self):
+        """
+        Return the fieldnames to retrieve from the database.
+
+        When :py:attr:`~.JSONResponseMixin.allowed_fields` is set and the
+        fields are given by the URL parameter, these are returned. Else the
+        ``only_fields`` setting of the view is returned.
+
+        :return:
+            A ``list`` of fieldnames or ``None``.
+
+        :raise:
+            :py:exc:`!werkzeug.exceptions.BadRequest` when a requested field is
+            not in :py:attr:`~.JSONResponseMixin.allowed_fields`.
+
+        """
+        fields = request.args.get(self.fields_argument)
+
+        if self.allowed_fields is None or not fields:
+            return super(JSONResponseMixin, self).get_only_fields()
+
+        fields = [field.strip() for field in fields.split(',')]
+        if not set(fields).issubset(self.allowed_fields):
+            abort(400)
+
+        return fields
+
+    def get_vary_args(self):
+        """
+        Return the URL parameters handled by the view itself.
+
+        :return:
+            The ``list`` returned by the super class, including the
+            requested fields when
+            :py:attr:`~.JSONResponseMixin.allowed_fields` is set.
+
+        """
+        vary = super(JSONResponseMixin, self).get_vary_args()
+        if self.allowed_fields is not None:
+            vary.append((
+                self.fields_argument,
+                request.args.get(self.fields_argument),
+            ))
+        return vary
+
+    def encode_object(self, obj):
+        """
+        Return ``obj`` limited to the fields retrieved from the database.
+
+        The fields which are not retrieved (see ``only_fields`` and
+        ``exclude_fields``) would be encoded with their default value, so
+        these are left out of the encoded document. The id of the document is
+        always retrieved. Raw objects (see
+        :py:attr:`~.JSONResponseMixin.as_pymongo`) only contain the retrieved
+        fields already.
+
+        :param obj:
+            An instance of the document class.
+
+        :return:
+            ``obj`` when all the fields are retrieved, else a ``dict`` as
+            returned by :py:func:`.encode_document` containing the retrieved
+            fields only.
+
+        """
+        only_fields = self.get_only_fields()
+
+        if self.as_pymongo or not (only_fields or self.exclude_fields):
+            return obj
+
+        data = encode_document(obj)
+
+        if only_fields:
+            field_names = set(
+                field_name.split('.')[0] for field_name in only_fields)
+            field_names.add(obj._meta['id_field'])
+            data = dict(
+                (field_name, value) for field_name, value in data.items()
+                if field_name in field_names
+            )
+
+        for field_name in self.exclude_fields or []:
+            data.pop(field_name, None)
+
+        return data
+
+    def get_queryset(self):
+        """
+        Return ``QuerySet`` class used to retrieve objects.
+
+        :return:
+            The ``QuerySet`` of the view, as raw ``dict`` objects when
+            :py:attr:`~.JSONResponseMixin.as_pymongo` is set.
+
+        """
+        queryset = super(JSONResponseMixin, self).get_queryset()
+
+        if self.as_pymongo:
+            return queryset.as_pymongo()
+
+        return queryset
+
+    def use_object_cache(self):
+        """
+        Return if the object cache should be used for this request.
+
+        :return:
+            ``False`` when :py:attr:`~.JSONResponseMixin.as_pymongo` is set,
+            else the output of the ``use_object_cache`` method of the view.
+
+        """
+        if self.as_pymongo:
+            return False
+
+        return super(JSONResponseMixin, self).use_object_cache()
+
 
 class JSONDetailView(JSONResponseMixin, BaseDetailView):
     """
@@ -57,12 +414,264 @@ class JSONDetailView(JSONResponseMixin, BaseDetailView):
             document_class = Article
 
     """
+    encoded_cache = None
+    """
+    Set this to a cache backend (see :py:mod:`flask_views.cache`) to cache
+    the encoded JSON data. This requires
+    :py:attr:`~.SingleObjectMixin.version_field` to be set, since the cache
+    key is generated out of the id and version of the object.
+
+    On a request, only the id and version of the object are retrieved from
+    the database (or nothing at all, when the object is in the object cache).
+    The object is only retrieved and encoded when the encoded data is not in
+    the cache.
+    """
+
+    encoded_cache_timeout = 300
+    """
+    An ``int`` representing the number of seconds the encoded data is cached.
+    """
+
+    def get_object_version(self):
+        """
+        Return the id and version of the object.
+
+        :return:
+            A ``tuple`` containing the id and the version of the object, as
+            returned by :py:meth:`.SingleObjectMixin.get_object_values`.
+
+        """
+        return tuple(self.get_object_values('id', self.version_field))
+
+    def get_encoded_cache_key(self, object_id, version):
+        """
+        Return the encoded cache key for the given object id and version.
+
+        The view class, the fields to return,
+        :py:attr:`~.JSONResponseMixin.as_pymongo` and the serializer and
+        encoder classes are part of the key, since these change the encoded
+        data. The version of the tag of the object (see
+        :py:func:`~flask_views.db.mongoengine.detail.get_object_tag`) is part
+        of the key as well, so the data can be evicted by primary key (Eg: by
+        :py:class:`~flask_views.db.mongoengine.edit.BulkDeletionMixin`).
+
+        :return:
+            A ``str`` representing the cache key.
+
+        """
+        def get_path(klass):
+            return u'{0}.{1}'.format(klass.__module__, klass.__name__)
+
+        encoder_class = self.get_encoder_class()
+
+        return u':'.join([
+            u'flask_views.encoded',
+            get_path(self.__class__),
+            get_path(self.document_class),
+            u'{0}'.format(object_id),
+            u'{0}'.format(version),
+            u','.join(sorted(self.get_only_fields() or [])),
+            u','.join(sorted(self.exclude_fields or [])),
+            u'{0}'.format(int(self.as_pymongo)),
+            get_path(self.get_serializer_class()),
+            get_path(encoder_class) if encoder_class else u'',
+            get_tag_version(
+                self.encoded_cache,
+                get_object_tag(self.document_class, object_id),
+            ),
+        ])
+
+    def get(self, *args, **kwargs):
+        """
+        Handler for GET requests.
+
+        When :py:attr:`~.JSONDetailView.encoded_cache` is set, the cached
+        JSON data is returned if available.
+
+        :return:
+            Output of :py:meth:`.BaseDetailView.get` or a response containing
+            the (cached) JSON data.
+
+        """
+        if self.encoded_cache is None or not self.version_field:
+            return super(JSONDetailView, self).get(*args, **kwargs)
+
+        self.object = None
+        object_id, version = self.get_object_version()
+
+        if version is None:
+            if self.object is None:
+                self.object = self.get_object()
+            return self.render_to_response(self.get_context_data())
+
+        cache_key = self.get_encoded_cache_key(object_id, version)
+        data = self.encoded_cache.get(cache_key)
+
+        if data is None:
+            if self.object is None:
+                self.object = self.get_object()
+            data = to_bytes(
+                self.get_serializer().dumps(self.get_context_data()))
+            self.encoded_cache.set(
+                cache_key, data, timeout=self.encoded_cache_timeout)
+
+        return current_app.response_class(data, mimetype='application/json')
+
     def get_context_data(self):
         """
         Return the retrieved object.
 
         :return:
-            :py:attr:`!JSONDetailView.object`.
+            :py:attr:`!JSONDetailView.object`, limited to the retrieved fields
+            by :py:meth:`.JSONResponseMixin.encode_object`.
+
+        """
+        return self.encode_object(self.object)
+
+
+class JSONListView(JSONResponseMixin, BaseListView):
+    """
+    List view for rendering JSON responses for a list of objects.
+
+    This class inherits from:
+
+    * :py:class:`~flask_views.db.mongoengine.json.JSONResponseMixin`
+    * :py:class:`.BaseListView`
+
+    Usage example::
+
+        class ArticleListView(JSONListView):
+            filter_fields = {
+                'category': 'category',
+            }
+            items_per_page = 20
+            document_class = Article
+            as_pymongo = True
+
+    """
+    stream = False
+    """
+    Set this to ``True`` to stream the response. The objects are then
+    encoded while iterating over the database cursor (in batches of
+    :py:attr:`~flask_views.json.JSONResponseMixin.stream_batch_size`), so the
+    memory usage does not depend on the number of objects. This is useful for
+    exporting large collections. The other context data (Eg: pagination
+    data) is added after the list of objects.
+
+    When the client prefers newline-delimited JSON (``Accept:
+    application/x-ndjson``), the response is always streamed, with one object
+    per line. The other context data is then returned as ``X-`` headers (Eg:
+    ``total_page_count`` as ``X-Total-Page-Count``).
+    """
+
+    def is_streamed(self):
+        """
+        Return if the response should be streamed.
+
+        :return:
+            ``True`` when :py:attr:`~.JSONListView.stream` is set or the
+            client accepts newline-delimited JSON.
 
         """
-        return self.object
+        return self.stream or self.accepts_ndjson()
+
+    def get_media_type(self):
+        """
+        Return the media type negotiated for the current request.
+
+        :return:
+            :py:attr:`~flask_views.json.JSONResponseMixin.ndjson_mimetype`
+            when the client accepts newline-delimited JSON, else
+            ``'application/json'``.
+
+        """
+        if self.accepts_ndjson():
+            return self.ndjson_mimetype
+        return 'application/json'
+
+    def get_ndjson_headers(self, context_data):
+        """
+        Return the response headers for a newline-delimited JSON response.
+
+        :param context_data:
+            A ``dict`` containing the context data, without the list of
+            objects.
+
+        :return:
+            A ``dict`` containing a JSON encoded ``X-`` header for every
+            item of ``context_data`` which is not ``None``.
+
+        """
+        headers = {}
+
+        for key, value in context_data.items():
+            if value is not None:
+                header = 'X-{0}'.format('-'.join(
+                    part.capitalize() for part in key.split('_')))
+                headers[header] = json.dumps(value)
+
+        return headers
+
+    def get_context_data(self, **kwargs):
+        """
+        Return context data containing the list of objects.
+
+        :return:
+            Output of :py:meth:`.MultipleObjectMixin.get_context_data`, with
+            the ``QuerySet`` evaluated to a ``list``. When streaming, the
+            ``QuerySet`` is not evaluated, but set to not cache the results.
+            The objects are limited to the retrieved fields by
+            :py:meth:`.JSONResponseMixin.encode_object`.
+
+        """
+        context = super(JSONListView, self).get_context_data(**kwargs)
+        context_object_name = self.get_context_object_name()
+        object_list = context[context_object_name]
+
+        if self.is_streamed() and hasattr(object_list, 'no_cache'):
+            object_list = object_list.no_cache().batch_size(
+                self.stream_batch_size)
+
+        if not self.as_pymongo and (
+                self.get_only_fields() or self.exclude_fields):
+            object_list = (self.encode_object(obj) for obj in object_list)
+
+        if not self.is_streamed():
+            object_list = list(object_list)
+
+        context[context_object_name] = object_list
+        return context
+
+    def render_to_response(self, context_data={}):
+        """
+        Render JSON response for the given context data.
+
+        :return:
+            Output of :py:meth:`.JSONResponseMixin.stream_ndjson_response`
+            when the client accepts newline-delimited JSON, output of
+            :py:meth:`.JSONResponseMixin.stream_to_response` when
+            :py:attr:`~.JSONListView.stream` is set, else the output of
+            :py:meth:`.JSONResponseMixin.render_to_response`. Since the
+            response depends on the ``Accept`` header, it is added to the
+            ``Vary`` header.
+
+        """
+        if not self.is_streamed():
+            response = super(JSONListView, self).render_to_response(
+                context_data)
+        else:
+            context_data = dict(context_data)
+            context_object_name = self.get_context_object_name()
+            object_list = context_data.pop(context_object_name)
+
+            if self.accepts_ndjson():
+                response = self.stream_ndjson_response(
+                    object_list,
+                    headers=self.get_ndjson_headers(context_data),
+                )
+            else:
+                response = self.stream_to_response(
+                    object_list, context_data, key=context_object_name)
+
+        response.vary.add('Accept')
+        return response
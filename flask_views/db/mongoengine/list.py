@@ -1,8 +1,23 @@
+import base64
+from hashlib import md5
 from math import ceil
 
+from bson import json_util
+from bson.errors import InvalidId
+from bson.son import SON
 from flask import abort, request
+from mongoengine.errors import ValidationError
 
-from flask_views.base import View, TemplateResponseMixin
+from flask_views.base import (
+    CachedResponseMixin,
+    ConditionalResponseMixin,
+    TemplateResponseMixin,
+    View,
+    memoize,
+)
+from flask_views.cache import LRUCache, get_tag_version
+from flask_views.db.mongoengine.detail import (
+    get_document_tag, invalidate_document_tag)
 
 
 class MultipleObjectMixin(object):
@@ -35,6 +50,21 @@ class MultipleObjectMixin(object):
 
     """
 
+    only_fields = None
+    """
+    A ``list`` of fieldnames to retrieve from the database for each object.
+    When ``None`` (default), all the fields are retrieved. Example::
+
+        only_fields = ['title', 'slug', 'author']
+
+    """
+
+    exclude_fields = None
+    """
+    A ``list`` of fieldnames which should not be retrieved from the database
+    (Eg: large embedded documents which are not displayed).
+    """
+
     page_number_argument = 'page'
     """
     A ``str`` representing the argument which should be used to retrieve the
@@ -54,6 +84,110 @@ class MultipleObjectMixin(object):
     would be available as ``page_list``).
     """
 
+    count_strategy = 'exact'
+    """
+    A ``str`` representing how the total number of objects is determined for
+    pagination. One of:
+
+    ``'exact'``
+        Perform a count query on every request (default).
+
+    ``'cached'``
+        Perform a count query and store the result in
+        :py:attr:`~.MultipleObjectMixin.count_cache` for
+        :py:attr:`~.MultipleObjectMixin.count_cache_timeout` seconds. The
+        cache key is generated out of the document class and the query. The
+        cached counts are invalidated by
+        :py:meth:`~.MultipleObjectMixin.invalidate_count_cache`.
+
+    ``'estimated'``
+        Use the (fast) collection metadata count when the result is not
+        filtered at all (see
+        :py:meth:`~.MultipleObjectMixin.is_queryset_filtered`), else fall
+        back to ``'exact'``.
+
+    ``'has_next'``
+        Do not count at all. One more object than
+        :py:attr:`~.MultipleObjectMixin.items_per_page` is retrieved to
+        find out if there is a next page.
+
+    """
+
+    count_cache = LRUCache()
+    """
+    The cache backend used by the ``'cached'``
+    :py:attr:`~.MultipleObjectMixin.count_strategy`. See
+    :py:mod:`flask_views.cache`.
+    """
+
+    count_cache_timeout = 60
+    """
+    An ``int`` representing the number of seconds a cached count is valid.
+    """
+
+    facet_query = False
+    """
+    Set this to ``True`` to retrieve the objects of the current page and the
+    total number of objects in a single ``$facet`` aggregation, instead of
+    performing a separate count query. Requires MongoDB 3.4 or higher.
+
+    The separate queries are used when the filtered ``QuerySet`` does not
+    support the aggregation (see
+    :py:meth:`~.MultipleObjectMixin.use_facet_query`).
+    """
+
+    cursor_field = None
+    """
+    Set this to the name of an indexed field with unique values (Eg: ``'id'``)
+    to use cursor (keyset) pagination instead of page numbers. Prefix the
+    name with ``-`` to order descending (Eg: ``'-id'``).
+
+    Instead of skipping all the objects on the previous pages, the objects
+    are retrieved by filtering on the value of this field of the last (or
+    first) object on the previous page. Therefore deep pages are as fast as
+    the first one. This requires
+    :py:attr:`~.MultipleObjectMixin.items_per_page` to be set.
+    """
+
+    cursor_after_argument = 'after'
+    """
+    A ``str`` representing the URL parameter containing the cursor for
+    retrieving the next page.
+    """
+
+    cursor_before_argument = 'before'
+    """
+    A ``str`` representing the URL parameter containing the cursor for
+    retrieving the previous page.
+    """
+
+    @classmethod
+    def get_configuration_errors(cls, concrete):
+        """
+        Return the configuration errors of the view class.
+
+        :return:
+            A ``list`` of error messages.
+
+        """
+        errors = []
+
+        if not isinstance(cls.filter_fields, dict):
+            errors.append('filter_fields must be a dict.')
+        if cls.count_strategy not in (
+                'exact', 'cached', 'estimated', 'has_next'):
+            errors.append('count_strategy {0!r} is not supported.'.format(
+                cls.count_strategy))
+        if not isinstance(cls.items_per_page, int) or cls.items_per_page < 0:
+            errors.append('items_per_page must be a positive int or 0.')
+        elif cls.cursor_field and not cls.items_per_page:
+            errors.append('cursor_field requires items_per_page to be set.')
+        if concrete and cls.document_class is None:
+            errors.append('document_class is not set.')
+
+        return errors
+
+    @memoize
     def get_filter_fields(self):
         """
         Return a ``dict`` with the fields to filter on.
@@ -74,15 +208,38 @@ class MultipleObjectMixin(object):
 
         return filter_fields
 
+    @memoize
+    def get_only_fields(self):
+        """
+        Return the fieldnames to retrieve from the database.
+
+        :return:
+            :py:attr:`~.MultipleObjectMixin.only_fields`.
+
+        """
+        return self.only_fields
+
     def get_queryset(self):
         """
         Return ``QuerySet`` class used to retrieve objects.
 
+        The fields configured by
+        :py:meth:`~.MultipleObjectMixin.get_only_fields` and
+        :py:attr:`~.MultipleObjectMixin.exclude_fields` are applied.
+
         :return:
             An instance of :py:class:`!mongoengine.qeryset.QuerySet`.
 
         """
-        return self.document_class.objects
+        queryset = self.document_class.objects
+        only_fields = self.get_only_fields()
+
+        if only_fields:
+            queryset = queryset.only(*only_fields)
+        if self.exclude_fields:
+            queryset = queryset.exclude(*self.exclude_fields)
+
+        return queryset
 
     def get_filtered_queryset(self):
         """
@@ -102,6 +259,7 @@ class MultipleObjectMixin(object):
 
         return self.get_queryset().filter(**filter_fields_dict)
 
+    @memoize
     def get_page_number(self):
         """
         Return page number.
@@ -116,18 +274,197 @@ class MultipleObjectMixin(object):
         .. warning:: Make sure you cast the URL route argument for the page
             number to an ``int``. Example: ``/<category>/<int:page>/``.
 
+        :raises:
+            :py:exc:`!werkzeug.exceptions.NotFound` when the page number is
+            lower than ``1``.
+
         :return:
             An ``int`` representing the current page number.
 
         """
         try:
-            return self.kwargs[self.page_number_argument]
+            page_number = self.kwargs[self.page_number_argument]
         except KeyError:
             try:
-                return int(request.args[self.page_number_argument])
+                page_number = int(request.args[self.page_number_argument])
             except (KeyError, ValueError):
-                return 1
+                page_number = 1
+
+        if page_number < 1:
+            abort(404)
+        return page_number
+
+    @memoize
+    def use_facet_query(self):
+        """
+        Return if the ``$facet`` aggregation can be used.
+
+        The aggregation is built out of the internals of the filtered
+        ``QuerySet``. When these are not available (Eg: a custom
+        :py:meth:`~.MultipleObjectMixin.get_queryset` returning a different
+        kind of queryset), the separate queries are used instead.
+
+        :return:
+            ``True`` when :py:attr:`~.MultipleObjectMixin.facet_query` is set
+            and the filtered ``QuerySet`` supports the aggregation.
+
+        """
+        if not self.facet_query:
+            return False
+
+        queryset = self.get_filtered_queryset()
+        return all(hasattr(queryset, name) for name in (
+            '_query',
+            '_ordering',
+            '_collection',
+            '_loaded_fields',
+            '_get_order_by',
+        ))
+
+    @memoize
+    def get_facet_result(self):
+        """
+        Return the objects of the current page and the total object count.
+
+        Both are retrieved with a single ``$facet`` aggregation on the
+        filtered queryset. The result is stored, so the aggregation is only
+        performed once per request.
+
+        .. note:: This is used when
+            :py:meth:`~.MultipleObjectMixin.use_facet_query` returns
+            ``True``.
+
+        :return:
+            A ``tuple`` containing the ``list`` of objects (instances of
+            :py:attr:`~.MultipleObjectMixin.document_class`, or ``dict``
+            objects when the ``QuerySet`` is set to ``as_pymongo``) and the
+            total number of objects as ``int``.
+
+        """
+        queryset = self.get_filtered_queryset()
+        pipeline = [{'$match': queryset._query}]
+
+        ordering = queryset._ordering
+        if not ordering and self.document_class._meta.get('ordering'):
+            ordering = queryset._get_order_by(
+                self.document_class._meta['ordering'])
+        if ordering:
+            pipeline.append({'$sort': SON(ordering)})
+
+        start_index = (self.get_page_number() - 1) * self.items_per_page
+        object_stages = [
+            {'$skip': start_index},
+            {'$limit': self.items_per_page},
+        ]
+
+        projection = queryset._loaded_fields.as_dict()
+        if projection:
+            object_stages.append({'$project': projection})
+
+        pipeline.append({'$facet': {
+            'objects': object_stages,
+            'count': [{'$count': 'count'}],
+        }})
+
+        result = list(queryset._collection.aggregate(pipeline))[0]
+        if getattr(queryset, '_as_pymongo', False):
+            object_list = result['objects']
+        else:
+            object_list = [
+                self.document_class._from_son(son)
+                for son in result['objects']
+            ]
+        count = result['count'][0]['count'] if result['count'] else 0
+
+        return object_list, count
+
+    def is_queryset_filtered(self):
+        """
+        Return if the filtered ``QuerySet`` matches a part of the collection.
+
+        Besides the filter fields, this includes the filters applied by
+        :py:meth:`~.MultipleObjectMixin.get_queryset` and the ``_cls`` filter
+        of inherited document classes.
+
+        :return:
+            ``True`` when the query of the filtered ``QuerySet`` is not
+            empty.
+
+        """
+        return bool(self.get_filtered_queryset()._query)
+
+    def get_count_cache_key(self):
+        """
+        Return the cache key for the ``'cached'`` count strategy.
+
+        :return:
+            A ``str`` generated out of the document class, the query of the
+            filtered ``QuerySet`` (so views counting different queries, Eg:
+            by restricting :py:meth:`~.MultipleObjectMixin.get_queryset`, do
+            not share counts) and the version of the tag of the document
+            class.
+
+        """
+        query = json_util.dumps(
+            self.get_filtered_queryset()._query, sort_keys=True)
+        tag = get_document_tag(self.document_class)
+        return 'flask_views.count:{0}:{1}:{2}'.format(
+            tag,
+            md5(query.encode('utf-8')).hexdigest(),
+            get_tag_version(self.count_cache, tag),
+        )
+
+    def invalidate_count_cache(self):
+        """
+        Invalidate the cached counts of the document class, for all queries.
+        """
+        invalidate_document_tag(self.count_cache, self.document_class)
+
+    def get_object_count(self):
+        """
+        Return the total number of objects.
+
+        .. note:: This uses the strategy specified in
+            :py:attr:`~.MultipleObjectMixin.count_strategy`.
+
+        :return:
+            An ``int`` representing the total number of objects.
+
+        """
+        if self.count_strategy == 'cached':
+            cache_key = self.get_count_cache_key()
+            count = self.count_cache.get(cache_key)
+            if count is None:
+                count = self.get_filtered_queryset().count()
+                self.count_cache.set(
+                    cache_key, count, timeout=self.count_cache_timeout)
+            return count
+
+        if self.count_strategy == 'estimated' and (
+                not self.is_queryset_filtered()):
+            collection = self.document_class._get_collection()
+            return collection.estimated_document_count()
+
+        return self.get_filtered_queryset().count()
+
+    def is_page_count_exact(self):
+        """
+        Return if the total number of pages is exact.
+
+        :return:
+            ``False`` when the page count is cached, estimated or not
+            available at all, else ``True``.
+
+        """
+        if self.use_facet_query() or self.count_strategy == 'exact':
+            return True
+
+        if self.count_strategy == 'estimated':
+            return self.is_queryset_filtered()
 
+        return False
+
+    @memoize
     def get_page_count(self):
         """
         Return the total number of pages.
@@ -135,15 +472,63 @@ class MultipleObjectMixin(object):
         :return:
             An ``int`` representing the total number of available pages or
             ``None`` when :py:attr:`~.MultipleObjectMixin.items_per_page` is
-            set to ``0``.
+            set to ``0`` or the ``'has_next'``
+            :py:attr:`~.MultipleObjectMixin.count_strategy` is used.
 
         """
         if not self.items_per_page:
             return None
 
-        count = self.get_filtered_queryset().count()
+        if self.use_facet_query():
+            count = self.get_facet_result()[1]
+        elif self.count_strategy == 'has_next':
+            return None
+        else:
+            count = self.get_object_count()
         return int(ceil(float(count) / float(self.items_per_page)))
 
+    @memoize
+    def get_has_next_result(self):
+        """
+        Return the objects of the current page and if there is a next page.
+
+        One more object than :py:attr:`~.MultipleObjectMixin.items_per_page`
+        is retrieved to find out if there is a next page. The result is
+        stored, so the query is only performed once per request.
+
+        .. note:: This is used by the ``'has_next'``
+            :py:attr:`~.MultipleObjectMixin.count_strategy`.
+
+        :return:
+            A ``tuple`` containing the ``list`` of objects and a ``bool``
+            which is ``True`` when there is a next page.
+
+        """
+        start_index = (self.get_page_number() - 1) * self.items_per_page
+        end_index = start_index + self.items_per_page + 1
+        object_list = list(self.get_filtered_queryset()[start_index:end_index])
+
+        return (
+            object_list[:self.items_per_page],
+            len(object_list) > self.items_per_page,
+        )
+
+    def get_has_next_page(self):
+        """
+        Return if there is a page after the current page.
+
+        :return:
+            ``True`` when there is a next page, else ``False``.
+
+        """
+        if not self.items_per_page:
+            return False
+
+        if self.count_strategy == 'has_next' and not self.use_facet_query():
+            return self.get_has_next_result()[1]
+
+        return self.get_page_number() < self.get_page_count()
+
     def get_paginated_object_list(self):
         """
         Return paginated list of objects.
@@ -158,16 +543,162 @@ class MultipleObjectMixin(object):
         if not self.items_per_page:
             return self.get_filtered_queryset()
 
-        start_index = (self.get_page_number() - 1) * self.items_per_page
-        end_index = self.get_page_number() * self.items_per_page
+        page_number = self.get_page_number()
 
-        object_list = self.get_filtered_queryset()[start_index:end_index]
+        if self.use_facet_query():
+            object_list = self.get_facet_result()[0]
+        elif self.count_strategy == 'has_next':
+            object_list = self.get_has_next_result()[0]
+        else:
+            start_index = (page_number - 1) * self.items_per_page
+            end_index = page_number * self.items_per_page
+            object_list = self.get_filtered_queryset()[start_index:end_index]
 
-        if not len(object_list) and self.get_page_number() > 1:
+        if not len(object_list) and page_number > 1:
             abort(404)
         else:
             return object_list
 
+    def encode_cursor(self, value):
+        """
+        Return an opaque cursor token for the given field value.
+
+        :param value:
+            The value of the :py:attr:`~.MultipleObjectMixin.cursor_field`.
+
+        :return:
+            A URL-safe ``str``.
+
+        """
+        token = base64.urlsafe_b64encode(
+            json_util.dumps(value).encode('utf-8'))
+        return token.decode('ascii').rstrip('=')
+
+    def decode_cursor(self, token):
+        """
+        Return the field value of the given cursor token.
+
+        :param token:
+            A cursor token as returned by
+            :py:meth:`~.MultipleObjectMixin.encode_cursor`.
+
+        :return:
+            The value of the :py:attr:`~.MultipleObjectMixin.cursor_field`,
+            converted and validated by the field of the document class.
+
+        :raise:
+            :py:exc:`!werkzeug.exceptions.BadRequest` when the token is
+            invalid or does not contain a valid value for the field.
+
+        """
+        field_name = self.cursor_field.lstrip('+-')
+        if field_name == 'pk':
+            field_name = self.document_class._meta['id_field']
+        field = self.document_class._fields[field_name]
+
+        try:
+            padding = '=' * (-len(token) % 4)
+            value = field.to_python(json_util.loads(base64.urlsafe_b64decode(
+                str(token + padding)).decode('utf-8')))
+            field.validate(value)
+            return value
+        except (InvalidId, TypeError, ValueError, ValidationError):
+            abort(400)
+
+    def get_cursor(self):
+        """
+        Return the direction and field value of the requested cursor.
+
+        .. note:: This uses the names specified in
+            :py:attr:`~.MultipleObjectMixin.cursor_after_argument` and
+            :py:attr:`~.MultipleObjectMixin.cursor_before_argument`.
+
+        :return:
+            A ``tuple`` containing the direction (``'after'``, ``'before'``
+            or ``None`` for the first page) and the decoded field value.
+
+        """
+        for direction, argument in (
+                    ('after', self.cursor_after_argument),
+                    ('before', self.cursor_before_argument),
+                ):
+            token = request.args.get(argument)
+            if token:
+                return direction, self.decode_cursor(token)
+
+        return None, None
+
+    def get_object_value(self, obj, field_name):
+        """
+        Return the value of a field of the given object.
+
+        :param obj:
+            An instance of the document class, or a ``dict`` when the objects
+            are retrieved with :py:meth:`!QuerySet.as_pymongo`. The value is
+            read from a ``dict`` by the database name of the field (Eg:
+            ``'_id'`` for ``'id'``).
+
+        :param field_name:
+            The name of the field.
+
+        :return:
+            The value of the field.
+
+        """
+        if isinstance(obj, dict):
+            if field_name == 'pk':
+                field_name = self.document_class._meta['id_field']
+            field = self.document_class._fields.get(field_name)
+            return obj.get(field.db_field if field else field_name)
+
+        return getattr(obj, field_name)
+
+    def get_cursor_page(self):
+        """
+        Return a page of objects using cursor pagination.
+
+        One more object than :py:attr:`~.MultipleObjectMixin.items_per_page`
+        is retrieved to find out if there is a next (or previous) page,
+        therefore no count query is needed.
+
+        :return:
+            A ``tuple`` containing the ``list`` of objects, the cursor token
+            for the previous page and the cursor token for the next page. The
+            tokens are ``None`` when there is no previous or next page.
+
+        """
+        field_name = self.cursor_field.lstrip('+-')
+        descending = self.cursor_field.startswith('-')
+        direction, value = self.get_cursor()
+        forward = direction != 'before'
+        ascending = forward != descending
+
+        queryset = self.get_filtered_queryset()
+        if direction:
+            queryset = queryset.filter(**{'{0}__{1}'.format(
+                field_name, 'gt' if ascending else 'lt'): value})
+
+        object_list = list(queryset.order_by('{0}{1}'.format(
+            '+' if ascending else '-', field_name))[:self.items_per_page + 1])
+        has_more = len(object_list) > self.items_per_page
+        object_list = object_list[:self.items_per_page]
+
+        if not forward:
+            object_list.reverse()
+
+        previous_cursor = None
+        next_cursor = None
+
+        if object_list:
+            if direction == 'after' or (not forward and has_more):
+                previous_cursor = self.encode_cursor(
+                    self.get_object_value(object_list[0], field_name))
+            if not forward or has_more:
+                next_cursor = self.encode_cursor(
+                    self.get_object_value(object_list[-1], field_name))
+
+        return object_list, previous_cursor, next_cursor
+
     def get_context_object_name(self):
         """
         Return the context object name.
@@ -200,21 +731,158 @@ class MultipleObjectMixin(object):
                 The current page number (``int``).
 
             ``total_page_count``
-                The total number of pages (``int``).
+                The total number of pages (``int``) or ``None`` when not
+                available.
+
+            ``total_page_count_exact``
+                ``True`` if ``total_page_count`` is exact, else ``False``
+                (when it is cached, estimated or not available).
+
+            ``has_next_page``
+                ``True`` if there is a page after the current page.
 
             The key name containing the returned object list is generated
             by :py:meth:`.MultipleObjectMixin.get_context_object_name`.
 
+            When :py:attr:`~.MultipleObjectMixin.cursor_field` is set, the
+            page number and count are ``None`` and the following keys are
+            added:
+
+            ``previous_cursor``
+                The cursor token for the previous page or ``None``.
+
+            ``next_cursor``
+                The cursor token for the next page or ``None``.
+
         """
+        if self.cursor_field and self.items_per_page:
+            object_list, previous_cursor, next_cursor = self.get_cursor_page()
+            kwargs.update({
+                'is_paginated': True,
+                'current_page_number': None,
+                'total_page_count': None,
+                'total_page_count_exact': False,
+                'has_next_page': next_cursor is not None,
+                'previous_cursor': previous_cursor,
+                'next_cursor': next_cursor,
+                self.get_context_object_name(): object_list,
+            })
+            return kwargs
+
         kwargs.update({
             'is_paginated': self.items_per_page > 0,
             'current_page_number': self.get_page_number(),
             'total_page_count': self.get_page_count(),
+            'total_page_count_exact': self.is_page_count_exact(),
+            'has_next_page': self.get_has_next_page(),
             self.get_context_object_name(): self.get_paginated_object_list(),
         })
         return kwargs
 
 
+class ConditionalListMixin(ConditionalResponseMixin):
+    """
+    Mixin for conditional GET requests for a list of objects.
+
+    This class inherits from:
+
+    * :py:class:`.ConditionalResponseMixin`
+
+    The last modification time is the highest value of the
+    :py:attr:`~.ConditionalListMixin.last_modified_field` of the filtered
+    objects, which is retrieved by a single (indexed) query. Example usage::
+
+        class ArticleListView(ConditionalListMixin, ListView):
+            document_class = Article
+            template_name = 'article_list.html'
+            last_modified_field = 'updated_at'
+
+    .. note:: Deleting an object does not change the last modification time
+        of the list.
+
+    """
+    last_modified_field = None
+    """
+    The name of the ``DateTimeField`` containing the last modification time
+    of the objects.
+    """
+
+    def get_last_modified(self):
+        """
+        Return the last modification time of the list of objects.
+
+        :return:
+            The highest value of the
+            :py:attr:`~.ConditionalListMixin.last_modified_field`, or ``None``.
+
+        """
+        if not self.last_modified_field:
+            return None
+
+        queryset = self.get_filtered_queryset()
+        db_field = self.document_class._fields[
+            self.last_modified_field].db_field
+        son = queryset._collection.find_one(
+            queryset._query, {db_field: 1}, sort=[(db_field, -1)])
+
+        if son is None:
+            return None
+
+        return son.get(db_field)
+
+
+class CachedListMixin(CachedResponseMixin):
+    """
+    Mixin for caching the rendered responses for a list of objects.
+
+    This class inherits from:
+
+    * :py:class:`.CachedResponseMixin`
+
+    Besides the URL route arguments, the cache key contains the page number
+    (or the cursor URL parameters). The cached responses are invalidated when
+    an object of the document class is saved or deleted by the edit views.
+    Example usage::
+
+        class ArticleListView(CachedListMixin, ListView):
+            document_class = Article
+            template_name = 'article_list.html'
+            items_per_page = 20
+
+    """
+    def get_response_cache_tags(self):
+        """
+        Return the tags the response depends on.
+
+        :return:
+            A ``list`` containing the tag of the document class.
+
+        """
+        return [get_document_tag(self.document_class)]
+
+    def get_response_cache_vary(self):
+        """
+        Return the request values which change the response.
+
+        :return:
+            The ``list`` returned by
+            :py:meth:`.CachedResponseMixin.get_response_cache_vary`,
+            including the page number or cursor.
+
+        """
+        vary = super(CachedListMixin, self).get_response_cache_vary()
+
+        if self.cursor_field:
+            vary.extend(
+                (name, request.args.get(name)) for name in (
+                    self.cursor_after_argument, self.cursor_before_argument)
+            )
+        elif self.page_number_argument not in self.kwargs:
+            vary.append((self.page_number_argument, self.get_page_number()))
+
+        return vary
+
+
 class BaseListView(MultipleObjectMixin, View):
     """
     Base list view.
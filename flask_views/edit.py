@@ -1,6 +1,7 @@
 from flask import request, redirect
 
-from flask_views.base import TemplateResponseMixin, View
+from flask_views.base import (
+    TemplateResponseMixin, View, get_function, memoize)
 
 
 class FormMixin(object):
@@ -32,6 +33,21 @@ class FormMixin(object):
     form submission.
     """
 
+    @classmethod
+    def get_configuration_errors(cls, concrete):
+        """
+        Return the configuration errors of the view class.
+
+        :return:
+            A ``list`` of error messages.
+
+        """
+        if concrete and cls.form_class is None and get_function(
+                cls.get_form) is get_function(FormMixin.get_form):
+            return ['form_class is not set.']
+        return []
+
+    @memoize
     def get_initial(self):
         """
         Return initial form data.
@@ -70,6 +86,7 @@ class FormMixin(object):
         """
         return kwargs
 
+    @memoize
     def get_form_kwargs(self):
         """
         Return parameters for creating the form instance.
@@ -1,10 +1,103 @@
 from __future__ import absolute_import
 import json
 
-from flask import current_app
+from flask import current_app, request, stream_with_context
 
 from flask_views.base import View
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    string_types = basestring
+    text_type = unicode
+except NameError:  # Python 3
+    string_types = str
+    text_type = str
+
+
+class JSONSerializer(object):
+    """
+    JSON serializer using the :py:mod:`!json` module of the standard library.
+
+    :param encoder_class:
+        The :py:class:`!json.JSONEncoder` (sub)class to use. Optional.
+
+    """
+    def __init__(self, encoder_class=None):
+        self.encoder_class = encoder_class
+
+    @classmethod
+    def is_available(cls):
+        """
+        Return if the serializer can be used.
+
+        :return:
+            ``True`` when the required package is installed.
+
+        """
+        return True
+
+    def dumps(self, obj):
+        """
+        Serialize ``obj`` to JSON.
+
+        :return:
+            A ``str`` containing the JSON data.
+
+        """
+        return json.dumps(obj, cls=self.encoder_class)
+
+
+class OrjsonSerializer(JSONSerializer):
+    """
+    JSON serializer using `orjson <https://github.com/ijl/orjson>`_.
+
+    The ``default`` method of the encoder class is used for the types which
+    are not supported by orjson, so custom encoders (Eg:
+    :py:class:`~flask_views.db.mongoengine.json.MongoengineEncoder`) keep
+    working.
+
+    """
+    @classmethod
+    def is_available(cls):
+        return orjson is not None
+
+    def dumps(self, obj):
+        """
+        Serialize ``obj`` to JSON.
+
+        :return:
+            ``bytes`` containing the UTF-8 encoded JSON data.
+
+        """
+        default = None
+        if self.encoder_class is not None:
+            default = self.encoder_class().default
+
+        return orjson.dumps(
+            obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def to_bytes(data):
+    """
+    Return ``data`` as UTF-8 encoded ``bytes``.
+    """
+    if isinstance(data, bytes):
+        return data
+    return data.encode('utf-8')
+
+
+serializers = {
+    'json': JSONSerializer,
+    'orjson': OrjsonSerializer,
+}
+"""
+A ``dict`` containing the available serializer classes by name.
+"""
+
 
 class JSONResponseMixin(object):
     """
@@ -16,6 +109,77 @@ class JSONResponseMixin(object):
     if needed. Optional.
     """
 
+    serializer_class = None
+    """
+    Set this to the serializer class (or the name of it in
+    :py:data:`~flask_views.json.serializers`) used for rendering the JSON
+    data. When ``None``, the ``VIEWS_JSON_SERIALIZER`` setting of the
+    application is used, else :py:class:`~flask_views.json.JSONSerializer`.
+    Example::
+
+        serializer_class = 'orjson'
+
+    When the serializer is not available (Eg: the package is not
+    installed), :py:class:`~flask_views.json.JSONSerializer` is used.
+    """
+
+    stream_batch_size = 100
+    """
+    An ``int`` representing the number of objects which are encoded per
+    chunk when streaming a response.
+    """
+
+    ndjson_mimetype = 'application/x-ndjson'
+    """
+    The mimetype of newline-delimited JSON (JSON Lines) responses.
+    """
+
+    def get_encoder_class(self):
+        """
+        Return the JSON encoder class.
+
+        :return:
+            :py:attr:`~flask_views.json.JSONResponseMixin.encoder_class`.
+
+        """
+        return self.encoder_class
+
+    def get_serializer_class(self):
+        """
+        Return the serializer class.
+
+        :return:
+            The configured serializer class (see
+            :py:attr:`~flask_views.json.JSONResponseMixin.serializer_class`),
+            or :py:class:`~flask_views.json.JSONSerializer` when it is not
+            available.
+
+        """
+        serializer_class = self.serializer_class
+        if serializer_class is None:
+            serializer_class = current_app.config.get(
+                'VIEWS_JSON_SERIALIZER', JSONSerializer)
+
+        if isinstance(serializer_class, string_types):
+            serializer_class = serializers[serializer_class]
+
+        if not serializer_class.is_available():
+            serializer_class = JSONSerializer
+
+        return serializer_class
+
+    def get_serializer(self):
+        """
+        Return an instance of the serializer class.
+
+        :return:
+            An instance of the class returned by
+            :py:meth:`.JSONResponseMixin.get_serializer_class`.
+
+        """
+        return self.get_serializer_class()(
+            encoder_class=self.get_encoder_class())
+
     def render_to_response(self, context_data={}):
         """
         Render JSON response for the given context data.
@@ -29,10 +193,126 @@ class JSONResponseMixin(object):
 
         """
         return current_app.response_class(
-            json.dumps(context_data, cls=self.encoder_class),
+            self.get_serializer().dumps(context_data),
             mimetype='application/json'
         )
 
+    def generate_json_stream(self, object_list, context_data=None,
+                             key='objects'):
+        """
+        Generate the JSON data for ``object_list`` in chunks.
+
+        The objects are encoded while iterating over ``object_list``, so they
+        never have to be in memory all at once. The output is a JSON object
+        containing the objects under ``key``, followed by the items of
+        ``context_data`` (Eg: pagination data).
+
+        :param object_list:
+            An iterable of the objects to encode.
+
+        :param context_data:
+            A ``dict`` containing additional data. Optional.
+
+        :param key:
+            The key for the list of objects.
+
+        :return:
+            A generator yielding ``bytes``.
+
+        """
+        serializer = self.get_serializer()
+        yield b'{' + to_bytes(serializer.dumps(key)) + b':['
+
+        chunk = []
+        separator = b''
+        for obj in object_list:
+            chunk.append(to_bytes(serializer.dumps(obj)))
+            if len(chunk) >= self.stream_batch_size:
+                yield separator + b','.join(chunk)
+                separator = b','
+                chunk = []
+        if chunk:
+            yield separator + b','.join(chunk)
+
+        envelope = to_bytes(serializer.dumps(context_data or {}))
+        if envelope == b'{}':
+            yield b']}'
+        else:
+            yield b'],' + envelope[1:]
+
+    def stream_to_response(self, object_list, context_data=None,
+                           key='objects'):
+        """
+        Render a streamed JSON response for the given objects.
+
+        :return:
+            Output of :py:meth:`!flask.current_app.response_class` containing
+            the output of
+            :py:meth:`~flask_views.json.JSONResponseMixin.generate_json_stream`
+            with ``'application/json'`` mimetype.
+
+        """
+        return current_app.response_class(
+            stream_with_context(self.generate_json_stream(
+                object_list, context_data, key)),
+            mimetype='application/json'
+        )
+
+    def accepts_ndjson(self):
+        """
+        Return if the client prefers a newline-delimited JSON response.
+
+        :return:
+            ``True`` when the ``Accept`` header of the request prefers
+            :py:attr:`~flask_views.json.JSONResponseMixin.ndjson_mimetype`
+            over ``'application/json'``.
+
+        """
+        return request.accept_mimetypes.best_match(
+            ['application/json', self.ndjson_mimetype]
+        ) == self.ndjson_mimetype
+
+    def generate_ndjson_stream(self, object_list):
+        """
+        Generate newline-delimited JSON data for ``object_list``.
+
+        Every object is yielded as soon as it is encoded, so the client is
+        able to process the objects while they arrive.
+
+        :param object_list:
+            An iterable of the objects to encode.
+
+        :return:
+            A generator yielding a line (``bytes``) for every object.
+
+        """
+        serializer = self.get_serializer()
+        for obj in object_list:
+            yield to_bytes(serializer.dumps(obj)) + b'\n'
+
+    def stream_ndjson_response(self, object_list, headers=None):
+        """
+        Render a streamed newline-delimited JSON response.
+
+        :param object_list:
+            An iterable of the objects to encode.
+
+        :param headers:
+            A ``dict`` containing additional response headers. Optional.
+
+        :return:
+            Output of :py:meth:`!flask.current_app.response_class` containing
+            the output of :py:meth:`.JSONResponseMixin.generate_ndjson_stream`
+            with the
+            :py:attr:`~flask_views.json.JSONResponseMixin.ndjson_mimetype`.
+
+        """
+        return current_app.response_class(
+            stream_with_context(self.generate_ndjson_stream(object_list)),
+            mimetype=self.ndjson_mimetype,
+            headers=headers,
+        )
+
 
 class JSONView(JSONResponseMixin, View):
     """
@@ -1,6 +1,8 @@
+from datetime import datetime
+
 from flask import url_for
 
-from flask_views.base import View, TemplateView
+from flask_views.base import ConditionalResponseMixin, View, TemplateView
 from flask_views.tests.functional.base import BaseTestCase
 
 
@@ -65,3 +67,73 @@ class TemplateViewTestCase(BaseTestCase):
             response = self.client.get(url_for('test', user='foo'))
         self.assertEqual(200, response.status_code)
         self.assertEqual('User: foo', response.data)
+
+
+class ConditionalResponseMixinTestCase(BaseTestCase):
+    """
+    Tests for :py:class:`.ConditionalResponseMixin`.
+    """
+    def setUp(self):
+        super(ConditionalResponseMixinTestCase, self).setUp()
+
+        class TestView(ConditionalResponseMixin, View):
+            def get_etag(self):
+                return 'v{0}'.format(self.kwargs['version'])
+
+            def get_last_modified(self):
+                return datetime(2012, 1, 2, 3, 4, 5)
+
+            def get(self, *args, **kwargs):
+                return 'GET: {0}'.format(kwargs['version'])
+
+        self.app.add_url_rule(
+            '/test/<version>/',
+            view_func=TestView.as_view('test')
+        )
+
+    def test_get(self):
+        """
+        Test GET request without conditional headers.
+        """
+        with self.app.test_request_context():
+            response = self.client.get(url_for('test', version='1'))
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('GET: 1', response.data)
+        self.assertEqual('"v1"', response.headers['ETag'])
+        self.assertEqual(
+            'Mon, 02 Jan 2012 03:04:05 GMT', response.headers['Last-Modified'])
+
+    def test_get_if_none_match(self):
+        """
+        Test GET request with ``If-None-Match`` header.
+        """
+        with self.app.test_request_context():
+            response = self.client.get(
+                url_for('test', version='1'),
+                headers={'If-None-Match': '"v1"'},
+            )
+            self.assertEqual(304, response.status_code)
+            self.assertEqual('', response.data)
+
+            response = self.client.get(
+                url_for('test', version='2'),
+                headers={'If-None-Match': '"v1"'},
+            )
+            self.assertEqual(200, response.status_code)
+
+    def test_get_if_modified_since(self):
+        """
+        Test GET request with ``If-Modified-Since`` header.
+        """
+        with self.app.test_request_context():
+            response = self.client.get(
+                url_for('test', version='1'),
+                headers={'If-Modified-Since': 'Mon, 02 Jan 2012 03:04:05 GMT'},
+            )
+            self.assertEqual(304, response.status_code)
+
+            response = self.client.get(
+                url_for('test', version='1'),
+                headers={'If-Modified-Since': 'Mon, 02 Jan 2012 03:04:04 GMT'},
+            )
+            self.assertEqual(200, response.status_code)
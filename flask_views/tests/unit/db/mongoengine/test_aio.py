@@ -0,0 +1,66 @@
+import sys
+
+import unittest2 as unittest
+
+from mock import Mock, patch
+
+if sys.version_info >= (3, 7):
+    import asyncio
+
+    from flask_views.db.mongoengine.aio import (
+        AsyncBaseDetailView, AsyncBaseListView)
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'requires Python 3.7')
+class AsyncBaseDetailViewTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.AsyncBaseDetailView`.
+    """
+    def test_get(self):
+        """
+        Test :py:meth:`.AsyncBaseDetailView.get`.
+        """
+        view = AsyncBaseDetailView()
+        view.get_object = Mock(return_value='object')
+        view.get_context_data = Mock(return_value={'foo': 'bar'})
+        view.render_to_response = Mock(return_value='response')
+
+        self.assertEqual('response', run(view.get()))
+        self.assertEqual('object', view.object)
+        view.render_to_response.assert_called_once_with({'foo': 'bar'})
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'requires Python 3.7')
+class AsyncBaseListViewTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.AsyncBaseListView`.
+    """
+    @patch('flask_views.db.mongoengine.aio.super', create=True)
+    def test_get_paginated_object_list(self, super_mock):
+        """
+        Test :py:meth:`.AsyncBaseListView.get_paginated_object_list`.
+        """
+        super_mock.return_value.get_paginated_object_list.return_value = (
+            iter(['foo', 'bar']))
+
+        view = AsyncBaseListView()
+        self.assertEqual(['foo', 'bar'], view.get_paginated_object_list())
+
+    def test_get(self):
+        """
+        Test :py:meth:`.AsyncBaseListView.get`.
+        """
+        view = AsyncBaseListView()
+        view.get_context_data = Mock(return_value={'foo': 'bar'})
+        view.render_to_response = Mock(return_value='response')
+
+        self.assertEqual('response', run(view.get()))
+        view.render_to_response.assert_called_once_with({'foo': 'bar'})
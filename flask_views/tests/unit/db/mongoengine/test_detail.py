@@ -1,17 +1,113 @@
+from datetime import datetime
+from hashlib import md5
+
 import unittest2 as unittest
 
-from mock import Mock
+from mock import Mock, patch
 
 from flask_views.base import View, TemplateResponseMixin
 from flask_views.db.mongoengine.detail import (
-    SingleObjectMixin, BaseDetailView, DetailView
+    CachedDetailMixin,
+    ConditionalDetailMixin,
+    SingleObjectMixin,
+    BaseDetailView,
+    DetailView,
+    get_document_tag,
+    get_object_tag,
+    invalidate_document_tag,
+    invalidate_object_tags,
 )
 
 
+class GetDocumentTagTestCase(unittest.TestCase):
+    """
+    Tests for :py:func:`.get_document_tag`.
+    """
+    def test_get_document_tag(self):
+        """
+        Test :py:func:`.get_document_tag`.
+        """
+        document_class = Mock(__module__='app.models', __name__='Article')
+        self.assertEqual(
+            'app.models.Article', get_document_tag(document_class))
+
+
+class GetObjectTagTestCase(unittest.TestCase):
+    """
+    Tests for :py:func:`.get_object_tag`.
+    """
+    def test_get_object_tag(self):
+        """
+        Test :py:func:`.get_object_tag`.
+        """
+        document_class = Mock(__module__='app.models', __name__='Article')
+        self.assertEqual(
+            'app.models.Article:abc', get_object_tag(document_class, 'abc'))
+
+
+class InvalidateTagsTestCase(unittest.TestCase):
+    """
+    Tests for :py:func:`.invalidate_document_tag` and
+    :py:func:`.invalidate_object_tags`.
+    """
+    @patch('flask_views.db.mongoengine.detail.invalidate_tag')
+    def test_invalidate_document_tag(self, invalidate_tag):
+        """
+        Test :py:func:`.invalidate_document_tag`.
+        """
+        cache = Mock()
+        document_class = Mock(__module__='app.models', __name__='Article')
+
+        invalidate_document_tag(cache, document_class)
+        invalidate_tag.assert_called_once_with(cache, 'app.models.Article')
+
+        invalidate_tag.reset_mock()
+        invalidate_document_tag(None, document_class)
+        invalidate_document_tag(cache, None)
+        self.assertFalse(invalidate_tag.called)
+
+    @patch('flask_views.db.mongoengine.detail.invalidate_tag')
+    def test_invalidate_object_tags(self, invalidate_tag):
+        """
+        Test :py:func:`.invalidate_object_tags`.
+        """
+        cache = Mock()
+        document_class = Mock(__module__='app.models', __name__='Article')
+
+        invalidate_object_tags(cache, document_class, ['a', 'b'])
+        self.assertEqual(2, invalidate_tag.call_count)
+        invalidate_tag.assert_any_call(cache, 'app.models.Article:a')
+        invalidate_tag.assert_any_call(cache, 'app.models.Article:b')
+
+        invalidate_tag.reset_mock()
+        invalidate_object_tags(None, document_class, ['a'])
+        self.assertFalse(invalidate_tag.called)
+
+
 class SingleObjectMixinTestCase(unittest.TestCase):
     """
     Tests for :py:class:`.SingleObjectMixin`.
     """
+    def test_get_configuration_errors(self):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_configuration_errors`.
+        """
+        class TestMixin(SingleObjectMixin):
+            pass
+
+        self.assertEqual([], TestMixin.get_configuration_errors(False))
+        self.assertEqual(
+            ['document_class is not set.'],
+            TestMixin.get_configuration_errors(True)
+        )
+
+        TestMixin.document_class = Mock()
+        TestMixin.get_fields = ['id']
+        self.assertEqual(
+            ['get_fields must be a dict.'],
+            TestMixin.get_configuration_errors(True)
+        )
+
     def test_get_context_object_name_from_attr(self):
         """
         Test :py:meth:`.SingleObjectMixin.get_context_object_name` from attr.
@@ -47,6 +143,23 @@ class SingleObjectMixinTestCase(unittest.TestCase):
         mixin.document_class.objects = 'objects-qs'
         self.assertEqual('objects-qs', mixin.get_queryset())
 
+    def test_get_queryset_only_exclude_fields(self):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_queryset` with a projection.
+        """
+        mixin = SingleObjectMixin()
+        mixin.document_class = Mock()
+        mixin.only_fields = ['foo', 'bar']
+        mixin.exclude_fields = ['body']
+
+        objects = mixin.document_class.objects
+        self.assertEqual(
+            objects.only.return_value.exclude.return_value,
+            mixin.get_queryset()
+        )
+        objects.only.assert_called_once_with('foo', 'bar')
+        objects.only.return_value.exclude.assert_called_once_with('body')
+
     def test_get_object(self):
         """
         Test :py:meth:`.SingleObjectMixin.get_object` on single field.
@@ -107,6 +220,401 @@ class SingleObjectMixinTestCase(unittest.TestCase):
 
         self.assertRaises(mixin.document_class.DoesNotExist, mixin.get_object)
 
+    def test_get_lookup_args(self):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_lookup_args`.
+        """
+        mixin = SingleObjectMixin()
+        mixin.get_fields = {
+            'db_id': 'url_id',
+            'db_user': 'url_user',
+        }
+        mixin.kwargs = {
+            'url_id': '1234abc',
+        }
+        self.assertEqual(
+            {'db_id': '1234abc', 'db_user': None}, mixin.get_lookup_args())
+
+    def test_get_object_cache_key(self):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_object_cache_key`.
+        """
+        class Foo(object):
+            pass
+
+        mixin = SingleObjectMixin()
+        mixin.document_class = Foo
+        mixin.get_queryset = Mock()
+        queryset = mixin.get_queryset.return_value.filter.return_value
+        queryset._query = {'b': 'bar', 'a': 1, 'published': True}
+
+        self.assertEqual(
+            u'flask_views.object:{0}.Foo:{1}'.format(
+                __name__,
+                md5(b'{"a": 1, "b": "bar", "published": true}').hexdigest(),
+            ),
+            mixin.get_object_cache_key({'b': 'bar', 'a': 1})
+        )
+        mixin.get_queryset.return_value.filter.assert_called_once_with(
+            b='bar', a=1)
+
+    @patch('flask_views.db.mongoengine.detail.get_tag_version')
+    def test_get_object_cache_miss(self, get_tag_version):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_object` with empty cache.
+        """
+        get_tag_version.return_value = 'v1'
+        queryset = Mock()
+        queryset.get.return_value.pk = 'abc'
+
+        mixin = SingleObjectMixin()
+        mixin.document_class = Mock(__module__='app.models', __name__='Post')
+        mixin.object_cache = Mock()
+        mixin.object_cache.get.return_value = None
+        mixin.get_queryset = Mock(return_value=queryset)
+        mixin.get_object_cache_key = Mock(return_value='key')
+        mixin.kwargs = {
+            'id': '1234abc',
+        }
+
+        self.assertEqual(queryset.get.return_value, mixin.get_object())
+        queryset.get.assert_called_once_with(id='1234abc')
+        mixin.object_cache.get.assert_called_once_with('key')
+        get_tag_version.assert_called_once_with(
+            mixin.object_cache, 'app.models.Post:abc')
+        mixin.object_cache.set.assert_called_once_with(
+            'key',
+            ('abc', 'v1', queryset.get.return_value.to_mongo.return_value),
+            timeout=300,
+        )
+
+    def test_get_object_cache_projection(self):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_object` bypassing the cache.
+        """
+        mixin = SingleObjectMixin()
+        mixin.only_fields = ['foo']
+        mixin.object_cache = Mock()
+        mixin.get_queryset = Mock()
+        mixin.kwargs = {
+            'id': '1234abc',
+        }
+
+        mixin.get_object()
+        self.assertFalse(mixin.object_cache.get.called)
+        self.assertFalse(mixin.object_cache.set.called)
+
+    def test_use_object_cache(self):
+        """
+        Test :py:meth:`.SingleObjectMixin.use_object_cache`.
+        """
+        mixin = SingleObjectMixin()
+        self.assertFalse(mixin.use_object_cache())
+
+        mixin.object_cache = Mock()
+        self.assertTrue(mixin.use_object_cache())
+
+        mixin.exclude_fields = ['body']
+        self.assertFalse(mixin.use_object_cache())
+
+    @patch('flask_views.db.mongoengine.detail.get_tag_version')
+    def test_get_object_cache_hit(self, get_tag_version):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_object` with cached object.
+        """
+        get_tag_version.return_value = 'v1'
+
+        mixin = SingleObjectMixin()
+        mixin.document_class = Mock(__module__='app.models', __name__='Post')
+        mixin.object_cache = Mock()
+        mixin.object_cache.get.return_value = (
+            'abc', 'v1', {'_id': '1234abc'})
+        mixin.get_queryset = Mock()
+        mixin.get_object_cache_key = Mock(return_value='key')
+        mixin.kwargs = {
+            'id': '1234abc',
+        }
+
+        self.assertEqual(
+            mixin.document_class._from_son.return_value, mixin.get_object())
+        mixin.document_class._from_son.assert_called_once_with(
+            {'_id': '1234abc'})
+        get_tag_version.assert_called_once_with(
+            mixin.object_cache, 'app.models.Post:abc')
+        self.assertFalse(mixin.get_queryset.called)
+
+    @patch('flask_views.db.mongoengine.detail.get_tag_version')
+    def test_get_object_cache_invalidated(self, get_tag_version):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_object` with invalidated object.
+        """
+        get_tag_version.return_value = 'v2'
+        queryset = Mock()
+
+        mixin = SingleObjectMixin()
+        mixin.document_class = Mock(__module__='app.models', __name__='Post')
+        mixin.object_cache = Mock()
+        mixin.object_cache.get.return_value = (
+            'abc', 'v1', {'_id': '1234abc'})
+        mixin.get_queryset = Mock(return_value=queryset)
+        mixin.get_object_cache_key = Mock(return_value='key')
+        mixin.kwargs = {
+            'id': '1234abc',
+        }
+
+        self.assertEqual(queryset.get.return_value, mixin.get_object())
+        self.assertFalse(mixin.document_class._from_son.called)
+
+    @patch('flask_views.db.mongoengine.detail.invalidate_tag')
+    def test_invalidate_object_cache(self, invalidate_tag):
+        """
+        Test :py:meth:`.SingleObjectMixin.invalidate_object_cache`.
+        """
+        mixin = SingleObjectMixin()
+        mixin.document_class = Mock(__module__='app.models', __name__='Post')
+        mixin.object = Mock(pk='abc')
+        mixin.invalidate_object_cache()
+        self.assertFalse(invalidate_tag.called)
+
+        mixin.object_cache = Mock()
+        mixin.invalidate_object_cache()
+        invalidate_tag.assert_called_once_with(
+            mixin.object_cache, 'app.models.Post:abc')
+
+    @patch('flask_views.db.mongoengine.detail.abort')
+    def test_get_object_not_found_cache_hit(self, abort):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_object` with cached 404.
+        """
+        abort.side_effect = Exception('404')
+
+        mixin = SingleObjectMixin()
+        mixin.not_found_cache = Mock()
+        mixin.not_found_cache.get.return_value = True
+        mixin.get_queryset = Mock()
+        mixin.get_not_found_cache_key = Mock(return_value='key')
+        mixin.kwargs = {
+            'id': '1234abc',
+        }
+
+        self.assertRaises(Exception, mixin.get_object)
+        abort.assert_called_once_with(404)
+        mixin.not_found_cache.get.assert_called_once_with('key')
+        self.assertFalse(mixin.get_queryset.called)
+
+    @patch('flask_views.db.mongoengine.detail.abort')
+    def test_get_object_not_found_cache_miss(self, abort):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_object` storing a 404.
+        """
+        abort.side_effect = Exception('404')
+
+        mixin = SingleObjectMixin()
+        mixin.document_class = Mock()
+        mixin.document_class.DoesNotExist = KeyError
+        mixin.not_found_cache = Mock()
+        mixin.not_found_cache.get.return_value = None
+        mixin.get_queryset = Mock()
+        mixin.get_queryset.return_value.get.side_effect = KeyError
+        mixin.get_not_found_cache_key = Mock(return_value='key')
+        mixin.kwargs = {
+            'id': '1234abc',
+        }
+
+        self.assertRaises(Exception, mixin.get_object)
+        mixin.not_found_cache.set.assert_called_once_with(
+            'key', True, timeout=30)
+
+    @patch('flask_views.db.mongoengine.detail.get_tag_version')
+    def test_get_not_found_cache_key(self, get_tag_version):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_not_found_cache_key`.
+        """
+        get_tag_version.return_value = 'v1'
+
+        mixin = SingleObjectMixin()
+        mixin.document_class = Mock(__module__='app.models', __name__='Post')
+        mixin.not_found_cache = Mock()
+        mixin.get_object_cache_key = Mock(return_value='key')
+
+        self.assertEqual(
+            'key:not_found:v1', mixin.get_not_found_cache_key({'id': 'abc'}))
+        mixin.get_object_cache_key.assert_called_once_with({'id': 'abc'})
+        get_tag_version.assert_called_once_with(
+            mixin.not_found_cache, 'app.models.Post')
+
+    @patch('flask_views.db.mongoengine.detail.invalidate_tag')
+    def test_invalidate_not_found_cache(self, invalidate_tag):
+        """
+        Test :py:meth:`.SingleObjectMixin.invalidate_not_found_cache`.
+        """
+        mixin = SingleObjectMixin()
+        mixin.document_class = Mock(__module__='app.models', __name__='Post')
+        mixin.invalidate_not_found_cache()
+        self.assertFalse(invalidate_tag.called)
+
+        mixin.not_found_cache = Mock()
+        mixin.invalidate_not_found_cache()
+        invalidate_tag.assert_called_once_with(
+            mixin.not_found_cache, 'app.models.Post')
+
+    def test_get_object_values_object_cache(self):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_object_values` from cache.
+        """
+        mixin = SingleObjectMixin()
+        mixin.use_object_cache = Mock(return_value=True)
+        mixin.get_object = Mock(return_value=Mock(pk='abc', version=3))
+
+        self.assertEqual([3, 'abc'], mixin.get_object_values('version', 'pk'))
+        self.assertEqual(mixin.get_object.return_value, mixin.object)
+
+    def test_get_object_values_query(self):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_object_values` from database.
+        """
+        queryset = Mock()
+        queryset._query = {'slug': 'foo'}
+        queryset._collection.find_one.return_value = {'_id': 'abc', 'v': 3}
+
+        mixin = SingleObjectMixin()
+        mixin.document_class = Mock()
+        mixin.document_class._fields = {
+            'id': Mock(db_field='_id'),
+            'version': Mock(db_field='v'),
+        }
+        mixin.use_object_cache = Mock(return_value=False)
+        mixin.get_lookup_args = Mock(return_value={'slug': 'foo'})
+        mixin.get_queryset = Mock()
+        mixin.get_queryset.return_value.filter.return_value = queryset
+
+        self.assertEqual(
+            ['abc', 3], mixin.get_object_values('id', 'version'))
+        mixin.get_queryset.return_value.filter.assert_called_once_with(
+            slug='foo')
+        queryset._collection.find_one.assert_called_once_with(
+            {'slug': 'foo'}, {'_id': 1, 'v': 1})
+
+    @patch('flask_views.db.mongoengine.detail.abort')
+    def test_get_object_values_not_found(self, abort):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_object_values` raising 404.
+        """
+        abort.side_effect = Exception('404')
+
+        mixin = SingleObjectMixin()
+        mixin.document_class = Mock()
+        mixin.document_class._fields = {'version': Mock(db_field='v')}
+        mixin.use_object_cache = Mock(return_value=False)
+        mixin.get_lookup_args = Mock(return_value={})
+        mixin.get_queryset = Mock()
+        queryset = mixin.get_queryset.return_value.filter.return_value
+        queryset._collection.find_one.return_value = None
+        mixin.not_found_cache = Mock()
+        mixin.not_found_cache.get.return_value = None
+        mixin.get_not_found_cache_key = Mock(return_value='key')
+
+        self.assertRaises(Exception, mixin.get_object_values, 'version')
+        abort.assert_called_once_with(404)
+        mixin.not_found_cache.set.assert_called_once_with(
+            'key', True, timeout=30)
+
+    @patch('flask_views.db.mongoengine.detail.abort')
+    def test_get_object_values_not_found_cache_hit(self, abort):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_object_values` with cached 404.
+        """
+        abort.side_effect = Exception('404')
+
+        mixin = SingleObjectMixin()
+        mixin.use_object_cache = Mock(return_value=False)
+        mixin.get_lookup_args = Mock(return_value={'slug': 'foo'})
+        mixin.get_queryset = Mock()
+        mixin.not_found_cache = Mock()
+        mixin.not_found_cache.get.return_value = True
+        mixin.get_not_found_cache_key = Mock(return_value='key')
+
+        self.assertRaises(Exception, mixin.get_object_values, 'version')
+        abort.assert_called_once_with(404)
+        mixin.get_not_found_cache_key.assert_called_once_with({'slug': 'foo'})
+        self.assertFalse(mixin.get_queryset.called)
+
+    @patch('flask_views.db.mongoengine.detail.request')
+    def test_get_client_version(self, request):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_client_version`.
+        """
+        version_field = Mock()
+        version_field.to_python.side_effect = int
+
+        mixin = SingleObjectMixin()
+        mixin.document_class = Mock()
+        mixin.document_class._fields = {'version': version_field}
+        mixin.version_field = 'version'
+
+        request.form = {'version': '3'}
+        request.args = {'version': '4'}
+        self.assertEqual(3, mixin.get_client_version())
+
+        request.form = {}
+        self.assertEqual(4, mixin.get_client_version())
+
+        request.args = {}
+        request.if_match = ['5']
+        self.assertEqual(5, mixin.get_client_version())
+
+        request.if_match = None
+        self.assertEqual(None, mixin.get_client_version())
+
+    def test_get_next_version(self):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_next_version`.
+        """
+        mixin = SingleObjectMixin()
+        self.assertEqual(4, mixin.get_next_version(3))
+        self.assertEqual(1, mixin.get_next_version(None))
+
+    def test_get_next_version_datetime(self):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_next_version` with a datetime.
+        """
+        mixin = SingleObjectMixin()
+        version = datetime(2012, 1, 2)
+        self.assertTrue(mixin.get_next_version(version) > version)
+
+    def test_get_raw_query(self):
+        """
+        Test :py:meth:`.SingleObjectMixin.get_raw_query`.
+        """
+        version_field = Mock(db_field='v')
+        version_field.to_mongo.return_value = 'mongo-version'
+
+        mixin = SingleObjectMixin()
+        mixin.document_class = Mock()
+        mixin.document_class._fields = {'version': version_field}
+
+        self.assertEqual(
+            {'v': 'mongo-version'}, mixin.get_raw_query({'version': 3}))
+        version_field.to_mongo.assert_called_once_with(3)
+
+    @patch('flask_views.db.mongoengine.detail.invalidate_tag')
+    def test_invalidate_response_cache(self, invalidate_tag):
+        """
+        Test :py:meth:`.SingleObjectMixin.invalidate_response_cache`.
+        """
+        mixin = SingleObjectMixin()
+        mixin.response_cache = Mock()
+        mixin.document_class = Mock(__module__='app.models', __name__='Post')
+
+        mixin.invalidate_response_cache()
+        invalidate_tag.assert_called_once_with(
+            mixin.response_cache, 'app.models.Post')
+
+        invalidate_tag.reset_mock()
+        mixin.response_cache = None
+        mixin.invalidate_response_cache()
+        self.assertFalse(invalidate_tag.called)
+
     def test_get_context_data(self):
         """
         Test :py:meth:`.SingleObjectMixin.get_context_data`.
@@ -120,6 +628,49 @@ class SingleObjectMixinTestCase(unittest.TestCase):
         }, mixin.get_context_data(foo='bar'))
 
 
+class ConditionalDetailMixinTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.ConditionalDetailMixin`.
+    """
+    def test_get_validators_not_configured(self):
+        """
+        Test :py:meth:`.ConditionalDetailMixin.get_validators` without fields.
+        """
+        mixin = ConditionalDetailMixin()
+        mixin.version_field = None
+        self.assertEqual((None, None), mixin.get_validators())
+
+    def test_get_validators(self):
+        """
+        Test :py:meth:`.ConditionalDetailMixin.get_validators`.
+        """
+        mixin = ConditionalDetailMixin()
+        mixin.version_field = 'version'
+        mixin.last_modified_field = 'updated_at'
+        mixin.get_object_values = Mock(return_value=[3, 'date'])
+
+        self.assertEqual((3, 'date'), mixin.get_validators())
+        mixin.get_object_values.assert_called_once_with(
+            'version', 'updated_at')
+
+        mixin.last_modified_field = None
+        mixin.get_object_values = Mock(return_value=[3])
+        self.assertEqual((3, None), mixin.get_validators())
+
+
+class CachedDetailMixinTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.CachedDetailMixin`.
+    """
+    def test_get_response_cache_tags(self):
+        """
+        Test :py:meth:`.CachedDetailMixin.get_response_cache_tags`.
+        """
+        mixin = CachedDetailMixin()
+        mixin.document_class = Mock(__module__='app.models', __name__='Post')
+        self.assertEqual(['app.models.Post'], mixin.get_response_cache_tags())
+
+
 class BaseDetailViewTestCase(unittest.TestCase):
     """
     Tests for :py:class:`.BaseDetailView`.
@@ -156,3 +707,26 @@ class DetailViewTestCase(unittest.TestCase):
             [TemplateResponseMixin, BaseDetailView],
             DetailView.mro()[1:3],
         )
+
+    @patch('flask_views.db.mongoengine.detail.super', create=True)
+    def test_get_fragment_cache_key(self, super_mock):
+        """
+        Test :py:meth:`.DetailView.get_fragment_cache_key`.
+        """
+        view = DetailView()
+        view.object = Mock(pk=1, version=3)
+        view.version_field = 'version'
+        view.get_context_object_name = Mock(return_value='article')
+
+        self.assertEqual(
+            super_mock.return_value.get_fragment_cache_key.return_value,
+            view.get_fragment_cache_key('body', ['foo'])
+        )
+        super_mock.return_value.get_fragment_cache_key.assert_called_once_with(
+            'body', ['article', 1, 3, 'foo'])
+
+        super_mock.return_value.get_fragment_cache_key.reset_mock()
+        view.version_field = None
+        view.get_fragment_cache_key('body', [])
+        super_mock.return_value.get_fragment_cache_key.assert_called_once_with(
+            'body', ['article', 1])
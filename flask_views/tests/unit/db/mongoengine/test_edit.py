@@ -1,18 +1,31 @@
 import unittest2 as unittest
 
 from mock import Mock, patch
+from mongoengine.errors import ValidationError
+from pymongo import UpdateOne
+from werkzeug.datastructures import MultiDict
 
 from flask_views.base import View, TemplateResponseMixin
 from flask_views.db.mongoengine.detail import SingleObjectMixin
 from flask_views.db.mongoengine.edit import (
+    BaseBulkCreateView,
+    BaseBulkDeleteView,
+    BaseBulkUpdateView,
     BaseCreateView,
     BaseDeleteView,
     BaseUpdateView,
+    BulkCreateView,
+    BulkDeleteView,
+    BulkDeletionMixin,
+    BulkFormMixin,
+    BulkUpdateView,
     CreateView,
     DeletionMixin,
     ModelFormMixin,
     UpdateView,
 )
+from flask_views.db.mongoengine.json import JSONResponseMixin
+from flask_views.db.mongoengine.list import MultipleObjectMixin
 from flask_views.edit import FormMixin, ProcessFormMixin
 
 
@@ -27,6 +40,19 @@ class ModelFormMixinTestCase(unittest.TestCase):
         for class_obj in [FormMixin, SingleObjectMixin]:
             self.assertIn(class_obj, ModelFormMixin.mro())
 
+    @patch('flask_views.db.mongoengine.edit.invalidate_document_tag')
+    def test_invalidate_count_cache(self, invalidate_document_tag):
+        """
+        Test :py:meth:`.ModelFormMixin.invalidate_count_cache`.
+        """
+        mixin = ModelFormMixin()
+        mixin.document_class = Mock()
+        self.assertIs(MultipleObjectMixin.count_cache, mixin.count_cache)
+
+        mixin.invalidate_count_cache()
+        invalidate_document_tag.assert_called_once_with(
+            mixin.count_cache, mixin.document_class)
+
     @patch('flask_views.db.mongoengine.edit.super', create=True)
     def test_get_form_kwargs(self, super_mock):
         """
@@ -64,6 +90,45 @@ class ModelFormMixinTestCase(unittest.TestCase):
         super_mock.assert_called_once_with(ModelFormMixin, mixin)
         super_class.form_valid.assert_called_once_with(form)
 
+    @patch('flask_views.db.mongoengine.edit.super', create=True)
+    def test_form_valid_invalidates_object_cache(self, super_mock):
+        """
+        Test :py:meth:`.ModelFormMixin.form_valid` invalidating the cache.
+        """
+        mixin = ModelFormMixin()
+        mixin.object = Mock()
+        mixin.invalidate_object_cache = Mock()
+
+        mixin.form_valid(Mock())
+        mixin.invalidate_object_cache.assert_called_once_with()
+
+    @patch('flask_views.db.mongoengine.edit.super', create=True)
+    def test_form_valid_invalidates_not_found_cache(self, super_mock):
+        """
+        Test :py:meth:`.ModelFormMixin.form_valid` clearing the 404 cache.
+        """
+        mixin = ModelFormMixin()
+        mixin.object = None
+        mixin.document_class = Mock(__name__='Post')
+        mixin.invalidate_not_found_cache = Mock()
+
+        mixin.form_valid(Mock())
+        mixin.invalidate_not_found_cache.assert_called_once_with()
+
+    @patch('flask_views.db.mongoengine.edit.super', create=True)
+    def test_form_valid_invalidates_response_cache(self, super_mock):
+        """
+        Test :py:meth:`.ModelFormMixin.form_valid` invalidating responses.
+        """
+        mixin = ModelFormMixin()
+        mixin.object = Mock()
+        mixin.invalidate_response_cache = Mock()
+        mixin.invalidate_count_cache = Mock()
+
+        mixin.form_valid(Mock())
+        mixin.invalidate_response_cache.assert_called_once_with()
+        mixin.invalidate_count_cache.assert_called_once_with()
+
     @patch('flask_views.db.mongoengine.edit.super', create=True)
     def test_form_valid_without_object(self, super_mock):
         """
@@ -77,7 +142,8 @@ class ModelFormMixinTestCase(unittest.TestCase):
         model_obj = Mock()
         mixin = ModelFormMixin()
         mixin.object = None
-        mixin.document_class = Mock(return_value=model_obj)
+        mixin.document_class = Mock(
+            __name__='Post', return_value=model_obj)
 
         self.assertEqual('form-valid', mixin.form_valid(form))
         form.populate_obj.assert_called_once_with(model_obj)
@@ -85,6 +151,346 @@ class ModelFormMixinTestCase(unittest.TestCase):
         super_mock.assert_called_once_with(ModelFormMixin, mixin)
         super_class.form_valid.assert_called_once_with(form)
 
+    def _form_field(self, name, data, prefix=''):
+        form_field = Mock(data=data, short_name=name)
+        form_field.name = prefix + name
+        return form_field
+
+    def test_get_changed_fields(self):
+        """
+        Test :py:meth:`.ModelFormMixin.get_changed_fields`.
+        """
+        mixin = ModelFormMixin()
+        mixin.document_class = Mock()
+        mixin.document_class._fields = {'title': Mock(), 'body': Mock()}
+        mixin.object = Mock(title='Title', body='Body')
+
+        form = [
+            self._form_field('title', 'New title'),
+            self._form_field('body', 'Body'),
+            self._form_field('captcha', 'foo'),
+        ]
+        self.assertEqual(
+            {'title': 'New title'}, mixin.get_changed_fields(form))
+
+    def test_get_changed_fields_prefix(self):
+        """
+        Test :py:meth:`.ModelFormMixin.get_changed_fields` with form prefix.
+        """
+        mixin = ModelFormMixin()
+        mixin.document_class = Mock()
+        mixin.document_class._fields = {'title': Mock(), 'body': Mock()}
+        mixin.object = Mock(title='Title', body='Body')
+
+        form = [
+            self._form_field('title', 'New title', prefix='post-'),
+            self._form_field('body', 'Body', prefix='post-'),
+        ]
+        self.assertEqual(
+            {'title': 'New title'}, mixin.get_changed_fields(form))
+
+    def test_get_update_required(self):
+        """
+        Test :py:meth:`.ModelFormMixin.get_update` unsetting a required field.
+        """
+        mixin = ModelFormMixin()
+        mixin.document_class = Mock()
+        mixin.document_class._fields = {'title': Mock(required=True)}
+
+        with self.assertRaises(ValidationError) as cm:
+            mixin.get_update({'title': None})
+        self.assertEqual('title', cm.exception.field_name)
+
+    def test_handle_validation_error(self):
+        """
+        Test :py:meth:`.ModelFormMixin.handle_validation_error`.
+        """
+        form = Mock()
+        form.title.errors = ['Error']
+
+        mixin = ModelFormMixin()
+        mixin.form_invalid = Mock(return_value='form-invalid')
+
+        self.assertEqual('form-invalid', mixin.handle_validation_error(
+            form, ValidationError('Field is required', field_name='title')))
+        self.assertEqual(['Error', 'Field is required'], form.title.errors)
+        mixin.form_invalid.assert_called_once_with(form)
+
+        error = ValidationError('Invalid')
+        self.assertRaises(
+            ValidationError, mixin.handle_validation_error, form, error)
+
+        form = Mock(spec=[])
+        error = ValidationError('Field is required', field_name='title')
+        self.assertRaises(
+            ValidationError, mixin.handle_validation_error, form, error)
+
+    def test_form_valid_partial_update_invalid(self):
+        """
+        Test :py:meth:`.ModelFormMixin.form_valid` with an invalid value.
+        """
+        error = ValidationError('Field is required', field_name='title')
+        mixin = ModelFormMixin()
+        mixin.partial_update = True
+        mixin.object = Mock()
+        mixin.get_changed_fields = Mock(return_value={'title': None})
+        mixin.update_changed_fields = Mock(side_effect=error)
+        mixin.handle_validation_error = Mock(return_value='form-invalid')
+        mixin.invalidate_object_cache = Mock()
+        mixin.invalidate_response_cache = Mock()
+        mixin.invalidate_count_cache = Mock()
+
+        self.assertEqual('form-invalid', mixin.form_valid('form'))
+        mixin.handle_validation_error.assert_called_once_with('form', error)
+        self.assertFalse(mixin.invalidate_response_cache.called)
+        self.assertFalse(mixin.invalidate_count_cache.called)
+
+    def test_update_object(self):
+        """
+        Test :py:meth:`.ModelFormMixin.update_object`.
+        """
+        title_field = Mock(db_field='t')
+        title_field.to_mongo.return_value = 'mongo-title'
+        body_field = Mock(db_field='b', required=False)
+
+        mixin = ModelFormMixin()
+        mixin.document_class = Mock()
+        mixin.document_class._fields = {
+            'title': title_field, 'body': body_field}
+        mixin.object = Mock(pk=1, title='Title', body='Body')
+
+        mixin.update_object({'title': 'New title', 'body': None})
+        title_field.validate.assert_called_once_with('New title')
+        self.assertFalse(body_field.validate.called)
+        self.assertEqual('New title', mixin.object.title)
+        self.assertEqual(None, mixin.object.body)
+        collection = mixin.document_class._get_collection.return_value
+        collection.update_one.assert_called_once_with(
+            {'_id': 1}, {'$set': {'t': 'mongo-title'}, '$unset': {'b': 1}})
+
+    @patch('flask_views.db.mongoengine.edit.super', create=True)
+    def test_form_valid_partial_update(self, super_mock):
+        """
+        Test :py:meth:`.ModelFormMixin.form_valid` with partial updates.
+        """
+        super_class = Mock()
+        super_class.form_valid.return_value = 'form-valid'
+        super_mock.return_value = super_class
+
+        form = Mock()
+        mixin = ModelFormMixin()
+        mixin.partial_update = True
+        mixin.object = Mock()
+        mixin.get_changed_fields = Mock(return_value={'title': 'New title'})
+        mixin.update_object = Mock()
+        mixin.invalidate_object_cache = Mock()
+        mixin.invalidate_not_found_cache = Mock()
+        mixin.invalidate_response_cache = Mock()
+        mixin.invalidate_count_cache = Mock()
+
+        self.assertEqual('form-valid', mixin.form_valid(form))
+        mixin.get_changed_fields.assert_called_once_with(form)
+        mixin.update_object.assert_called_once_with(
+            {'title': 'New title'}, None)
+        self.assertFalse(form.populate_obj.called)
+        self.assertFalse(mixin.object.save.called)
+        mixin.invalidate_object_cache.assert_called_once_with()
+        mixin.invalidate_response_cache.assert_called_once_with()
+        mixin.invalidate_count_cache.assert_called_once_with()
+
+    @patch('flask_views.db.mongoengine.edit.super', create=True)
+    def test_form_valid_partial_update_unchanged(self, super_mock):
+        """
+        Test :py:meth:`.ModelFormMixin.form_valid` without changed fields.
+        """
+        super_class = Mock()
+        super_class.form_valid.return_value = 'form-valid'
+        super_mock.return_value = super_class
+
+        mixin = ModelFormMixin()
+        mixin.partial_update = True
+        mixin.object = Mock()
+        mixin.get_changed_fields = Mock(return_value={})
+        mixin.update_object = Mock()
+        mixin.invalidate_object_cache = Mock()
+
+        self.assertEqual('form-valid', mixin.form_valid(Mock()))
+        self.assertFalse(mixin.update_object.called)
+        self.assertFalse(mixin.object.save.called)
+        self.assertFalse(mixin.invalidate_object_cache.called)
+
+    def test_update_object_condition(self):
+        """
+        Test :py:meth:`.ModelFormMixin.update_object` with a condition.
+        """
+        mixin = ModelFormMixin()
+        mixin.document_class = Mock()
+        mixin.document_class._fields = {'title': Mock()}
+        mixin.object = Mock(pk=1)
+        mixin.get_update = Mock(return_value={'$set': {'title': 'Title'}})
+        mixin.get_raw_query = Mock(return_value={'v': 3})
+        collection = mixin.document_class._get_collection.return_value
+        collection.update_one.return_value.matched_count = 0
+
+        self.assertFalse(
+            mixin.update_object({'title': 'Title'}, {'version': 3}))
+        mixin.get_raw_query.assert_called_once_with({'version': 3})
+        collection.update_one.assert_called_once_with(
+            {'_id': 1, 'v': 3}, {'$set': {'title': 'Title'}})
+
+        collection.update_one.return_value.matched_count = 1
+        self.assertTrue(
+            mixin.update_object({'title': 'Title'}, {'version': 3}))
+
+    def test_get_configuration_errors(self):
+        """
+        Test :py:meth:`.ModelFormMixin.get_configuration_errors`.
+        """
+        class TestMixin(ModelFormMixin):
+            optimistic_locking = True
+
+        self.assertEqual(
+            ['optimistic_locking requires version_field to be set.'],
+            TestMixin.get_configuration_errors(False)
+        )
+
+        TestMixin.version_field = 'version'
+        self.assertEqual([], TestMixin.get_configuration_errors(False))
+
+    def test_handle_conflict(self):
+        """
+        Test :py:meth:`.ModelFormMixin.handle_conflict`.
+        """
+        form = Mock()
+        form.version.errors = []
+
+        mixin = ModelFormMixin()
+        mixin.conflict_message = 'Changed by someone else.'
+        mixin.form_invalid = Mock(return_value='form-invalid')
+
+        self.assertEqual('form-invalid', mixin.handle_conflict(form))
+        self.assertEqual(['Changed by someone else.'], form.version.errors)
+        mixin.form_invalid.assert_called_once_with(form)
+
+    @patch('flask_views.db.mongoengine.edit.abort')
+    def test_handle_conflict_abort(self, abort):
+        """
+        Test :py:meth:`.ModelFormMixin.handle_conflict` without message.
+        """
+        abort.side_effect = Exception
+
+        mixin = ModelFormMixin()
+        self.assertRaises(Exception, mixin.handle_conflict, Mock())
+        abort.assert_called_once_with(409)
+
+        abort.reset_mock()
+        mixin.conflict_message = 'Changed by someone else.'
+        self.assertRaises(Exception, mixin.handle_conflict, object())
+        abort.assert_called_once_with(409)
+
+    def test_save_object(self):
+        """
+        Test :py:meth:`.ModelFormMixin.save_object`.
+        """
+        form = Mock()
+        mixin = ModelFormMixin()
+        mixin.object = Mock()
+
+        self.assertTrue(mixin.save_object(form))
+        form.populate_obj.assert_called_once_with(mixin.object)
+        mixin.object.save.assert_called_once_with()
+
+    def test_save_object_optimistic_locking(self):
+        """
+        Test :py:meth:`.ModelFormMixin.save_object` with optimistic locking.
+        """
+        form = Mock()
+        mixin = ModelFormMixin()
+        mixin.optimistic_locking = True
+        mixin.version_field = 'version'
+        mixin.object = Mock(version=3)
+        mixin.get_client_version = Mock(return_value=3)
+
+        self.assertTrue(mixin.save_object(form))
+        form.populate_obj.assert_called_once_with(mixin.object)
+        self.assertEqual(4, mixin.object.version)
+        mixin.object.save.assert_called_once_with(
+            save_condition={'version': 3})
+
+    @patch('flask_views.db.mongoengine.edit.SaveConditionError', ValueError)
+    def test_save_object_conflict(self):
+        """
+        Test :py:meth:`.ModelFormMixin.save_object` with a version conflict.
+        """
+        form = Mock()
+        mixin = ModelFormMixin()
+        mixin.optimistic_locking = True
+        mixin.version_field = 'version'
+        mixin.object = Mock()
+        mixin.object.save.side_effect = ValueError
+        mixin.get_client_version = Mock(return_value=3)
+
+        self.assertFalse(mixin.save_object(form))
+
+        mixin.object.save.reset_mock()
+        mixin.get_client_version.return_value = None
+        self.assertFalse(mixin.save_object(form))
+        self.assertFalse(mixin.object.save.called)
+
+    def test_update_changed_fields(self):
+        """
+        Test :py:meth:`.ModelFormMixin.update_changed_fields`.
+        """
+        mixin = ModelFormMixin()
+        mixin.update_object = Mock(return_value=True)
+
+        self.assertTrue(mixin.update_changed_fields({'title': 'Title'}))
+        mixin.update_object.assert_called_once_with({'title': 'Title'}, None)
+
+    def test_update_changed_fields_optimistic_locking(self):
+        """
+        Test :py:meth:`.ModelFormMixin.update_changed_fields` with locking.
+        """
+        mixin = ModelFormMixin()
+        mixin.optimistic_locking = True
+        mixin.version_field = 'version'
+        mixin.get_client_version = Mock(return_value=3)
+        mixin.update_object = Mock(return_value=False)
+
+        self.assertFalse(mixin.update_changed_fields({'title': 'Title'}))
+        mixin.update_object.assert_called_once_with(
+            {'title': 'Title', 'version': 4}, {'version': 3})
+
+        mixin.update_object.reset_mock()
+        mixin.get_client_version.return_value = None
+        self.assertFalse(mixin.update_changed_fields({'title': 'Title'}))
+        self.assertFalse(mixin.update_object.called)
+
+    def test_form_valid_conflict(self):
+        """
+        Test :py:meth:`.ModelFormMixin.form_valid` with a version conflict.
+        """
+        form = Mock()
+        mixin = ModelFormMixin()
+        mixin.object = Mock()
+        mixin.save_object = Mock(return_value=False)
+        mixin.handle_conflict = Mock(return_value='conflict')
+        mixin.invalidate_response_cache = Mock()
+        mixin.invalidate_count_cache = Mock()
+
+        self.assertEqual('conflict', mixin.form_valid(form))
+        mixin.save_object.assert_called_once_with(form)
+        mixin.handle_conflict.assert_called_once_with(form)
+        self.assertFalse(mixin.invalidate_response_cache.called)
+        self.assertFalse(mixin.invalidate_count_cache.called)
+
+        mixin.partial_update = True
+        mixin.get_changed_fields = Mock(return_value={'title': 'Title'})
+        mixin.update_changed_fields = Mock(return_value=False)
+        self.assertEqual('conflict', mixin.form_valid(form))
+        mixin.update_changed_fields.assert_called_once_with(
+            {'title': 'Title'})
+
     @patch('flask_views.db.mongoengine.edit.super', create=True)
     def test_get_context_data(self, super_mock):
         """
@@ -196,6 +602,243 @@ class BaseUpdateViewTestCase(unittest.TestCase):
         self.assertEqual('object', view.object)
         super_class.post.assert_called_once_with('something', foo='bar')
 
+    @patch('flask_views.db.mongoengine.edit.super', create=True)
+    def test_post_atomic_update(self, super_mock):
+        """
+        Test :py:meth:`.BaseUpdateView.post` with atomic updates.
+        """
+        super_class = Mock()
+        super_class.post.return_value = 'post-response'
+        super_mock.return_value = super_class
+
+        view = BaseUpdateView()
+        view.atomic_update = True
+        view.get_object = Mock()
+
+        self.assertEqual('post-response', view.post())
+        self.assertEqual(None, view.object)
+        self.assertFalse(view.get_object.called)
+
+    def _form_field(self, name, data, prefix=''):
+        form_field = Mock(data=data, short_name=name)
+        form_field.name = prefix + name
+        return form_field
+
+    @patch('flask_views.db.mongoengine.edit.ReturnDocument')
+    def test_find_and_update_object(self, ReturnDocument):
+        """
+        Test :py:meth:`.BaseUpdateView.find_and_update_object`.
+        """
+        view = BaseUpdateView()
+        view.document_class = Mock()
+        view.document_class._fields = {'title': Mock()}
+        view.get_update = Mock(return_value={'$set': {'title': 'Title'}})
+        view.get_lookup_args = Mock(return_value={'id': 1})
+        view.get_queryset = Mock()
+        queryset = view.get_queryset.return_value.filter.return_value
+        queryset._query = {'_id': 1}
+        queryset._loaded_fields.as_dict.return_value = {}
+        collection = view.document_class._get_collection.return_value
+        collection.find_one_and_update.return_value = {'_id': 1}
+
+        form = [
+            self._form_field('title', 'Title', prefix='post-'),
+            self._form_field('captcha', 'foo', prefix='post-'),
+        ]
+
+        self.assertEqual(
+            view.document_class._from_son.return_value,
+            view.find_and_update_object(form)
+        )
+        view.get_update.assert_called_once_with({'title': 'Title'})
+        view.get_queryset.return_value.filter.assert_called_once_with(id=1)
+        collection.find_one_and_update.assert_called_once_with(
+            {'_id': 1},
+            {'$set': {'title': 'Title'}},
+            projection=None,
+            return_document=ReturnDocument.AFTER,
+        )
+        view.document_class._from_son.assert_called_once_with({'_id': 1})
+
+    @patch('flask_views.db.mongoengine.edit.ReturnDocument')
+    def test_find_and_update_object_optimistic_locking(self, ReturnDocument):
+        """
+        Test :py:meth:`.BaseUpdateView.find_and_update_object` with locking.
+        """
+        view = BaseUpdateView()
+        view.optimistic_locking = True
+        view.version_field = 'version'
+        view.document_class = Mock()
+        view.document_class._fields = {}
+        view.get_client_version = Mock(return_value=3)
+        view.get_raw_query = Mock(return_value={'v': 3})
+        view.get_update = Mock(return_value={'$set': {'v': 4}})
+        view.get_lookup_args = Mock(return_value={'id': 1})
+        view.get_queryset = Mock()
+        queryset = view.get_queryset.return_value.filter.return_value
+        queryset._query = {'_id': 1}
+        queryset._loaded_fields.as_dict.return_value = {}
+        collection = view.document_class._get_collection.return_value
+        collection.find_one_and_update.return_value = None
+        collection.find_one.return_value = {'_id': 1}
+
+        self.assertEqual(None, view.find_and_update_object([]))
+        view.get_update.assert_called_once_with({'version': 4})
+        view.get_raw_query.assert_called_once_with({'version': 3})
+        collection.find_one_and_update.assert_called_once_with(
+            {'_id': 1, 'v': 3},
+            {'$set': {'v': 4}},
+            projection=None,
+            return_document=ReturnDocument.AFTER,
+        )
+        collection.find_one.assert_called_once_with({'_id': 1}, {'_id': 1})
+
+        collection.find_one_and_update.reset_mock()
+        view.get_client_version.return_value = None
+        self.assertEqual(None, view.find_and_update_object([]))
+        self.assertFalse(collection.find_one_and_update.called)
+
+    @patch('flask_views.db.mongoengine.edit.abort')
+    def test_find_and_update_object_optimistic_locking_not_found(
+            self, abort):
+        """
+        Test :py:meth:`.BaseUpdateView.find_and_update_object` 404 with lock.
+        """
+        abort.side_effect = Exception
+
+        view = BaseUpdateView()
+        view.optimistic_locking = True
+        view.version_field = 'version'
+        view.document_class = Mock()
+        view.document_class._fields = {}
+        view.get_client_version = Mock(return_value=3)
+        view.get_raw_query = Mock(return_value={'v': 3})
+        view.get_update = Mock(return_value={})
+        view.get_lookup_args = Mock(return_value={})
+        view.get_queryset = Mock()
+        queryset = view.get_queryset.return_value.filter.return_value
+        queryset._query = {'_id': 1}
+        collection = view.document_class._get_collection.return_value
+        collection.find_one_and_update.return_value = None
+        collection.find_one.return_value = None
+
+        self.assertRaises(Exception, view.find_and_update_object, [])
+        abort.assert_called_once_with(404)
+
+    @patch('flask_views.db.mongoengine.edit.abort')
+    def test_find_and_update_object_not_found(self, abort):
+        """
+        Test :py:meth:`.BaseUpdateView.find_and_update_object` without match.
+        """
+        abort.side_effect = Exception
+
+        view = BaseUpdateView()
+        view.document_class = Mock()
+        view.document_class._fields = {}
+        view.get_update = Mock(return_value={})
+        view.get_lookup_args = Mock(return_value={'id': 1})
+        view.get_queryset = Mock()
+        collection = view.document_class._get_collection.return_value
+        collection.find_one_and_update.return_value = None
+
+        self.assertRaises(Exception, view.find_and_update_object, [])
+        abort.assert_called_once_with(404)
+
+    @patch('flask_views.db.mongoengine.edit.super', create=True)
+    def test_write_object(self, super_mock):
+        """
+        Test :py:meth:`.BaseUpdateView.write_object` without atomic updates.
+        """
+        super_class = Mock()
+        super_class.write_object.return_value = True
+        super_mock.return_value = super_class
+
+        view = BaseUpdateView()
+        view.find_and_update_object = Mock()
+
+        self.assertTrue(view.write_object('form'))
+        super_mock.assert_called_once_with(BaseUpdateView, view)
+        super_class.write_object.assert_called_once_with('form')
+        self.assertFalse(view.find_and_update_object.called)
+
+    def test_write_object_atomic_update(self):
+        """
+        Test :py:meth:`.BaseUpdateView.write_object` with atomic updates.
+        """
+        view = BaseUpdateView()
+        view.atomic_update = True
+        view.find_and_update_object = Mock(return_value='object')
+
+        self.assertTrue(view.write_object('form'))
+        view.find_and_update_object.assert_called_once_with('form')
+        self.assertEqual('object', view.object)
+
+    @patch('flask_views.db.mongoengine.edit.super', create=True)
+    def test_form_valid_atomic_update(self, super_mock):
+        """
+        Test :py:meth:`.BaseUpdateView.form_valid` with atomic updates.
+        """
+        super_class = Mock()
+        super_class.form_valid.return_value = 'form-valid'
+        super_mock.return_value = super_class
+
+        view = BaseUpdateView()
+        view.atomic_update = True
+        view.find_and_update_object = Mock(return_value='object')
+        view.invalidate_object_cache = Mock()
+        view.invalidate_not_found_cache = Mock()
+        view.invalidate_response_cache = Mock()
+        view.invalidate_count_cache = Mock()
+
+        self.assertEqual('form-valid', view.form_valid('form'))
+        self.assertEqual('object', view.object)
+        view.invalidate_object_cache.assert_called_once_with()
+        view.invalidate_not_found_cache.assert_called_once_with()
+        view.invalidate_response_cache.assert_called_once_with()
+        view.invalidate_count_cache.assert_called_once_with()
+        super_mock.assert_called_once_with(ModelFormMixin, view)
+        super_class.form_valid.assert_called_once_with('form')
+
+    @patch('flask_views.db.mongoengine.edit.super', create=True)
+    def test_form_invalid_atomic_update(self, super_mock):
+        """
+        Test :py:meth:`.BaseUpdateView.form_invalid` with atomic updates.
+        """
+        super_class = Mock()
+        super_class.form_invalid.return_value = 'form-invalid'
+        super_mock.return_value = super_class
+
+        view = BaseUpdateView()
+        view.atomic_update = True
+        view.object = None
+        view.get_object = Mock(return_value='object')
+
+        self.assertEqual('form-invalid', view.form_invalid('form'))
+        view.get_object.assert_called_once_with()
+        self.assertEqual('object', view.object)
+        super_mock.assert_called_once_with(BaseUpdateView, view)
+        super_class.form_invalid.assert_called_once_with('form')
+
+        view.get_object.reset_mock()
+        view.atomic_update = False
+        view.object = None
+        view.form_invalid('form')
+        self.assertFalse(view.get_object.called)
+
+    def test_form_valid_atomic_update_conflict(self):
+        """
+        Test :py:meth:`.BaseUpdateView.form_valid` with a version conflict.
+        """
+        view = BaseUpdateView()
+        view.atomic_update = True
+        view.find_and_update_object = Mock(return_value=None)
+        view.handle_conflict = Mock(return_value='conflict')
+        view.invalidate_object_cache = Mock()
+
+        self.assertEqual('conflict', view.form_valid('form'))
+        view.handle_conflict.assert_called_once_with('form')
+        self.assertFalse(view.invalidate_object_cache.called)
+
 
 class UpdateViewTestCase(unittest.TestCase):
     """
@@ -210,26 +853,140 @@ class DeletionMixinTestCase(unittest.TestCase):
     """
     Tests for :py:class:`.DeletionMixin`.
     """
-    def test_get_success_url(self):
+    @patch('flask_views.db.mongoengine.edit.invalidate_document_tag')
+    def test_invalidate_count_cache(self, invalidate_document_tag):
         """
-        Test :py:meth:`.DeletionMixin.get_success_url`.
+        Test :py:meth:`.DeletionMixin.invalidate_count_cache`.
         """
         mixin = DeletionMixin()
-        mixin.success_url = 'success-url'
-        self.assertEqual('success-url', mixin.get_success_url())
+        mixin.document_class = Mock()
+        self.assertIs(MultipleObjectMixin.count_cache, mixin.count_cache)
 
-    @patch('flask_views.db.mongoengine.edit.redirect')
-    def test_delete(self, redirect):
+        mixin.invalidate_count_cache()
+        invalidate_document_tag.assert_called_once_with(
+            mixin.count_cache, mixin.document_class)
+
+    def test_get_configuration_errors(self):
         """
-        Test :py:meth:`.DeletionMixin.delete`.
+        Test :py:meth:`.DeletionMixin.get_configuration_errors`.
         """
-        mixin = DeletionMixin()
-        mixin.object = Mock()
-        mixin.get_success_url = Mock(return_value='success-url')
+        class TestMixin(DeletionMixin):
+            optimistic_locking = True
 
-        self.assertEqual(redirect.return_value, mixin.delete())
-        mixin.object.delete.assert_called_once_with()
-        redirect.assert_called_once_with('success-url')
+        self.assertEqual(
+            ['optimistic_locking requires version_field to be set.'],
+            TestMixin.get_configuration_errors(False)
+        )
+
+    def test_delete_object_with_version(self):
+        """
+        Test :py:meth:`.DeletionMixin.delete_object_with_version`.
+        """
+        mixin = DeletionMixin()
+        mixin.version_field = 'version'
+        mixin.object = Mock(pk=1)
+        mixin.document_class = Mock()
+        mixin.get_client_version = Mock(return_value=3)
+        mixin.get_raw_query = Mock(return_value={'v': 3})
+        collection = mixin.document_class._get_collection.return_value
+        collection.delete_one.return_value.deleted_count = 1
+
+        mixin.delete_object_with_version()
+        mixin.get_raw_query.assert_called_once_with({'version': 3})
+        collection.delete_one.assert_called_once_with({'_id': 1, 'v': 3})
+
+    @patch('flask_views.db.mongoengine.edit.abort')
+    def test_delete_object_with_version_conflict(self, abort):
+        """
+        Test :py:meth:`.DeletionMixin.delete_object_with_version` conflict.
+        """
+        abort.side_effect = Exception
+
+        mixin = DeletionMixin()
+        mixin.version_field = 'version'
+        mixin.object = Mock(pk=1)
+        mixin.document_class = Mock()
+        mixin.get_client_version = Mock(return_value=3)
+        mixin.get_raw_query = Mock(return_value={'v': 3})
+        collection = mixin.document_class._get_collection.return_value
+        collection.delete_one.return_value.deleted_count = 0
+
+        self.assertRaises(Exception, mixin.delete_object_with_version)
+        abort.assert_called_once_with(409)
+
+        abort.reset_mock()
+        collection.delete_one.reset_mock()
+        mixin.get_client_version.return_value = None
+        self.assertRaises(Exception, mixin.delete_object_with_version)
+        abort.assert_called_once_with(409)
+        self.assertFalse(collection.delete_one.called)
+
+    @patch('flask_views.db.mongoengine.edit.redirect')
+    def test_delete_optimistic_locking(self, redirect):
+        """
+        Test :py:meth:`.DeletionMixin.delete` with optimistic locking.
+        """
+        mixin = DeletionMixin()
+        mixin.optimistic_locking = True
+        mixin.object = Mock()
+        mixin.get_success_url = Mock(return_value='success-url')
+        mixin.delete_object_with_version = Mock()
+        mixin.invalidate_object_cache = Mock()
+        mixin.invalidate_response_cache = Mock()
+        mixin.invalidate_count_cache = Mock()
+
+        self.assertEqual(redirect.return_value, mixin.delete())
+        mixin.delete_object_with_version.assert_called_once_with()
+        self.assertFalse(mixin.object.delete.called)
+
+    def test_get_success_url(self):
+        """
+        Test :py:meth:`.DeletionMixin.get_success_url`.
+        """
+        mixin = DeletionMixin()
+        mixin.success_url = 'success-url'
+        self.assertEqual('success-url', mixin.get_success_url())
+
+    @patch('flask_views.db.mongoengine.edit.redirect')
+    def test_delete(self, redirect):
+        """
+        Test :py:meth:`.DeletionMixin.delete`.
+        """
+        mixin = DeletionMixin()
+        mixin.object = Mock()
+        mixin.get_success_url = Mock(return_value='success-url')
+
+        self.assertEqual(redirect.return_value, mixin.delete())
+        mixin.object.delete.assert_called_once_with()
+        redirect.assert_called_once_with('success-url')
+
+    @patch('flask_views.db.mongoengine.edit.redirect')
+    def test_delete_invalidates_object_cache(self, redirect):
+        """
+        Test :py:meth:`.DeletionMixin.delete` invalidating the object cache.
+        """
+        mixin = DeletionMixin()
+        mixin.object = Mock()
+        mixin.get_success_url = Mock(return_value='success-url')
+        mixin.invalidate_object_cache = Mock()
+
+        mixin.delete()
+        mixin.invalidate_object_cache.assert_called_once_with()
+
+    @patch('flask_views.db.mongoengine.edit.redirect')
+    def test_delete_invalidates_response_cache(self, redirect):
+        """
+        Test :py:meth:`.DeletionMixin.delete` invalidating the responses.
+        """
+        mixin = DeletionMixin()
+        mixin.object = Mock()
+        mixin.get_success_url = Mock(return_value='success-url')
+        mixin.invalidate_response_cache = Mock()
+        mixin.invalidate_count_cache = Mock()
+
+        mixin.delete()
+        mixin.invalidate_response_cache.assert_called_once_with()
+        mixin.invalidate_count_cache.assert_called_once_with()
 
 
 class BaseDeleteViewTestCase(unittest.TestCase):
@@ -253,3 +1010,699 @@ class BaseDeleteViewTestCase(unittest.TestCase):
         )
         self.assertEqual(view.get_object.return_value, view.object)
         super_class.delete.assert_called_once_with('foo', bar='foo')
+
+
+class BulkFormMixinTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.BulkFormMixin`.
+    """
+    def test_inherited_classes(self):
+        """
+        Test that this class inherits from the right classes.
+        """
+        self.assertIn(ModelFormMixin, BulkFormMixin.mro())
+
+    def test_get_configuration_errors(self):
+        """
+        Test :py:meth:`.BulkFormMixin.get_configuration_errors`.
+        """
+        self.assertEqual([], BulkFormMixin.get_configuration_errors(False))
+        self.assertEqual(
+            ['get_write_operation is not implemented.'],
+            BulkFormMixin.get_configuration_errors(True)
+        )
+        self.assertEqual(
+            [], BaseBulkCreateView.get_configuration_errors(True))
+
+    @patch('flask_views.db.mongoengine.edit.request')
+    def test_get_item_data_json(self, request):
+        """
+        Test :py:meth:`.BulkFormMixin.get_item_data` with JSON data.
+        """
+        request.is_json = True
+        request.get_json.return_value = [
+            {'title': 'First', 'tags': ['a', 'b']},
+            {'title': 'Second'},
+        ]
+
+        items = BulkFormMixin().get_item_data()
+
+        self.assertEqual([0, 1], [index for index, item in items])
+        self.assertEqual('First', items[0][1]['title'])
+        self.assertEqual(['a', 'b'], items[0][1].getlist('tags'))
+        self.assertEqual('Second', items[1][1]['title'])
+        request.get_json.assert_called_once_with(silent=True)
+
+    @patch('flask_views.db.mongoengine.edit.abort')
+    @patch('flask_views.db.mongoengine.edit.request')
+    def test_get_item_data_json_invalid(self, request, abort):
+        """
+        Test :py:meth:`.BulkFormMixin.get_item_data` with invalid JSON data.
+        """
+        abort.side_effect = Exception
+        request.is_json = True
+
+        for data in [None, {'title': 'First'}, ['First']]:
+            abort.reset_mock()
+            request.get_json.return_value = data
+            self.assertRaises(Exception, BulkFormMixin().get_item_data)
+            abort.assert_called_once_with(400)
+
+    @patch('flask_views.db.mongoengine.edit.request')
+    def test_get_item_data_form(self, request):
+        """
+        Test :py:meth:`.BulkFormMixin.get_item_data` with form data.
+        """
+        request.is_json = False
+        request.form = MultiDict([
+            ('items-10-title', 'Third'),
+            ('items-0-title', 'First'),
+            ('items-0-tags', 'a'),
+            ('items-0-tags', 'b'),
+            ('items-2-title', 'Second'),
+            ('other-1-title', 'Other'),
+            ('csrf_token', 'token'),
+        ])
+
+        items = BulkFormMixin().get_item_data()
+
+        self.assertEqual([0, 2, 10], [index for index, item in items])
+        self.assertEqual(
+            ['First', 'Second', 'Third'],
+            [item['title'] for index, item in items]
+        )
+        self.assertEqual(['a', 'b'], items[0][1].getlist('tags'))
+        self.assertEqual(['title'], list(items[1][1].keys()))
+
+    def test_get_item_form(self):
+        """
+        Test :py:meth:`.BulkFormMixin.get_item_form`.
+        """
+        mixin = BulkFormMixin()
+        mixin.form_class = Mock()
+        mixin.initial = {'foo': 'bar'}
+
+        self.assertEqual(
+            mixin.form_class.return_value, mixin.get_item_form('formdata'))
+        mixin.form_class.assert_called_once_with(
+            formdata='formdata', foo='bar')
+
+    def test_get_validation_errors(self):
+        """
+        Test :py:meth:`.BulkFormMixin.get_validation_errors`.
+        """
+        mixin = BulkFormMixin()
+
+        self.assertEqual(
+            {'title': ['Invalid title']},
+            mixin.get_validation_errors(
+                ValidationError('Invalid title', field_name='title'))
+        )
+        self.assertEqual(
+            {'__all__': ['Invalid']},
+            mixin.get_validation_errors(ValidationError('Invalid'))
+        )
+        self.assertEqual(
+            {'title': ['Invalid title'], 'author': {'name': 'Invalid name'}},
+            mixin.get_validation_errors(ValidationError('Invalid', errors={
+                'title': ValidationError('Invalid title'),
+                'author': ValidationError('Invalid', errors={
+                    'name': ValidationError('Invalid name'),
+                }),
+            }))
+        )
+
+    def test_write_operations(self):
+        """
+        Test :py:meth:`.BulkFormMixin.write_operations`.
+        """
+        mixin = BulkFormMixin()
+        mixin.document_class = Mock()
+        collection = mixin.document_class._get_collection.return_value
+
+        self.assertEqual(
+            {'nInserted': 0, 'nMatched': 0, 'nModified': 0, 'writeErrors': []},
+            mixin.write_operations([])
+        )
+        self.assertFalse(collection.bulk_write.called)
+
+        self.assertEqual(
+            collection.bulk_write.return_value.bulk_api_result,
+            mixin.write_operations(['operation'])
+        )
+        collection.bulk_write.assert_called_once_with(
+            ['operation'], ordered=False)
+
+    @patch('flask_views.db.mongoengine.edit.BulkWriteError', ValueError)
+    def test_write_operations_error(self):
+        """
+        Test :py:meth:`.BulkFormMixin.write_operations` with write errors.
+        """
+        error = ValueError()
+        error.details = {'writeErrors': [{'index': 0}]}
+
+        mixin = BulkFormMixin()
+        mixin.document_class = Mock()
+        collection = mixin.document_class._get_collection.return_value
+        collection.bulk_write.side_effect = error
+
+        self.assertEqual(error.details, mixin.write_operations(['operation']))
+
+    @patch('flask_views.db.mongoengine.edit.invalidate_object_tags')
+    def test_post(self, invalidate_object_tags):
+        """
+        Test :py:meth:`.BulkFormMixin.post`.
+        """
+        valid_form = Mock()
+        valid_form.validate.return_value = True
+        invalid_form = Mock()
+        invalid_form.validate.return_value = False
+        invalid_form.errors = {'title': ['This field is required.']}
+
+        mixin = BulkFormMixin()
+        mixin.get_item_data = Mock(return_value=[
+            (0, 'a'), (1, 'b'), (2, 'c'), (5, 'd'), (7, 'e')])
+        mixin.get_item_form = Mock(side_effect=[
+            valid_form, invalid_form, valid_form, valid_form, valid_form])
+        mixin.get_write_operation = Mock(side_effect=[
+            'operation-a',
+            ValidationError('Invalid title', field_name='title'),
+            None,
+            'operation-e',
+        ])
+        mixin.write_operations = Mock(return_value={
+            'writeErrors': [{'index': 1, 'errmsg': 'Duplicate key'}],
+        })
+        mixin.get_result_data = Mock(return_value={'created': 1})
+        mixin.get_matched_ids = Mock(return_value=['id-a'])
+        mixin.object_cache = Mock()
+        mixin.document_class = Mock()
+        mixin.invalidate_not_found_cache = Mock()
+        mixin.invalidate_response_cache = Mock()
+        mixin.invalidate_count_cache = Mock()
+        mixin.render_to_response = Mock()
+
+        self.assertEqual(mixin.render_to_response.return_value, mixin.post())
+        self.assertEqual(None, mixin.object)
+        mixin.get_write_operation.assert_any_call(valid_form, 'a')
+        mixin.get_matched_ids.assert_called_once_with(
+            ['operation-a', 'operation-e'])
+        mixin.write_operations.assert_called_once_with(
+            ['operation-a', 'operation-e'])
+        invalidate_object_tags.assert_called_once_with(
+            mixin.object_cache, mixin.document_class, ['id-a'])
+        mixin.invalidate_not_found_cache.assert_called_once_with()
+        mixin.invalidate_response_cache.assert_called_once_with()
+        mixin.invalidate_count_cache.assert_called_once_with()
+        mixin.render_to_response.assert_called_once_with({
+            'created': 1,
+            'errors': [
+                {'index': 1, 'errors': {'title': ['This field is required.']}},
+                {'index': 2, 'errors': {'title': ['Invalid title']}},
+                {'index': 7, 'errors': {'__all__': ['Duplicate key']}},
+            ],
+        })
+
+    def test_post_nothing_written(self):
+        """
+        Test :py:meth:`.BulkFormMixin.post` without written items.
+        """
+        mixin = BulkFormMixin()
+        mixin.get_item_data = Mock(return_value=[])
+        mixin.write_operations = Mock(return_value={'writeErrors': []})
+        mixin.invalidate_not_found_cache = Mock()
+        mixin.invalidate_response_cache = Mock()
+        mixin.invalidate_count_cache = Mock()
+        mixin.render_to_response = Mock()
+
+        mixin.post()
+        mixin.write_operations.assert_called_once_with([])
+        self.assertFalse(mixin.invalidate_not_found_cache.called)
+        self.assertFalse(mixin.invalidate_response_cache.called)
+        self.assertFalse(mixin.invalidate_count_cache.called)
+        mixin.render_to_response.assert_called_once_with({'errors': []})
+
+    @patch('flask_views.db.mongoengine.edit.abort')
+    def test_post_too_many_items(self, abort):
+        """
+        Test :py:meth:`.BulkFormMixin.post` with too many items.
+        """
+        abort.side_effect = Exception
+
+        mixin = BulkFormMixin()
+        mixin.max_items = 2
+        mixin.get_item_data = Mock(return_value=['a', 'b', 'c'])
+        mixin.get_item_form = Mock()
+
+        self.assertRaises(Exception, mixin.post)
+        abort.assert_called_once_with(413)
+        self.assertFalse(mixin.get_item_form.called)
+
+
+class BaseBulkCreateViewTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.BaseBulkCreateView`.
+    """
+    def test_inherited_classes(self):
+        """
+        Test that this class inherits from the right classes.
+        """
+        for class_obj in [BulkFormMixin, View]:
+            self.assertIn(class_obj, BaseBulkCreateView.mro())
+
+    @patch('flask_views.db.mongoengine.edit.InsertOne')
+    def test_get_write_operation(self, InsertOne):
+        """
+        Test :py:meth:`.BaseBulkCreateView.get_write_operation`.
+        """
+        form = Mock()
+        view = BaseBulkCreateView()
+        view.document_class = Mock()
+        document = view.document_class.return_value
+
+        self.assertEqual(
+            InsertOne.return_value, view.get_write_operation(form, 'data'))
+        form.populate_obj.assert_called_once_with(document)
+        document.validate.assert_called_once_with()
+        InsertOne.assert_called_once_with(document.to_mongo.return_value)
+
+    def test_get_result_data(self):
+        """
+        Test :py:meth:`.BaseBulkCreateView.get_result_data`.
+        """
+        self.assertEqual(
+            {'created': 2},
+            BaseBulkCreateView().get_result_data({'nInserted': 2})
+        )
+
+
+class BulkCreateViewTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.BulkCreateView`.
+    """
+    def test_inherited_classes(self):
+        """
+        Test that this class inherits from the right classes.
+        """
+        for class_obj in [JSONResponseMixin, BaseBulkCreateView]:
+            self.assertIn(class_obj, BulkCreateView.mro())
+
+
+class BaseBulkUpdateViewTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.BaseBulkUpdateView`.
+    """
+    def test_inherited_classes(self):
+        """
+        Test that this class inherits from the right classes.
+        """
+        for class_obj in [BulkFormMixin, View]:
+            self.assertIn(class_obj, BaseBulkUpdateView.mro())
+
+    @patch('flask_views.db.mongoengine.edit.UpdateOne')
+    def test_get_write_operation(self, UpdateOne):
+        """
+        Test :py:meth:`.BaseBulkUpdateView.get_write_operation`.
+        """
+        form = [
+            Mock(data='1', short_name='id'),
+            Mock(data='New title', short_name='title'),
+            Mock(data='', short_name='body'),
+        ]
+
+        view = BaseBulkUpdateView()
+        view.document_class = Mock()
+        view.document_class._fields = {'id': None, 'title': None, 'body': None}
+        view.get_queryset = Mock()
+        view.get_update = Mock(return_value={'$set': {'title': 'New title'}})
+        queryset = view.get_queryset.return_value.filter.return_value
+
+        self.assertEqual(
+            UpdateOne.return_value,
+            view.get_write_operation(
+                form, MultiDict({'id': '1', 'title': 'New title'}))
+        )
+        view.get_queryset.return_value.filter.assert_called_once_with(id='1')
+        view.get_update.assert_called_once_with({'title': 'New title'})
+        UpdateOne.assert_called_once_with(
+            queryset._query, {'$set': {'title': 'New title'}})
+
+        view.get_update.reset_mock()
+        view.partial_update = False
+        view.get_write_operation(
+            form, MultiDict({'id': '1', 'title': 'New title'}))
+        view.get_update.assert_called_once_with(
+            {'title': 'New title', 'body': ''})
+
+    def test_get_configuration_errors(self):
+        """
+        Test :py:meth:`.BaseBulkUpdateView.get_configuration_errors`.
+        """
+        class PostBulkUpdateView(BaseBulkUpdateView):
+            pass
+
+        self.assertEqual(
+            [], PostBulkUpdateView.get_configuration_errors(True))
+        PostBulkUpdateView.optimistic_locking = True
+        self.assertEqual(
+            ['optimistic_locking is not supported by bulk updates.'],
+            PostBulkUpdateView.get_configuration_errors(True)
+        )
+
+    def test_get_write_operation_without_fields(self):
+        """
+        Test :py:meth:`.BaseBulkUpdateView.get_write_operation` without
+        fields to update.
+        """
+        view = BaseBulkUpdateView()
+        view.document_class = Mock()
+        view.document_class._fields = {'id': None}
+        view.get_queryset = Mock()
+
+        self.assertEqual(
+            None, view.get_write_operation([], MultiDict({'id': '1'})))
+        self.assertFalse(view.get_queryset.called)
+
+    def test_get_write_operation_without_lookup_value(self):
+        """
+        Test :py:meth:`.BaseBulkUpdateView.get_write_operation` without
+        lookup value.
+        """
+        view = BaseBulkUpdateView()
+
+        with self.assertRaises(ValidationError) as cm:
+            view.get_write_operation([], MultiDict({'title': 'New title'}))
+        self.assertEqual('id', cm.exception.field_name)
+
+    def test_get_matched_ids(self):
+        """
+        Test :py:meth:`.BaseBulkUpdateView.get_matched_ids`.
+        """
+        view = BaseBulkUpdateView()
+        view.document_class = Mock()
+        collection = view.document_class._get_collection.return_value
+        collection.find.return_value = [{'_id': 1}, {'_id': 2}]
+        operations = [UpdateOne({'slug': 'a'}, {}), UpdateOne({'_id': 2}, {})]
+
+        self.assertEqual([], view.get_matched_ids(operations))
+        self.assertFalse(collection.find.called)
+
+        view.object_cache = Mock()
+        self.assertEqual([], view.get_matched_ids([]))
+        self.assertEqual([1, 2], view.get_matched_ids(operations))
+        collection.find.assert_called_once_with(
+            {'$or': [{'slug': 'a'}, {'_id': 2}]}, {'_id': 1})
+
+    def test_get_result_data(self):
+        """
+        Test :py:meth:`.BaseBulkUpdateView.get_result_data`.
+        """
+        self.assertEqual(
+            {'matched': 2, 'modified': 1},
+            BaseBulkUpdateView().get_result_data(
+                {'nMatched': 2, 'nModified': 1})
+        )
+
+
+class BulkUpdateViewTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.BulkUpdateView`.
+    """
+    def test_inherited_classes(self):
+        """
+        Test that this class inherits from the right classes.
+        """
+        for class_obj in [JSONResponseMixin, BaseBulkUpdateView]:
+            self.assertIn(class_obj, BulkUpdateView.mro())
+
+
+class BulkDeletionMixinTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.BulkDeletionMixin`.
+    """
+    def test_inherited_classes(self):
+        """
+        Test that this class inherits from the right classes.
+        """
+        self.assertIn(MultipleObjectMixin, BulkDeletionMixin.mro())
+
+    @patch('flask_views.db.mongoengine.edit.request')
+    def test_get_ids_json(self, request):
+        """
+        Test :py:meth:`.BulkDeletionMixin.get_ids` with JSON data.
+        """
+        request.is_json = True
+        request.get_json.return_value = {'ids': ['1', '2']}
+        self.assertEqual(['1', '2'], BulkDeletionMixin().get_ids())
+
+        request.get_json.return_value = {}
+        self.assertEqual(None, BulkDeletionMixin().get_ids())
+
+    @patch('flask_views.db.mongoengine.edit.abort')
+    @patch('flask_views.db.mongoengine.edit.request')
+    def test_get_ids_json_invalid(self, request, abort):
+        """
+        Test :py:meth:`.BulkDeletionMixin.get_ids` with invalid JSON data.
+        """
+        abort.side_effect = Exception
+        request.is_json = True
+
+        for data in [None, ['1', '2'], {'ids': '1'}]:
+            abort.reset_mock()
+            request.get_json.return_value = data
+            self.assertRaises(Exception, BulkDeletionMixin().get_ids)
+            abort.assert_called_once_with(400)
+
+    @patch('flask_views.db.mongoengine.edit.request')
+    def test_get_ids_form(self, request):
+        """
+        Test :py:meth:`.BulkDeletionMixin.get_ids` with form data.
+        """
+        request.is_json = False
+        request.form = MultiDict([('ids', '1'), ('ids', '2')])
+        self.assertEqual(['1', '2'], BulkDeletionMixin().get_ids())
+
+        request.form = MultiDict()
+        self.assertEqual(None, BulkDeletionMixin().get_ids())
+
+    @patch('flask_views.db.mongoengine.edit.request')
+    def test_is_dry_run(self, request):
+        """
+        Test :py:meth:`.BulkDeletionMixin.is_dry_run`.
+        """
+        for value, dry_run in [
+                ('1', True), ('true', True), ('0', False), ('False', False),
+                ('', False)]:
+            request.args = {'dry_run': value}
+            self.assertEqual(dry_run, BulkDeletionMixin().is_dry_run())
+
+        request.args = {}
+        self.assertFalse(BulkDeletionMixin().is_dry_run())
+
+    def test_get_delete_query_ids(self):
+        """
+        Test :py:meth:`.BulkDeletionMixin.get_delete_query` with ids.
+        """
+        mixin = BulkDeletionMixin()
+        mixin.get_ids = Mock(return_value=['1', '2'])
+        mixin.get_filtered_queryset = Mock()
+        queryset = mixin.get_filtered_queryset.return_value
+
+        self.assertEqual(
+            queryset.filter.return_value._query, mixin.get_delete_query())
+        queryset.filter.assert_called_once_with(pk__in=['1', '2'])
+
+    def test_get_delete_query_filter(self):
+        """
+        Test :py:meth:`.BulkDeletionMixin.get_delete_query` with a filter.
+        """
+        mixin = BulkDeletionMixin()
+        mixin.get_ids = Mock(return_value=None)
+        mixin.get_filter_fields = Mock(return_value={'category': 'news'})
+        mixin.get_filtered_queryset = Mock()
+        queryset = mixin.get_filtered_queryset.return_value
+
+        self.assertEqual(queryset._query, mixin.get_delete_query())
+        self.assertFalse(queryset.filter.called)
+
+    @patch('flask_views.db.mongoengine.edit.abort')
+    def test_get_delete_query_invalid(self, abort):
+        """
+        Test :py:meth:`.BulkDeletionMixin.get_delete_query` aborting.
+        """
+        abort.side_effect = Exception
+
+        mixin = BulkDeletionMixin()
+        mixin.get_ids = Mock(return_value=None)
+        mixin.get_filter_fields = Mock(return_value={})
+        mixin.get_filtered_queryset = Mock()
+
+        self.assertRaises(Exception, mixin.get_delete_query)
+        abort.assert_called_once_with(400)
+
+        abort.reset_mock()
+        mixin.max_items = 1
+        mixin.get_ids.return_value = ['1', '2']
+        self.assertRaises(Exception, mixin.get_delete_query)
+        abort.assert_called_once_with(413)
+
+    @patch('flask_views.db.mongoengine.edit.abort')
+    def test_get_delete_query_invalid_id(self, abort):
+        """
+        Test :py:meth:`.BulkDeletionMixin.get_delete_query` with invalid ids.
+        """
+        class QuerySet(object):
+            @property
+            def _query(self):
+                raise ValidationError('Invalid id')
+
+        abort.side_effect = Exception
+
+        mixin = BulkDeletionMixin()
+        mixin.get_ids = Mock(return_value=['invalid'])
+        mixin.get_filtered_queryset = Mock()
+        mixin.get_filtered_queryset.return_value.filter.return_value = (
+            QuerySet())
+
+        self.assertRaises(Exception, mixin.get_delete_query)
+        abort.assert_called_once_with(400)
+
+    def test_get_context_data(self):
+        """
+        Test :py:meth:`.BulkDeletionMixin.get_context_data`.
+        """
+        self.assertEqual(
+            {'deleted': 1},
+            BulkDeletionMixin().get_context_data(deleted=1)
+        )
+
+    @patch('flask_views.db.mongoengine.edit.invalidate_document_tag')
+    def test_invalidate_response_cache(self, invalidate_document_tag):
+        """
+        Test :py:meth:`.BulkDeletionMixin.invalidate_response_cache`.
+        """
+        mixin = BulkDeletionMixin()
+        mixin.document_class = Mock(__name__='Post', __module__='blog')
+        mixin.response_cache = Mock()
+
+        mixin.invalidate_response_cache()
+        invalidate_document_tag.assert_called_once_with(
+            mixin.response_cache, mixin.document_class)
+
+    @patch('flask_views.db.mongoengine.edit.invalidate_object_tags')
+    def test_invalidate_object_caches(self, invalidate_object_tags):
+        """
+        Test :py:meth:`.BulkDeletionMixin.invalidate_object_caches`.
+        """
+        mixin = BulkDeletionMixin()
+        mixin.document_class = Mock()
+        mixin.object_cache = Mock()
+        mixin.encoded_cache = Mock()
+
+        mixin.invalidate_object_caches(['a', 'b'])
+        invalidate_object_tags.assert_any_call(
+            mixin.object_cache, mixin.document_class, ['a', 'b'])
+        invalidate_object_tags.assert_any_call(
+            mixin.encoded_cache, mixin.document_class, ['a', 'b'])
+
+    def test_delete(self):
+        """
+        Test :py:meth:`.BulkDeletionMixin.delete`.
+        """
+        mixin = BulkDeletionMixin()
+        mixin.document_class = Mock()
+        mixin.get_delete_query = Mock(return_value={'category': 'news'})
+        mixin.is_dry_run = Mock(return_value=False)
+        mixin.invalidate_object_caches = Mock()
+        mixin.invalidate_response_cache = Mock()
+        mixin.invalidate_count_cache = Mock()
+        mixin.render_to_response = Mock()
+        collection = mixin.document_class._get_collection.return_value
+        collection.delete_many.return_value.deleted_count = 2
+
+        self.assertEqual(mixin.render_to_response.return_value, mixin.delete())
+        collection.delete_many.assert_called_once_with({'category': 'news'})
+        self.assertFalse(collection.count_documents.called)
+        self.assertFalse(collection.find.called)
+        mixin.invalidate_object_caches.assert_called_once_with([])
+        mixin.invalidate_response_cache.assert_called_once_with()
+        mixin.invalidate_count_cache.assert_called_once_with()
+        mixin.render_to_response.assert_called_once_with(
+            {'deleted': 2, 'dry_run': False})
+
+    def test_delete_object_cache(self):
+        """
+        Test :py:meth:`.BulkDeletionMixin.delete` evicting cached objects.
+        """
+        mixin = BulkDeletionMixin()
+        mixin.object_cache = Mock()
+        mixin.document_class = Mock()
+        mixin.get_delete_query = Mock(return_value={'category': 'news'})
+        mixin.is_dry_run = Mock(return_value=False)
+        mixin.invalidate_object_caches = Mock()
+        mixin.invalidate_response_cache = Mock()
+        mixin.invalidate_count_cache = Mock()
+        mixin.render_to_response = Mock()
+        collection = mixin.document_class._get_collection.return_value
+        collection.find.return_value = [{'_id': 'a'}, {'_id': 'b'}]
+        collection.delete_many.return_value.deleted_count = 2
+
+        mixin.delete()
+        collection.find.assert_called_once_with(
+            {'category': 'news'}, {'_id': 1})
+        mixin.invalidate_object_caches.assert_called_once_with(['a', 'b'])
+
+    def test_delete_dry_run(self):
+        """
+        Test :py:meth:`.BulkDeletionMixin.delete` on a dry run.
+        """
+        mixin = BulkDeletionMixin()
+        mixin.document_class = Mock()
+        mixin.get_delete_query = Mock(return_value={'category': 'news'})
+        mixin.is_dry_run = Mock(return_value=True)
+        mixin.invalidate_response_cache = Mock()
+        mixin.render_to_response = Mock()
+        collection = mixin.document_class._get_collection.return_value
+        collection.count_documents.return_value = 3
+
+        mixin.delete()
+        collection.count_documents.assert_called_once_with(
+            {'category': 'news'})
+        self.assertFalse(collection.delete_many.called)
+        self.assertFalse(mixin.invalidate_response_cache.called)
+        mixin.render_to_response.assert_called_once_with(
+            {'deleted': 3, 'dry_run': True})
+
+    def test_post(self):
+        """
+        Test :py:meth:`.BulkDeletionMixin.post`.
+        """
+        mixin = BulkDeletionMixin()
+        mixin.delete = Mock()
+
+        self.assertEqual(mixin.delete.return_value, mixin.post('foo', bar=1))
+        mixin.delete.assert_called_once_with('foo', bar=1)
+
+
+class BaseBulkDeleteViewTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.BaseBulkDeleteView`.
+    """
+    def test_inherited_classes(self):
+        """
+        Test that this class inherits from the right classes.
+        """
+        for class_obj in [BulkDeletionMixin, View]:
+            self.assertIn(class_obj, BaseBulkDeleteView.mro())
+
+
+class BulkDeleteViewTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.BulkDeleteView`.
+    """
+    def test_inherited_classes(self):
+        """
+        Test that this class inherits from the right classes.
+        """
+        for class_obj in [JSONResponseMixin, BaseBulkDeleteView]:
+            self.assertIn(class_obj, BulkDeleteView.mro())
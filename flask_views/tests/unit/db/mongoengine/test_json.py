@@ -1,15 +1,143 @@
+from datetime import date, datetime
+
 import unittest2 as unittest
 
+from bson.dbref import DBRef
+from bson.decimal128 import Decimal128
+from bson.objectid import ObjectId
 from mock import patch, Mock
+from mongoengine import fields
+from mongoengine.document import Document, DynamicDocument, EmbeddedDocument
 
+from flask_views.db.mongoengine.detail import CachedDetailMixin
 from flask_views.db.mongoengine.json import (
-    MongoengineEncoder, JSONDetailView, JSONResponseMixin)
+    MongoengineEncoder,
+    JSONDetailView,
+    JSONListView,
+    JSONResponseMixin,
+    encode_document,
+    encode_value,
+    get_document_encoder,
+)
+from flask_views.json import JSONSerializer, text_type
+
+
+class EncodeTestEmbeddedDocument(EmbeddedDocument):
+    body = fields.StringField()
+    created = fields.DateTimeField()
+
+
+class EncodeTestReferenceDocument(Document):
+    name = fields.StringField()
+
+
+class EncodeTestDynamicDocument(DynamicDocument):
+    title = fields.StringField()
+
+
+class EncodeTestDocument(Document):
+    title = fields.StringField()
+    created = fields.DateTimeField()
+    embedded = fields.EmbeddedDocumentField(EncodeTestEmbeddedDocument)
+    embedded_list = fields.ListField(
+        fields.EmbeddedDocumentField(EncodeTestEmbeddedDocument))
+    tags = fields.ListField(fields.StringField())
+    reference = fields.ReferenceField(EncodeTestReferenceDocument)
+
+
+class EncodeValueTestCase(unittest.TestCase):
+    """
+    Tests for :py:func:`.encode_value`.
+    """
+    def test_encode_value(self):
+        """
+        Test :py:func:`.encode_value`.
+        """
+        object_id = ObjectId()
+        self.assertEqual(text_type(object_id), encode_value(object_id))
+        self.assertEqual(
+            text_type(object_id), encode_value(DBRef('foo', object_id)))
+        self.assertEqual(
+            '2012-01-02T00:00:00', encode_value(datetime(2012, 1, 2)))
+        self.assertEqual('1.10', encode_value(Decimal128('1.10')))
+        self.assertEqual(
+            {'foo': [text_type(object_id), 1]},
+            encode_value({'foo': (object_id, 1)})
+        )
+        self.assertEqual('foo', encode_value('foo'))
+
+
+class EncodeDocumentTestCase(unittest.TestCase):
+    """
+    Tests for :py:func:`.encode_document`.
+    """
+    def test_encode_document(self):
+        """
+        Test :py:func:`.encode_document`.
+        """
+        reference = EncodeTestReferenceDocument(id=ObjectId(), name='ref')
+        document = EncodeTestDocument(
+            id=ObjectId(),
+            title='foo',
+            created=datetime(2012, 1, 2, 3, 4, 5),
+            embedded=EncodeTestEmbeddedDocument(body='bar'),
+            embedded_list=[
+                EncodeTestEmbeddedDocument(
+                    body='baz', created=datetime(2012, 1, 2)),
+            ],
+            tags=['a', 'b'],
+            reference=reference,
+        )
+
+        self.assertEqual({
+            'id': text_type(document.id),
+            'title': 'foo',
+            'created': '2012-01-02T03:04:05',
+            'embedded': {'body': 'bar', 'created': None},
+            'embedded_list': [
+                {'body': 'baz', 'created': '2012-01-02T00:00:00'},
+            ],
+            'tags': ['a', 'b'],
+            'reference': {'id': text_type(reference.id), 'name': 'ref'},
+        }, encode_document(document))
+
+    def test_encode_document_dynamic(self):
+        """
+        Test :py:func:`.encode_document` with a ``DynamicDocument``.
+        """
+        document = EncodeTestDynamicDocument(
+            title='foo', extra=datetime(2012, 1, 2), tags=['a', 'b'])
+
+        self.assertEqual({
+            'id': None,
+            'title': 'foo',
+            'extra': '2012-01-02T00:00:00',
+            'tags': ['a', 'b'],
+        }, encode_document(document))
+
+    def test_get_document_encoder_cached(self):
+        """
+        Test that :py:func:`.get_document_encoder` compiles once per class.
+        """
+        self.assertIs(
+            get_document_encoder(EncodeTestDocument),
+            get_document_encoder(EncodeTestDocument),
+        )
 
 
 class MongoengineEncoderTestCase(unittest.TestCase):
     """
     Tests for :py:class:`.MongoengineEncoder`.
     """
+    def test_default_document(self):
+        """
+        Test :py:meth:`.MongoengineEncoder.default` with document.
+        """
+        encoder = MongoengineEncoder()
+        document = EncodeTestReferenceDocument(name='foo')
+        self.assertEqual(
+            {'id': None, 'name': 'foo'}, encoder.default(document))
+
     def test_default_iter(self):
         """
         Test :py:meth:`.MongoengineEncoder.default` with iterable.
@@ -29,7 +157,34 @@ class MongoengineEncoderTestCase(unittest.TestCase):
         """
         obj = Mock()
         encoder = MongoengineEncoder()
-        self.assertEqual(unicode(obj), encoder.default(obj))
+        self.assertEqual(text_type(obj), encoder.default(obj))
+
+    def test_default_dbref(self):
+        """
+        Test :py:meth:`.MongoengineEncoder.default` with ``DBRef`` object.
+        """
+        object_id = ObjectId()
+        encoder = MongoengineEncoder()
+        self.assertEqual(
+            text_type(object_id), encoder.default(DBRef('foo', object_id)))
+
+    def test_default_decimal128(self):
+        """
+        Test :py:meth:`.MongoengineEncoder.default` with ``Decimal128``.
+        """
+        encoder = MongoengineEncoder()
+        self.assertEqual('1.10', encoder.default(Decimal128('1.10')))
+
+    def test_default_datetime(self):
+        """
+        Test :py:meth:`.MongoengineEncoder.default` with ``datetime`` object.
+        """
+        encoder = MongoengineEncoder()
+        self.assertEqual(
+            '2012-01-02T03:04:05',
+            encoder.default(datetime(2012, 1, 2, 3, 4, 5))
+        )
+        self.assertEqual('2012-01-02', encoder.default(date(2012, 1, 2)))
 
     @patch('flask_views.db.mongoengine.json.json')
     def test_default_default_fallback(self, json):
@@ -55,6 +210,139 @@ class JSONResponseMixinTestCase(unittest.TestCase):
         mixin = JSONResponseMixin()
         self.assertEqual(MongoengineEncoder, mixin.encoder_class)
 
+    @patch('flask_views.db.mongoengine.json.super', create=True)
+    @patch('flask_views.db.mongoengine.json.request')
+    def test_get_only_fields_not_allowed(self, request, super_mock):
+        """
+        Test :py:meth:`.JSONResponseMixin.get_only_fields` without whitelist.
+        """
+        request.args = {'fields': 'foo'}
+
+        mixin = JSONResponseMixin()
+        self.assertEqual(
+            super_mock.return_value.get_only_fields.return_value,
+            mixin.get_only_fields()
+        )
+
+    @patch('flask_views.db.mongoengine.json.request')
+    def test_get_only_fields(self, request):
+        """
+        Test :py:meth:`.JSONResponseMixin.get_only_fields` with URL parameter.
+        """
+        request.args = {'fields': 'foo, bar'}
+
+        mixin = JSONResponseMixin()
+        mixin.allowed_fields = ['foo', 'bar', 'baz']
+        self.assertEqual(['foo', 'bar'], mixin.get_only_fields())
+
+    @patch('flask_views.db.mongoengine.json.abort')
+    @patch('flask_views.db.mongoengine.json.request')
+    def test_get_only_fields_invalid(self, request, abort):
+        """
+        Test :py:meth:`.JSONResponseMixin.get_only_fields` with invalid field.
+        """
+        request.args = {'fields': 'foo,secret'}
+
+        mixin = JSONResponseMixin()
+        mixin.allowed_fields = ['foo', 'bar']
+        mixin.get_only_fields()
+        abort.assert_called_once_with(400)
+
+    @patch('flask_views.db.mongoengine.json.super', create=True)
+    @patch('flask_views.db.mongoengine.json.request')
+    def test_get_vary_args(self, request, super_mock):
+        """
+        Test :py:meth:`.JSONResponseMixin.get_vary_args`.
+        """
+        request.args = {'fields': 'foo'}
+        super_mock.return_value.get_vary_args.return_value = []
+
+        mixin = JSONResponseMixin()
+        self.assertEqual([], mixin.get_vary_args())
+
+        mixin.allowed_fields = ['foo', 'bar']
+        self.assertEqual([('fields', 'foo')], mixin.get_vary_args())
+
+    @patch('flask_views.db.mongoengine.json.request')
+    @patch('flask_views.base.request')
+    def test_get_response_cache_key_fields(self, base_request, request):
+        """
+        Test the response cache key of a cached view with requested fields.
+        """
+        class TestView(CachedDetailMixin, JSONDetailView):
+            document_class = EncodeTestDocument
+            allowed_fields = ['title', 'tags']
+
+        base_request.args = {}
+        base_request.headers = {}
+
+        cache_keys = set()
+        for args in ({}, {'fields': 'title'}, {'fields': 'tags'}):
+            request.args = args
+            view = TestView()
+            view.kwargs = {'id': 'abc'}
+            cache_keys.add(view.get_response_cache_key())
+
+        self.assertEqual(3, len(cache_keys))
+
+    def test_encode_object(self):
+        """
+        Test :py:meth:`.JSONResponseMixin.encode_object`.
+        """
+        document = EncodeTestDocument(
+            id=ObjectId(), title='foo', tags=['a'], reference=None)
+
+        mixin = JSONResponseMixin()
+        mixin.get_only_fields = Mock(return_value=None)
+        mixin.exclude_fields = None
+        self.assertIs(document, mixin.encode_object(document))
+
+        mixin.get_only_fields.return_value = ['title', 'embedded.body']
+        self.assertEqual({
+            'id': text_type(document.id),
+            'title': 'foo',
+            'embedded': None,
+        }, mixin.encode_object(document))
+
+        mixin.get_only_fields.return_value = None
+        mixin.exclude_fields = ['tags', 'embedded_list', 'reference']
+        self.assertEqual({
+            'id': text_type(document.id),
+            'title': 'foo',
+            'created': None,
+            'embedded': None,
+        }, mixin.encode_object(document))
+
+        mixin.as_pymongo = True
+        self.assertIs(document, mixin.encode_object(document))
+
+    @patch('flask_views.db.mongoengine.json.super', create=True)
+    def test_get_queryset(self, super_mock):
+        """
+        Test :py:meth:`.JSONResponseMixin.get_queryset`.
+        """
+        queryset = super_mock.return_value.get_queryset.return_value
+
+        mixin = JSONResponseMixin()
+        self.assertEqual(queryset, mixin.get_queryset())
+
+        mixin.as_pymongo = True
+        self.assertEqual(
+            queryset.as_pymongo.return_value, mixin.get_queryset())
+
+    @patch('flask_views.db.mongoengine.json.super', create=True)
+    def test_use_object_cache(self, super_mock):
+        """
+        Test :py:meth:`.JSONResponseMixin.use_object_cache`.
+        """
+        super_mock.return_value.use_object_cache.return_value = True
+
+        mixin = JSONResponseMixin()
+        self.assertTrue(mixin.use_object_cache())
+
+        mixin.as_pymongo = True
+        self.assertFalse(mixin.use_object_cache())
+
 
 class JSONDetailViewTestCase(unittest.TestCase):
     """
@@ -66,4 +354,243 @@ class JSONDetailViewTestCase(unittest.TestCase):
         """
         view = JSONDetailView()
         view.object = Mock()
-        self.assertEqual(view.object, view.get_context_data())
+        view.encode_object = Mock()
+        self.assertEqual(
+            view.encode_object.return_value, view.get_context_data())
+        view.encode_object.assert_called_once_with(view.object)
+
+    @patch('flask_views.db.mongoengine.json.super', create=True)
+    def test_get_without_encoded_cache(self, super_mock):
+        """
+        Test :py:meth:`.JSONDetailView.get` without encoded cache.
+        """
+        view = JSONDetailView()
+        view.version_field = 'version'
+        self.assertEqual(
+            super_mock.return_value.get.return_value, view.get('foo'))
+        super_mock.return_value.get.assert_called_once_with('foo')
+
+    @patch('flask_views.db.mongoengine.json.current_app')
+    def test_get_encoded_cache_hit(self, current_app):
+        """
+        Test :py:meth:`.JSONDetailView.get` with cached JSON data.
+        """
+        view = JSONDetailView()
+        view.version_field = 'version'
+        view.encoded_cache = Mock()
+        view.encoded_cache.get.return_value = b'{"foo": "bar"}'
+        view.get_object_version = Mock(return_value=('abc', 2))
+        view.get_encoded_cache_key = Mock(return_value='key')
+        view.get_object = Mock()
+
+        self.assertEqual(current_app.response_class.return_value, view.get())
+        view.get_encoded_cache_key.assert_called_once_with('abc', 2)
+        view.encoded_cache.get.assert_called_once_with('key')
+        current_app.response_class.assert_called_once_with(
+            b'{"foo": "bar"}', mimetype='application/json')
+        self.assertFalse(view.get_object.called)
+
+    @patch('flask_views.db.mongoengine.json.current_app')
+    def test_get_encoded_cache_miss(self, current_app):
+        """
+        Test :py:meth:`.JSONDetailView.get` without cached JSON data.
+        """
+        view = JSONDetailView()
+        view.version_field = 'version'
+        view.encoded_cache = Mock()
+        view.encoded_cache.get.return_value = None
+        view.get_object_version = Mock(return_value=('abc', 2))
+        view.get_encoded_cache_key = Mock(return_value='key')
+        view.get_object = Mock(return_value={'foo': 'bar'})
+        view.get_only_fields = Mock(return_value=None)
+        view.get_serializer = Mock()
+        view.get_serializer.return_value.dumps.return_value = '{"foo": 1}'
+
+        self.assertEqual(current_app.response_class.return_value, view.get())
+        view.get_serializer.return_value.dumps.assert_called_once_with(
+            {'foo': 'bar'})
+        view.encoded_cache.set.assert_called_once_with(
+            'key', b'{"foo": 1}', timeout=300)
+        current_app.response_class.assert_called_once_with(
+            b'{"foo": 1}', mimetype='application/json')
+
+    def test_get_object_version(self):
+        """
+        Test :py:meth:`.JSONDetailView.get_object_version`.
+        """
+        view = JSONDetailView()
+        view.version_field = 'version'
+        view.get_object_values = Mock(return_value=['abc', 3])
+
+        self.assertEqual(('abc', 3), view.get_object_version())
+        view.get_object_values.assert_called_once_with('id', 'version')
+
+    @patch('flask_views.db.mongoengine.json.get_tag_version')
+    def test_get_encoded_cache_key(self, get_tag_version):
+        """
+        Test :py:meth:`.JSONDetailView.get_encoded_cache_key`.
+        """
+        class Foo(object):
+            pass
+
+        get_tag_version.return_value = 'v1'
+
+        view = JSONDetailView()
+        view.document_class = Foo
+        view.encoded_cache = Mock()
+        view.get_only_fields = Mock(return_value=['title', 'body'])
+        view.get_serializer_class = Mock(return_value=JSONSerializer)
+
+        self.assertEqual(
+            u'flask_views.encoded:'
+            u'flask_views.db.mongoengine.json.JSONDetailView:'
+            u'{0}.Foo:abc:2:body,title::0:flask_views.json.JSONSerializer:'
+            u'flask_views.db.mongoengine.json.MongoengineEncoder:v1'.format(
+                __name__),
+            view.get_encoded_cache_key('abc', 2)
+        )
+        get_tag_version.assert_called_once_with(
+            view.encoded_cache, u'{0}.Foo:abc'.format(__name__))
+
+        view.encoder_class = None
+        self.assertTrue(view.get_encoded_cache_key('abc', 2).endswith(
+            u':flask_views.json.JSONSerializer::v1'))
+
+
+class JSONListViewTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.JSONListView`.
+    """
+    @patch('flask_views.db.mongoengine.json.super', create=True)
+    def test_get_context_data(self, super_mock):
+        """
+        Test :py:meth:`.JSONListView.get_context_data`.
+        """
+        super_mock.return_value.get_context_data.return_value = {
+            'is_paginated': False,
+            'foo_list': iter(['foo', 'bar']),
+        }
+
+        view = JSONListView()
+        view.accepts_ndjson = Mock(return_value=False)
+        view.get_only_fields = Mock(return_value=None)
+        view.get_context_object_name = Mock(return_value='foo_list')
+        self.assertEqual({
+            'is_paginated': False,
+            'foo_list': ['foo', 'bar'],
+        }, view.get_context_data())
+
+    @patch('flask_views.db.mongoengine.json.super', create=True)
+    def test_get_context_data_only_fields(self, super_mock):
+        """
+        Test :py:meth:`.JSONListView.get_context_data` with only fields.
+        """
+        super_mock.return_value.get_context_data.return_value = {
+            'foo_list': iter(['foo', 'bar']),
+        }
+
+        view = JSONListView()
+        view.accepts_ndjson = Mock(return_value=False)
+        view.get_only_fields = Mock(return_value=['title'])
+        view.encode_object = Mock(side_effect=lambda obj: obj.upper())
+        view.get_context_object_name = Mock(return_value='foo_list')
+        self.assertEqual(
+            {'foo_list': ['FOO', 'BAR']}, view.get_context_data())
+
+    @patch('flask_views.db.mongoengine.json.super', create=True)
+    def test_get_context_data_stream(self, super_mock):
+        """
+        Test :py:meth:`.JSONListView.get_context_data` when streaming.
+        """
+        queryset = Mock()
+        super_mock.return_value.get_context_data.return_value = {
+            'foo_list': queryset,
+        }
+
+        view = JSONListView()
+        view.stream = True
+        view.get_only_fields = Mock(return_value=None)
+        view.get_context_object_name = Mock(return_value='foo_list')
+
+        self.assertEqual({
+            'foo_list': queryset.no_cache.return_value.batch_size.return_value,
+        }, view.get_context_data())
+        queryset.no_cache.return_value.batch_size.assert_called_once_with(100)
+
+    @patch('flask_views.db.mongoengine.json.super', create=True)
+    def test_render_to_response(self, super_mock):
+        """
+        Test :py:meth:`.JSONListView.render_to_response`.
+        """
+        view = JSONListView()
+        view.accepts_ndjson = Mock(return_value=False)
+        self.assertEqual(
+            super_mock.return_value.render_to_response.return_value,
+            view.render_to_response({'foo_list': []})
+        )
+        response = super_mock.return_value.render_to_response.return_value
+        response.vary.add.assert_called_once_with('Accept')
+
+    def test_render_to_response_stream(self):
+        """
+        Test :py:meth:`.JSONListView.render_to_response` when streaming.
+        """
+        view = JSONListView()
+        view.stream = True
+        view.accepts_ndjson = Mock(return_value=False)
+        view.stream_to_response = Mock()
+        view.get_context_object_name = Mock(return_value='foo_list')
+
+        self.assertEqual(
+            view.stream_to_response.return_value,
+            view.render_to_response({'foo_list': ['foo'], 'page': 1})
+        )
+        view.stream_to_response.assert_called_once_with(
+            ['foo'], {'page': 1}, key='foo_list')
+        view.stream_to_response.return_value.vary.add.assert_called_once_with(
+            'Accept')
+
+    def test_render_to_response_ndjson(self):
+        """
+        Test :py:meth:`.JSONListView.render_to_response` with NDJSON.
+        """
+        view = JSONListView()
+        view.accepts_ndjson = Mock(return_value=True)
+        view.stream_ndjson_response = Mock()
+        view.get_context_object_name = Mock(return_value='foo_list')
+
+        self.assertEqual(
+            view.stream_ndjson_response.return_value,
+            view.render_to_response({'foo_list': ['foo'], 'page': 1})
+        )
+        view.stream_ndjson_response.assert_called_once_with(
+            ['foo'], headers={'X-Page': '1'})
+        response = view.stream_ndjson_response.return_value
+        response.vary.add.assert_called_once_with('Accept')
+
+    def test_get_ndjson_headers(self):
+        """
+        Test :py:meth:`.JSONListView.get_ndjson_headers`.
+        """
+        view = JSONListView()
+        self.assertEqual({
+            'X-Is-Paginated': 'true',
+            'X-Total-Page-Count': '10',
+            'X-Next-Cursor': '"abc"',
+        }, view.get_ndjson_headers({
+            'is_paginated': True,
+            'total_page_count': 10,
+            'next_cursor': 'abc',
+            'previous_cursor': None,
+        }))
+
+    def test_get_media_type(self):
+        """
+        Test :py:meth:`.JSONListView.get_media_type`.
+        """
+        view = JSONListView()
+        view.accepts_ndjson = Mock(return_value=False)
+        self.assertEqual('application/json', view.get_media_type())
+
+        view.accepts_ndjson.return_value = True
+        self.assertEqual('application/x-ndjson', view.get_media_type())
@@ -1,14 +1,63 @@
+import base64
+import json
+from hashlib import md5
+
 import unittest2 as unittest
 
+from bson.objectid import ObjectId
 from mock import Mock, patch
+from mongoengine import fields
+from mongoengine.document import Document
+
+from flask_views.base import View
+from flask_views.db.mongoengine.list import (
+    BaseListView,
+    CachedListMixin,
+    ConditionalListMixin,
+    MultipleObjectMixin,
+)
+
 
-from flask_views.db.mongoengine.list import BaseListView, MultipleObjectMixin
+class CursorTestDocument(Document):
+    name = fields.StringField()
+    position = fields.IntField()
 
 
 class MultipleObjectMixinTestCase(unittest.TestCase):
     """
     Tests for :py:class:`.MultipleObjectMixin`.
     """
+    def test_get_configuration_errors(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_configuration_errors`.
+        """
+        class TestMixin(MultipleObjectMixin):
+            pass
+
+        self.assertEqual([], TestMixin.get_configuration_errors(False))
+        self.assertEqual(
+            ['document_class is not set.'],
+            TestMixin.get_configuration_errors(True)
+        )
+
+        TestMixin.filter_fields = None
+        TestMixin.count_strategy = 'foo'
+        TestMixin.items_per_page = -1
+        self.assertEqual([
+            'filter_fields must be a dict.',
+            "count_strategy 'foo' is not supported.",
+            'items_per_page must be a positive int or 0.',
+        ], TestMixin.get_configuration_errors(False))
+
+        TestMixin.filter_fields = {}
+        TestMixin.count_strategy = 'exact'
+        TestMixin.items_per_page = 0
+        TestMixin.cursor_field = 'id'
+        self.assertEqual(
+            ['cursor_field requires items_per_page to be set.'],
+            TestMixin.get_configuration_errors(False)
+        )
+
     def test_get_filter_fields_empty(self):
         """
         Test :py:meth:`.MultipleObjectMixin.get_filter_fields` with emty result
@@ -42,6 +91,23 @@ class MultipleObjectMixinTestCase(unittest.TestCase):
         mixin.document_class = Mock()
         self.assertEqual(mixin.document_class.objects, mixin.get_queryset())
 
+    def test_get_queryset_only_exclude_fields(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_queryset` with a projection.
+        """
+        mixin = MultipleObjectMixin()
+        mixin.document_class = Mock()
+        mixin.only_fields = ['foo', 'bar']
+        mixin.exclude_fields = ['body']
+
+        objects = mixin.document_class.objects
+        self.assertEqual(
+            objects.only.return_value.exclude.return_value,
+            mixin.get_queryset()
+        )
+        objects.only.assert_called_once_with('foo', 'bar')
+        objects.only.return_value.exclude.assert_called_once_with('body')
+
     def test_get_filtered_queryset(self):
         """
         Test :py:meth:`~.MultipleObjectMixin.get_filtered_queryset`.
@@ -109,6 +175,47 @@ class MultipleObjectMixinTestCase(unittest.TestCase):
         mixin.kwargs = {}
         self.assertEqual(1, mixin.get_page_number())
 
+    @patch('flask_views.db.mongoengine.list.abort')
+    @patch('flask_views.db.mongoengine.list.request')
+    def test_page_number_invalid(self, request, abort):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_page_number` below ``1``.
+        """
+        for page in ('0', '-1'):
+            request.args = {'page': page}
+            mixin = MultipleObjectMixin()
+            mixin.kwargs = {}
+            mixin.get_page_number()
+
+        self.assertEqual(2, abort.call_count)
+        abort.assert_called_with(404)
+
+    def test_use_facet_query(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.use_facet_query`.
+        """
+        mixin = MultipleObjectMixin()
+        mixin.get_filtered_queryset = Mock()
+        self.assertFalse(mixin.use_facet_query())
+        self.assertFalse(mixin.get_filtered_queryset.called)
+
+        mixin = MultipleObjectMixin()
+        mixin.facet_query = True
+        mixin.get_filtered_queryset = Mock()
+        self.assertTrue(mixin.use_facet_query())
+
+    def test_use_facet_query_unsupported(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.use_facet_query` fallback.
+
+        This tests a queryset lacking the internals used by the aggregation.
+
+        """
+        mixin = MultipleObjectMixin()
+        mixin.facet_query = True
+        mixin.get_filtered_queryset = Mock(return_value=[])
+        self.assertFalse(mixin.use_facet_query())
+
     def test_page_count_not_items_per_page(self):
         """
         Test :py:meth:`.MultipleObjectMixin.get_page_count` without pagination.
@@ -122,10 +229,6 @@ class MultipleObjectMixinTestCase(unittest.TestCase):
         """
         filtered_queryset = Mock()
 
-        mixin = MultipleObjectMixin()
-        mixin.items_per_page = 5
-        mixin.get_filtered_queryset = Mock(return_value=filtered_queryset)
-
         for total_items, expected_page_count in (
                     (1, 1),
                     (5, 1),
@@ -133,9 +236,320 @@ class MultipleObjectMixinTestCase(unittest.TestCase):
                     (10, 2),
                     (11, 3),
                 ):
+            mixin = MultipleObjectMixin()
+            mixin.items_per_page = 5
+            mixin.get_filtered_queryset = Mock(return_value=filtered_queryset)
             filtered_queryset.count.return_value = total_items
             self.assertEqual(expected_page_count, mixin.get_page_count())
 
+    def test_page_count_counted_once(self):
+        """
+        Test that :py:meth:`.MultipleObjectMixin.get_page_count` counts once.
+        """
+        mixin = MultipleObjectMixin()
+        mixin.items_per_page = 5
+        mixin.get_page_number = Mock(return_value=1)
+        mixin.get_filtered_queryset = Mock()
+        mixin.get_filtered_queryset.return_value.count.return_value = 11
+
+        self.assertEqual(3, mixin.get_page_count())
+        self.assertTrue(mixin.get_has_next_page())
+        self.assertEqual(
+            1, mixin.get_filtered_queryset.return_value.count.call_count)
+
+    def test_page_count_facet_query(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_page_count` with facet query.
+        """
+        mixin = MultipleObjectMixin()
+        mixin.items_per_page = 5
+        mixin.use_facet_query = Mock(return_value=True)
+        mixin.get_facet_result = Mock(return_value=([], 11))
+        mixin.get_filtered_queryset = Mock()
+
+        self.assertEqual(3, mixin.get_page_count())
+        self.assertFalse(mixin.get_filtered_queryset.called)
+
+    def test_page_count_has_next(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_page_count` without counting.
+        """
+        mixin = MultipleObjectMixin()
+        mixin.items_per_page = 5
+        mixin.count_strategy = 'has_next'
+        mixin.get_filtered_queryset = Mock()
+
+        self.assertEqual(None, mixin.get_page_count())
+        self.assertFalse(mixin.get_filtered_queryset.called)
+
+    def test_get_object_count_exact(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_object_count` exact.
+        """
+        mixin = MultipleObjectMixin()
+        mixin.get_filtered_queryset = Mock()
+        mixin.get_filtered_queryset.return_value.count.return_value = 10
+
+        self.assertEqual(10, mixin.get_object_count())
+        self.assertTrue(mixin.is_page_count_exact())
+
+    def test_get_object_count_cached(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_object_count` cached.
+        """
+        mixin = MultipleObjectMixin()
+        mixin.count_strategy = 'cached'
+        mixin.count_cache = Mock()
+        mixin.count_cache.get.return_value = None
+        mixin.get_count_cache_key = Mock(return_value='key')
+        mixin.get_filtered_queryset = Mock()
+        mixin.get_filtered_queryset.return_value.count.return_value = 10
+
+        self.assertEqual(10, mixin.get_object_count())
+        mixin.count_cache.get.assert_called_once_with('key')
+        mixin.count_cache.set.assert_called_once_with('key', 10, timeout=60)
+
+        mixin.count_cache.get.return_value = 5
+        self.assertEqual(5, mixin.get_object_count())
+        self.assertEqual(1, mixin.get_filtered_queryset.call_count)
+        self.assertFalse(mixin.is_page_count_exact())
+
+    @patch('flask_views.db.mongoengine.list.get_tag_version')
+    def test_get_count_cache_key(self, get_tag_version):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_count_cache_key`.
+        """
+        class MyObject(object):
+            pass
+
+        get_tag_version.return_value = 'v1'
+
+        mixin = MultipleObjectMixin()
+        mixin.document_class = MyObject
+        mixin.count_cache = Mock()
+        mixin.get_filtered_queryset = Mock()
+        mixin.get_filtered_queryset.return_value._query = {'b': 2, 'a': 1}
+
+        self.assertEqual(
+            'flask_views.count:{0}.MyObject:{1}:v1'.format(
+                __name__, md5(b'{"a": 1, "b": 2}').hexdigest()),
+            mixin.get_count_cache_key()
+        )
+        get_tag_version.assert_called_once_with(
+            mixin.count_cache, '{0}.MyObject'.format(__name__))
+
+        mixin.get_filtered_queryset.return_value._query = {'a': 1}
+        self.assertNotEqual(
+            'flask_views.count:{0}.MyObject:{1}:v1'.format(
+                __name__, md5(b'{"a": 1, "b": 2}').hexdigest()),
+            mixin.get_count_cache_key()
+        )
+
+    @patch('flask_views.db.mongoengine.list.invalidate_document_tag')
+    def test_invalidate_count_cache(self, invalidate_document_tag):
+        """
+        Test :py:meth:`.MultipleObjectMixin.invalidate_count_cache`.
+        """
+        mixin = MultipleObjectMixin()
+        mixin.document_class = Mock()
+        mixin.count_cache = Mock()
+
+        mixin.invalidate_count_cache()
+        invalidate_document_tag.assert_called_once_with(
+            mixin.count_cache, mixin.document_class)
+
+    def test_get_object_count_estimated(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_object_count` estimated.
+        """
+        mixin = MultipleObjectMixin()
+        mixin.count_strategy = 'estimated'
+        mixin.document_class = Mock()
+        collection = mixin.document_class._get_collection.return_value
+        collection.estimated_document_count.return_value = 100
+        mixin.get_filtered_queryset = Mock()
+        mixin.get_filtered_queryset.return_value.count.return_value = 10
+
+        mixin.get_filtered_queryset.return_value._query = {}
+        self.assertEqual(100, mixin.get_object_count())
+        self.assertFalse(mixin.is_page_count_exact())
+
+        for query in [{'foo': 'bar'}, {'_cls': 'Post.News'}]:
+            mixin.get_filtered_queryset.return_value._query = query
+            self.assertEqual(10, mixin.get_object_count())
+            self.assertTrue(mixin.is_page_count_exact())
+
+    def test_get_has_next_result(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_has_next_result`.
+        """
+        class DummyQuerySet(object):
+            def __getitem__(self, item):
+                return range(item.start, min(item.stop, 25))
+
+        for page_number, result in (
+                    (2, (list(range(10, 20)), True)),
+                    (3, (list(range(20, 25)), False)),
+                ):
+            mixin = MultipleObjectMixin()
+            mixin.items_per_page = 10
+            mixin.get_filtered_queryset = Mock(return_value=DummyQuerySet())
+            mixin.get_page_number = Mock(return_value=page_number)
+
+            self.assertEqual(result, mixin.get_has_next_result())
+            self.assertEqual(result, mixin.get_has_next_result())
+            self.assertEqual(1, mixin.get_filtered_queryset.call_count)
+
+    def test_get_has_next_page(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_has_next_page`.
+        """
+        mixin = MultipleObjectMixin()
+        self.assertFalse(mixin.get_has_next_page())
+
+        mixin.items_per_page = 10
+        mixin.get_page_number = Mock(return_value=2)
+        mixin.get_page_count = Mock(return_value=2)
+        self.assertFalse(mixin.get_has_next_page())
+
+        mixin.count_strategy = 'has_next'
+        mixin.get_has_next_result = Mock(return_value=([], True))
+        self.assertTrue(mixin.get_has_next_page())
+
+    def test_get_paginated_object_list_has_next(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_paginated_object_list`.
+
+        This tests the return with the ``'has_next'`` count strategy.
+
+        """
+        mixin = MultipleObjectMixin()
+        mixin.items_per_page = 10
+        mixin.count_strategy = 'has_next'
+        mixin.get_page_number = Mock(return_value=1)
+        mixin.get_has_next_result = Mock(return_value=(['foo'], False))
+
+        self.assertEqual(['foo'], mixin.get_paginated_object_list())
+
+    @patch('flask_views.db.mongoengine.list.request')
+    def test_get_page_number_memoized(self, request):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_page_number` is memoized.
+        """
+        request.args = Mock()
+        request.args.__getitem__ = Mock(return_value='2')
+
+        mixin = MultipleObjectMixin()
+        mixin.kwargs = {}
+
+        self.assertEqual(2, mixin.get_page_number())
+        self.assertEqual(2, mixin.get_page_number())
+        self.assertEqual(1, request.args.__getitem__.call_count)
+
+    def test_get_facet_result(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_facet_result`.
+        """
+        queryset = Mock()
+        queryset._query = {'foo': 'bar'}
+        queryset._ordering = [('name', 1)]
+        queryset._as_pymongo = False
+        queryset._loaded_fields.as_dict.return_value = {'name': 1}
+        queryset._collection.aggregate.return_value = iter([{
+            'objects': [{'name': 'a'}, {'name': 'b'}],
+            'count': [{'count': 12}],
+        }])
+
+        mixin = MultipleObjectMixin()
+        mixin.items_per_page = 2
+        mixin.document_class = Mock()
+        mixin.get_page_number = Mock(return_value=3)
+        mixin.get_filtered_queryset = Mock(return_value=queryset)
+
+        object_list, count = mixin.get_facet_result()
+        self.assertEqual(12, count)
+        self.assertEqual(
+            [mixin.document_class._from_son.return_value] * 2, object_list)
+        mixin.document_class._from_son.assert_called_with({'name': 'b'})
+
+        pipeline = queryset._collection.aggregate.call_args[0][0]
+        self.assertEqual({'$match': {'foo': 'bar'}}, pipeline[0])
+        self.assertEqual({'$sort': {'name': 1}}, pipeline[1])
+        self.assertEqual({'$facet': {
+            'objects': [
+                {'$skip': 4},
+                {'$limit': 2},
+                {'$project': {'name': 1}},
+            ],
+            'count': [{'$count': 'count'}],
+        }}, pipeline[2])
+
+        self.assertEqual((object_list, count), mixin.get_facet_result())
+        self.assertEqual(1, queryset._collection.aggregate.call_count)
+
+    def test_get_facet_result_empty(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_facet_result` without result.
+        """
+        queryset = Mock()
+        queryset._query = {}
+        queryset._ordering = None
+        queryset._loaded_fields.as_dict.return_value = {}
+        queryset._collection.aggregate.return_value = iter([{
+            'objects': [],
+            'count': [],
+        }])
+
+        mixin = MultipleObjectMixin()
+        mixin.items_per_page = 2
+        mixin.document_class = Mock()
+        mixin.document_class._meta = {}
+        mixin.get_page_number = Mock(return_value=1)
+        mixin.get_filtered_queryset = Mock(return_value=queryset)
+
+        self.assertEqual(([], 0), mixin.get_facet_result())
+        pipeline = queryset._collection.aggregate.call_args[0][0]
+        self.assertEqual(2, len(pipeline))
+
+    def test_get_facet_result_as_pymongo(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_facet_result` as pymongo.
+        """
+        queryset = Mock()
+        queryset._query = {}
+        queryset._ordering = None
+        queryset._as_pymongo = True
+        queryset._loaded_fields.as_dict.return_value = {}
+        queryset._collection.aggregate.return_value = iter([{
+            'objects': [{'name': 'a'}],
+            'count': [{'count': 1}],
+        }])
+
+        mixin = MultipleObjectMixin()
+        mixin.items_per_page = 2
+        mixin.document_class = Mock()
+        mixin.document_class._meta = {}
+        mixin.get_page_number = Mock(return_value=1)
+        mixin.get_filtered_queryset = Mock(return_value=queryset)
+
+        self.assertEqual(([{'name': 'a'}], 1), mixin.get_facet_result())
+        self.assertFalse(mixin.document_class._from_son.called)
+
+    def test_get_paginated_object_list_facet_query(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_paginated_object_list`.
+
+        This tests the return with facet query enabled.
+
+        """
+        mixin = MultipleObjectMixin()
+        mixin.items_per_page = 10
+        mixin.use_facet_query = Mock(return_value=True)
+        mixin.get_page_number = Mock(return_value=1)
+        mixin.get_facet_result = Mock(return_value=(['foo'], 1))
+
+        self.assertEqual(['foo'], mixin.get_paginated_object_list())
+
     def test_get_paginated_object_list_no_pagination(self):
         """
         Test :py:meth:`.MultipleObjectMixin.get_paginated_object_list`.
@@ -182,6 +596,162 @@ class MultipleObjectMixinTestCase(unittest.TestCase):
         self.assertEqual(None, mixin.get_paginated_object_list())
         abort.assert_called_once_with(404)
 
+    def test_encode_decode_cursor(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.encode_cursor` and ``decode``.
+        """
+        mixin = MultipleObjectMixin()
+        mixin.document_class = CursorTestDocument
+
+        for cursor_field, value in (
+                    ('-name', 'foo'),
+                    ('name', u'b\xe4r'),
+                    ('pk', ObjectId()),
+                    ('position', 1),
+                ):
+            mixin.cursor_field = cursor_field
+            token = mixin.encode_cursor(value)
+            self.assertNotIn('=', token)
+            self.assertEqual(value, mixin.decode_cursor(token))
+
+    @patch('flask_views.db.mongoengine.list.abort')
+    def test_decode_cursor_invalid(self, abort):
+        """
+        Test :py:meth:`.MultipleObjectMixin.decode_cursor` with invalid token.
+        """
+        mixin = MultipleObjectMixin()
+        mixin.document_class = CursorTestDocument
+        mixin.cursor_field = 'id'
+        mixin.decode_cursor('invalid!')
+        abort.assert_called_once_with(400)
+
+    @patch('flask_views.db.mongoengine.list.abort')
+    def test_decode_cursor_tampered(self, abort):
+        """
+        Test :py:meth:`.MultipleObjectMixin.decode_cursor` with tampered token.
+
+        This tests tokens which decode, but contain an invalid field value.
+
+        """
+        mixin = MultipleObjectMixin()
+        mixin.document_class = CursorTestDocument
+
+        for cursor_field, value in (
+                    ('id', {'$oid': 'zz'}),
+                    ('id', {'a': 1}),
+                    ('name', {'a': 1}),
+                    ('position', 'foo'),
+                ):
+            mixin.cursor_field = cursor_field
+            token = base64.urlsafe_b64encode(
+                json.dumps(value).encode('utf-8')).decode('ascii')
+            mixin.decode_cursor(token)
+
+        self.assertEqual(4, abort.call_count)
+        abort.assert_called_with(400)
+
+    @patch('flask_views.db.mongoengine.list.request')
+    def test_get_cursor(self, request):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_cursor`.
+        """
+        mixin = MultipleObjectMixin()
+        mixin.decode_cursor = Mock(return_value='value')
+
+        request.args = {}
+        self.assertEqual((None, None), mixin.get_cursor())
+
+        request.args = {'after': 'token'}
+        self.assertEqual(('after', 'value'), mixin.get_cursor())
+
+        request.args = {'before': 'token'}
+        self.assertEqual(('before', 'value'), mixin.get_cursor())
+        mixin.decode_cursor.assert_called_with('token')
+
+    def test_get_object_value(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_object_value`.
+        """
+        mixin = MultipleObjectMixin()
+        mixin.document_class = Mock()
+        mixin.document_class._meta = {'id_field': 'id'}
+        mixin.document_class._fields = {
+            'id': Mock(db_field='_id'),
+            'name': Mock(db_field='n'),
+        }
+
+        self.assertEqual('abc', mixin.get_object_value(Mock(id='abc'), 'id'))
+        self.assertEqual('abc', mixin.get_object_value({'_id': 'abc'}, 'id'))
+        self.assertEqual('abc', mixin.get_object_value({'_id': 'abc'}, 'pk'))
+        self.assertEqual('foo', mixin.get_object_value({'n': 'foo'}, 'name'))
+        self.assertEqual(
+            'bar', mixin.get_object_value({'other': 'bar'}, 'other'))
+
+    def _get_cursor_mixin(self, cursor, values):
+        queryset = Mock()
+        queryset.filter.return_value = queryset
+        queryset.order_by.return_value = [Mock(id=value) for value in values]
+
+        mixin = MultipleObjectMixin()
+        mixin.cursor_field = 'id'
+        mixin.items_per_page = 2
+        mixin.get_cursor = Mock(return_value=cursor)
+        mixin.get_filtered_queryset = Mock(return_value=queryset)
+        mixin.encode_cursor = Mock(side_effect=lambda value: 'c{0}'.format(
+            value))
+        return mixin, queryset
+
+    def test_get_cursor_page_first(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_cursor_page` first page.
+        """
+        mixin, queryset = self._get_cursor_mixin((None, None), [1, 2, 3])
+
+        object_list, previous_cursor, next_cursor = mixin.get_cursor_page()
+        self.assertEqual([1, 2], [obj.id for obj in object_list])
+        self.assertEqual(None, previous_cursor)
+        self.assertEqual('c2', next_cursor)
+        self.assertFalse(queryset.filter.called)
+        queryset.order_by.assert_called_once_with('+id')
+
+    def test_get_cursor_page_after(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_cursor_page` after cursor.
+        """
+        mixin, queryset = self._get_cursor_mixin(('after', 2), [3, 4])
+
+        object_list, previous_cursor, next_cursor = mixin.get_cursor_page()
+        self.assertEqual([3, 4], [obj.id for obj in object_list])
+        self.assertEqual('c3', previous_cursor)
+        self.assertEqual(None, next_cursor)
+        queryset.filter.assert_called_once_with(id__gt=2)
+        queryset.order_by.assert_called_once_with('+id')
+
+    def test_get_cursor_page_before(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_cursor_page` before cursor.
+        """
+        mixin, queryset = self._get_cursor_mixin(('before', 5), [4, 3, 2])
+
+        object_list, previous_cursor, next_cursor = mixin.get_cursor_page()
+        self.assertEqual([3, 4], [obj.id for obj in object_list])
+        self.assertEqual('c3', previous_cursor)
+        self.assertEqual('c4', next_cursor)
+        queryset.filter.assert_called_once_with(id__lt=5)
+        queryset.order_by.assert_called_once_with('-id')
+
+    def test_get_cursor_page_descending(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_cursor_page` descending.
+        """
+        mixin, queryset = self._get_cursor_mixin(('after', 5), [4, 3])
+        mixin.cursor_field = '-id'
+
+        object_list, previous_cursor, next_cursor = mixin.get_cursor_page()
+        self.assertEqual([4, 3], [obj.id for obj in object_list])
+        queryset.filter.assert_called_once_with(id__lt=5)
+        queryset.order_by.assert_called_once_with('-id')
+
     def test_get_context_object_name_set(self):
         """
         Test :py:meth:`.MultipleObjectMixin.get_context_object_name`.
@@ -223,6 +793,8 @@ class MultipleObjectMixinTestCase(unittest.TestCase):
             'is_paginated': True,
             'current_page_number': 5,
             'total_page_count': 10,
+            'total_page_count_exact': True,
+            'has_next_page': True,
             'foo_bar': mixin.get_paginated_object_list.return_value,
         }, mixin.get_context_data(foo='bar'))
 
@@ -241,10 +813,124 @@ class MultipleObjectMixinTestCase(unittest.TestCase):
             'is_paginated': False,
             'current_page_number': 1,
             'total_page_count': None,
+            'total_page_count_exact': True,
+            'has_next_page': False,
             'foo_bar': mixin.get_paginated_object_list.return_value,
         }, mixin.get_context_data(foo='bar'))
 
 
+    def test_get_context_data_cursor(self):
+        """
+        Test :py:meth:`.MultipleObjectMixin.get_context_data` with cursor.
+        """
+        mixin = MultipleObjectMixin()
+        mixin.items_per_page = 10
+        mixin.cursor_field = 'id'
+        mixin.get_cursor_page = Mock(return_value=(['obj'], 'prev', 'next'))
+        mixin.get_context_object_name = Mock(return_value='foo_bar')
+
+        self.assertEqual({
+            'foo': 'bar',
+            'is_paginated': True,
+            'current_page_number': None,
+            'total_page_count': None,
+            'total_page_count_exact': False,
+            'has_next_page': True,
+            'previous_cursor': 'prev',
+            'next_cursor': 'next',
+            'foo_bar': ['obj'],
+        }, mixin.get_context_data(foo='bar'))
+
+
+class ConditionalListMixinTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.ConditionalListMixin`.
+    """
+    def test_get_last_modified_not_configured(self):
+        """
+        Test :py:meth:`.ConditionalListMixin.get_last_modified` without field.
+        """
+        mixin = ConditionalListMixin()
+        self.assertEqual(None, mixin.get_last_modified())
+
+    def test_get_last_modified(self):
+        """
+        Test :py:meth:`.ConditionalListMixin.get_last_modified`.
+        """
+        queryset = Mock()
+        queryset._query = {'cat': 'foo'}
+        queryset._collection.find_one.return_value = {'u': 'date'}
+
+        mixin = ConditionalListMixin()
+        mixin.last_modified_field = 'updated_at'
+        mixin.document_class = Mock()
+        mixin.document_class._fields = {'updated_at': Mock(db_field='u')}
+        mixin.get_filtered_queryset = Mock(return_value=queryset)
+
+        self.assertEqual('date', mixin.get_last_modified())
+        queryset._collection.find_one.assert_called_once_with(
+            {'cat': 'foo'}, {'u': 1}, sort=[('u', -1)])
+
+        queryset._collection.find_one.return_value = None
+        self.assertEqual(None, mixin.get_last_modified())
+
+
+class CachedListMixinTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.CachedListMixin`.
+    """
+    def test_get_response_cache_tags(self):
+        """
+        Test :py:meth:`.CachedListMixin.get_response_cache_tags`.
+        """
+        mixin = CachedListMixin()
+        mixin.document_class = Mock(__module__='app.models', __name__='Post')
+        self.assertEqual(['app.models.Post'], mixin.get_response_cache_tags())
+
+    @patch('flask_views.base.request')
+    def test_get_response_cache_vary_page(self, request):
+        """
+        Test :py:meth:`.CachedListMixin.get_response_cache_vary` with pages.
+        """
+        class TestMixin(CachedListMixin, MultipleObjectMixin, View):
+            pass
+
+        mixin = TestMixin()
+        mixin.kwargs = {'category': 'news'}
+        mixin.get_page_number = Mock(return_value=2)
+
+        self.assertEqual(
+            [('category', 'news'), ('page', 2)],
+            mixin.get_response_cache_vary()
+        )
+
+        mixin.kwargs = {'category': 'news', 'page': 3}
+        self.assertEqual(
+            [('category', 'news'), ('page', 3)],
+            mixin.get_response_cache_vary()
+        )
+
+    @patch('flask_views.db.mongoengine.list.request')
+    @patch('flask_views.base.request')
+    def test_get_response_cache_vary_cursor(self, base_request, request):
+        """
+        Test :py:meth:`.CachedListMixin.get_response_cache_vary` with cursor.
+        """
+        request.args = {'after': 'abc'}
+
+        class TestMixin(CachedListMixin, MultipleObjectMixin, View):
+            cursor_field = 'id'
+            items_per_page = 10
+
+        mixin = TestMixin()
+        mixin.kwargs = {}
+
+        self.assertEqual(
+            [('after', 'abc'), ('before', None)],
+            mixin.get_response_cache_vary()
+        )
+
+
 class BaseListViewTestCase(unittest.TestCase):
     """
     Tests for :py:class:`.BaseListView`.
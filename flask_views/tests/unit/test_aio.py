@@ -0,0 +1,96 @@
+import sys
+
+import unittest2 as unittest
+
+from mock import Mock
+
+if sys.version_info >= (3, 7):
+    import asyncio
+
+    from flask_views.aio import (
+        AsyncJSONView,
+        AsyncTemplateView,
+        coroutine_function,
+        run_sync,
+    )
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'requires Python 3.7')
+class RunSyncTestCase(unittest.TestCase):
+    """
+    Tests for :py:func:`.run_sync`.
+    """
+    def test_run_sync(self):
+        """
+        Test :py:func:`.run_sync`.
+        """
+        func = Mock(return_value='result')
+        self.assertEqual('result', run(run_sync(func, 'foo', bar='foo')))
+        func.assert_called_once_with('foo', bar='foo')
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'requires Python 3.7')
+class CoroutineFunctionTestCase(unittest.TestCase):
+    """
+    Tests for :py:func:`.coroutine_function`.
+    """
+    def test_coroutine_function(self):
+        """
+        Test :py:func:`.coroutine_function`.
+        """
+        func = coroutine_function(asyncio.sleep(0, result='foo'))
+        self.assertTrue(asyncio.iscoroutinefunction(func))
+        self.assertEqual('foo', run(func()))
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'requires Python 3.7')
+class AsyncTemplateViewTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.AsyncTemplateView`.
+    """
+    def test_get_context_data(self):
+        """
+        Test :py:meth:`.AsyncTemplateView.get_context_data`.
+        """
+        view = AsyncTemplateView()
+        self.assertEqual({
+            'params': {
+                'foo': 'bar',
+            }
+        }, run(view.get_context_data(foo='bar')))
+
+    def test_get(self):
+        """
+        Test :py:meth:`.AsyncTemplateView.get`.
+        """
+        view = AsyncTemplateView()
+        view.render_to_response = Mock(return_value='response')
+
+        self.assertEqual('response', run(view.get(bar='foo')))
+        view.render_to_response.assert_called_once_with(
+            {'params': {'bar': 'foo'}})
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'requires Python 3.7')
+class AsyncJSONViewTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.AsyncJSONView`.
+    """
+    def test_get(self):
+        """
+        Test :py:meth:`.AsyncJSONView.get`.
+        """
+        view = AsyncJSONView()
+        view.render_to_response = Mock(return_value='response')
+
+        self.assertEqual('response', run(view.get(bar='foo')))
+        view.render_to_response.assert_called_once_with(
+            {'params': {'bar': 'foo'}})
@@ -1,8 +1,30 @@
+import sys
+import threading
+from datetime import datetime, timedelta, tzinfo
+
 import unittest2 as unittest
 
 from mock import patch, Mock
 
-from flask_views.base import TemplateResponseMixin, TemplateView, View
+from flask_views.base import (
+    CachedResponseMixin,
+    ConditionalResponseMixin,
+    ImproperlyConfigured,
+    TemplateResponseMixin,
+    TemplateView,
+    View,
+    memoize,
+    to_utc,
+)
+from flask_views.cache import SingleFlight
+
+
+class CET(tzinfo):
+    def utcoffset(self, dt):
+        return timedelta(hours=1)
+
+    def dst(self, dt):
+        return timedelta(0)
 
 
 class ViewTestCase(unittest.TestCase):
@@ -29,11 +51,683 @@ class ViewTestCase(unittest.TestCase):
         super_class.dispatch_request.assert_called_once_with(
             'foo', 'bar', foo='bar')
 
+    @patch('flask_views.base.iscoroutine')
+    @patch('flask_views.base.super', create=True)
+    def test_dispatch_request_coroutine(self, super_mock, iscoroutine):
+        """
+        Test :py:meth:`.View.dispatch_request` with a coroutine handler.
+        """
+        iscoroutine.return_value = True
+        super_class = Mock()
+        super_mock.return_value = super_class
+
+        view = View()
+        view.run_coroutine = Mock(return_value='coroutine-result')
+
+        self.assertEqual('coroutine-result', view.dispatch_request())
+        iscoroutine.assert_called_once_with(
+            super_class.dispatch_request.return_value)
+        view.run_coroutine.assert_called_once_with(
+            super_class.dispatch_request.return_value)
+
+    def test_check_configuration(self):
+        """
+        Test :py:meth:`.View.check_configuration`.
+        """
+        class TestMixin(object):
+            @classmethod
+            def get_configuration_errors(cls, concrete):
+                if concrete:
+                    return ['foo is not set.', 'bar is not set.']
+                return []
+
+        class TestView(TestMixin, View):
+            pass
+
+        TestView.check_configuration()
+        with self.assertRaises(ImproperlyConfigured) as context:
+            TestView.check_configuration(concrete=True)
+        self.assertEqual(
+            '{0}.TestView: foo is not set. bar is not set.'.format(__name__),
+            str(context.exception)
+        )
+
+    def test_check_configuration_on_definition(self):
+        """
+        Test :py:meth:`.View.check_configuration` when defining the class.
+        """
+        class TestMixin(object):
+            @classmethod
+            def get_configuration_errors(cls, concrete):
+                return ['foo is invalid.'] if cls.foo else []
+
+        def define_class():
+            class TestView(TestMixin, View):
+                foo = True
+
+        self.assertRaises(ImproperlyConfigured, define_class)
+
+    def test_as_view(self):
+        """
+        Test :py:meth:`.View.as_view`.
+        """
+        class TestView(View):
+            check_configuration = Mock()
+
+        super_class = Mock()
+        super_class.as_view.return_value = 'view-function'
+
+        with patch('flask_views.base.super', create=True) as super_mock:
+            super_mock.return_value = super_class
+            self.assertEqual(
+                'view-function', TestView.as_view('name', 'foo', bar='foo'))
+
+        TestView.check_configuration.assert_called_with(concrete=True)
+        super_class.as_view.assert_called_once_with('name', 'foo', bar='foo')
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'requires Python 3.7')
+    @patch('flask_views.base.current_app')
+    def test_run_coroutine(self, current_app):
+        """
+        Test :py:meth:`.View.run_coroutine`.
+        """
+        import asyncio
+
+        ensure_sync = current_app.ensure_sync
+        view = View()
+        coroutine = asyncio.sleep(0, result='foo')
+        self.assertEqual(
+            ensure_sync.return_value.return_value,
+            view.run_coroutine(coroutine))
+
+        func = ensure_sync.call_args[0][0]
+        self.assertTrue(asyncio.iscoroutinefunction(func))
+
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual('foo', loop.run_until_complete(func()))
+        finally:
+            loop.close()
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'requires Python 3.7')
+    @patch('flask_views.base.current_app', new=object())
+    def test_run_coroutine_event_loop(self):
+        """
+        Test :py:meth:`.View.run_coroutine` without ``ensure_sync``.
+        """
+        import asyncio
+
+        view = View()
+        self.assertEqual(
+            'foo', view.run_coroutine(asyncio.sleep(0, result='foo')))
+
+
+class MemoizeTestCase(unittest.TestCase):
+    """
+    Tests for :py:func:`.memoize`.
+    """
+    def test_memoize(self):
+        """
+        Test :py:func:`.memoize`.
+        """
+        calls = []
+
+        class TestMixin(object):
+            @memoize
+            def get_value(self):
+                calls.append(self)
+                return len(calls)
+
+        mixin = TestMixin()
+        self.assertEqual(1, mixin.get_value())
+        self.assertEqual(1, mixin.get_value())
+        self.assertEqual(2, TestMixin().get_value())
+        self.assertEqual('get_value', TestMixin.get_value.__name__)
+
+    def test_memoize_override(self):
+        """
+        Test :py:func:`.memoize` with a method overridden in a subclass.
+        """
+        calls = []
+
+        class TestMixin(object):
+            @memoize
+            def get_value(self):
+                calls.append('base')
+                return 1
+
+        class TestSubclass(TestMixin):
+            def get_value(self):
+                calls.append('sub')
+                return super(TestSubclass, self).get_value() + 1
+
+        mixin = TestSubclass()
+        self.assertEqual(2, mixin.get_value())
+        self.assertEqual(2, mixin.get_value())
+        self.assertEqual(['sub', 'base', 'sub'], calls)
+
+    def test_memoize_copy(self):
+        """
+        Test that :py:func:`.memoize` copies mutable return values.
+        """
+        calls = []
+
+        class TestMixin(object):
+            @memoize
+            def get_value(self):
+                calls.append(self)
+                return {'foo': 'bar'}
+
+        mixin = TestMixin()
+        mixin.get_value()['foo'] = 'baz'
+        self.assertEqual({'foo': 'bar'}, mixin.get_value())
+        self.assertEqual(1, len(calls))
+
+
+class ToUtcTestCase(unittest.TestCase):
+    """
+    Tests for :py:func:`.to_utc`.
+    """
+    def test_to_utc(self):
+        """
+        Test :py:func:`.to_utc`.
+        """
+        self.assertEqual(datetime(2012, 1, 2), to_utc(datetime(2012, 1, 2)))
+        self.assertEqual(
+            datetime(2012, 1, 1, 23),
+            to_utc(datetime(2012, 1, 2, tzinfo=CET()))
+        )
+
+
+class ConditionalResponseMixinTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.ConditionalResponseMixin`.
+    """
+    def test_get_validators(self):
+        """
+        Test :py:meth:`.ConditionalResponseMixin.get_validators`.
+        """
+        mixin = ConditionalResponseMixin()
+        self.assertEqual((None, None), mixin.get_validators())
+
+        mixin.get_etag = Mock(return_value='etag')
+        mixin.get_last_modified = Mock(return_value='last-modified')
+        self.assertEqual(('etag', 'last-modified'), mixin.get_validators())
+
+    @patch('flask_views.base.request')
+    def test_is_not_modified_etag(self, request):
+        """
+        Test :py:meth:`.ConditionalResponseMixin.is_not_modified` with ETag.
+        """
+        request.if_none_match.contains_weak.side_effect = (
+            lambda etag: etag == '1')
+
+        mixin = ConditionalResponseMixin()
+        self.assertTrue(mixin.is_not_modified(1, None))
+        self.assertFalse(mixin.is_not_modified(2, None))
+        self.assertFalse(mixin.is_not_modified(None, None))
+
+    @patch('flask_views.base.request')
+    def test_is_not_modified_last_modified(self, request):
+        """
+        Test :py:meth:`.ConditionalResponseMixin.is_not_modified` with date.
+        """
+        request.if_none_match = None
+        request.if_modified_since = datetime(2012, 1, 2, 4, tzinfo=CET())
+
+        mixin = ConditionalResponseMixin()
+        self.assertTrue(mixin.is_not_modified(
+            None, datetime(2012, 1, 2, 3, 0, 0, 500)))
+        self.assertFalse(mixin.is_not_modified(
+            None, datetime(2012, 1, 2, 3, 0, 1)))
+        self.assertFalse(mixin.is_not_modified(None, None))
+
+    @patch('flask_views.base.super', create=True)
+    @patch('flask_views.base.request')
+    def test_dispatch_request_post(self, request, super_mock):
+        """
+        Test :py:meth:`.ConditionalResponseMixin.dispatch_request` with POST.
+        """
+        request.method = 'POST'
+
+        mixin = ConditionalResponseMixin()
+        mixin.get_validators = Mock()
+
+        self.assertEqual(
+            super_mock.return_value.dispatch_request.return_value,
+            mixin.dispatch_request('foo', bar='foo')
+        )
+        super_mock.return_value.dispatch_request.assert_called_once_with(
+            'foo', bar='foo')
+        self.assertFalse(mixin.get_validators.called)
+
+    @patch('flask_views.base.current_app')
+    @patch('flask_views.base.super', create=True)
+    @patch('flask_views.base.request')
+    def test_dispatch_request_not_modified(
+            self, request, super_mock, current_app):
+        """
+        Test :py:meth:`.ConditionalResponseMixin.dispatch_request` with 304.
+        """
+        request.method = 'GET'
+
+        mixin = ConditionalResponseMixin()
+        mixin.get_validators = Mock(return_value=(1, 'last-modified'))
+        mixin.is_not_modified = Mock(return_value=True)
+
+        response = mixin.dispatch_request(bar='foo')
+        self.assertEqual(current_app.response_class.return_value, response)
+        current_app.response_class.assert_called_once_with(status=304)
+        response.set_etag.assert_called_once_with('1')
+        self.assertEqual('last-modified', response.last_modified)
+        self.assertEqual({'bar': 'foo'}, mixin.kwargs)
+        self.assertFalse(super_mock.return_value.dispatch_request.called)
+
+    @patch('flask_views.base.make_response')
+    @patch('flask_views.base.super', create=True)
+    @patch('flask_views.base.request')
+    def test_dispatch_request_modified(
+            self, request, super_mock, make_response):
+        """
+        Test :py:meth:`.ConditionalResponseMixin.dispatch_request` with 200.
+        """
+        request.method = 'GET'
+
+        mixin = ConditionalResponseMixin()
+        mixin.get_validators = Mock(return_value=(None, None))
+        mixin.is_not_modified = Mock(return_value=False)
+
+        response = mixin.dispatch_request(bar='foo')
+        self.assertEqual(make_response.return_value, response)
+        make_response.assert_called_once_with(
+            super_mock.return_value.dispatch_request.return_value)
+        self.assertFalse(response.set_etag.called)
+
+
+class CachedResponseMixinTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.CachedResponseMixin`.
+    """
+    def test_get_response_cache_tags(self):
+        """
+        Test :py:meth:`.CachedResponseMixin.get_response_cache_tags`.
+        """
+        mixin = CachedResponseMixin()
+        self.assertEqual([], mixin.get_response_cache_tags())
+
+    @patch('flask_views.base.request')
+    def test_get_response_cache_vary(self, request):
+        """
+        Test :py:meth:`.CachedResponseMixin.get_response_cache_vary`.
+        """
+        request.args = {'sort': 'title', 'foo': 'bar'}
+        request.headers = {'Accept-Language': 'nl'}
+
+        mixin = CachedResponseMixin()
+        mixin.kwargs = {'slug': 'foo', 'category': 'news'}
+        mixin.response_cache_vary_args = ['sort']
+        mixin.response_cache_vary_headers = ['Accept-Language']
+        mixin.get_vary_args = Mock(return_value=[])
+        mixin.get_media_type = Mock(return_value=None)
+
+        self.assertEqual([
+            ('category', 'news'),
+            ('slug', 'foo'),
+            ('sort', 'title'),
+            ('accept-language', 'nl'),
+        ], mixin.get_response_cache_vary())
+
+        mixin.get_vary_args.return_value = [('fields', 'title')]
+        mixin.get_media_type.return_value = 'application/json'
+        self.assertEqual([
+            ('fields', 'title'),
+            ('media_type', 'application/json'),
+        ], mixin.get_response_cache_vary()[-2:])
+
+    @patch('flask_views.base.get_tag_version')
+    def test_get_response_cache_key(self, get_tag_version):
+        """
+        Test :py:meth:`.CachedResponseMixin.get_response_cache_key`.
+        """
+        get_tag_version.return_value = 'abc'
+
+        mixin = CachedResponseMixin()
+        mixin.response_cache = Mock()
+        mixin.get_response_cache_vary = Mock(return_value=[('slug', 'foo')])
+        mixin.get_response_cache_tags = Mock(return_value=['tag'])
+
+        self.assertEqual(
+            'flask_views.response:flask_views.base.CachedResponseMixin:'
+            'slug=foo&tag:tag=abc',
+            mixin.get_response_cache_key()
+        )
+        get_tag_version.assert_called_once_with(mixin.response_cache, 'tag')
+
+    def test_is_response_cacheable(self):
+        """
+        Test :py:meth:`.CachedResponseMixin.is_response_cacheable`.
+        """
+        mixin = CachedResponseMixin()
+        response = Mock(status_code=200, is_streamed=False, headers={})
+        self.assertTrue(mixin.is_response_cacheable(response))
+
+        response.headers = {'Set-Cookie': 'foo=bar'}
+        self.assertFalse(mixin.is_response_cacheable(response))
+
+        response = Mock(status_code=200, is_streamed=True, headers={})
+        self.assertFalse(mixin.is_response_cacheable(response))
+
+        response = Mock(status_code=404, is_streamed=False, headers={})
+        self.assertFalse(mixin.is_response_cacheable(response))
+
+    @patch('flask_views.base.super', create=True)
+    @patch('flask_views.base.request')
+    def test_dispatch_request_post(self, request, super_mock):
+        """
+        Test :py:meth:`.CachedResponseMixin.dispatch_request` with POST.
+        """
+        request.method = 'POST'
+
+        mixin = CachedResponseMixin()
+        mixin.response_cache = Mock()
+
+        self.assertEqual(
+            super_mock.return_value.dispatch_request.return_value,
+            mixin.dispatch_request('foo', bar='foo')
+        )
+        self.assertFalse(mixin.response_cache.get.called)
+
+    @patch('flask_views.base.time')
+    @patch('flask_views.base.make_response')
+    @patch('flask_views.base.super', create=True)
+    def test_build_response(self, super_mock, make_response, time):
+        """
+        Test :py:meth:`.CachedResponseMixin.build_response`.
+        """
+        time.return_value = 100
+        response = make_response.return_value
+        response.get_data.return_value = 'data'
+        response.status_code = 200
+        response.headers = {'Content-Type': 'text/html'}
+
+        mixin = CachedResponseMixin()
+        mixin.args = ('foo',)
+        mixin.kwargs = {'bar': 'foo'}
+        mixin.response_cache = Mock()
+        mixin.response_cache_timeout = 10
+        mixin.response_cache_stale_timeout = 5
+        mixin.is_response_cacheable = Mock(return_value=True)
+
+        entry = ('data', 200, [('Content-Type', 'text/html')], 110)
+        self.assertEqual((response, entry), mixin.build_response('key'))
+        super_mock.return_value.dispatch_request.assert_called_once_with(
+            'foo', bar='foo')
+        make_response.assert_called_once_with(
+            super_mock.return_value.dispatch_request.return_value)
+        mixin.response_cache.set.assert_called_once_with('key', entry, 15)
+
+    @patch('flask_views.base.make_response')
+    @patch('flask_views.base.super', create=True)
+    def test_build_response_without_timeout(self, super_mock, make_response):
+        """
+        Test :py:meth:`.CachedResponseMixin.build_response` without timeout.
+        """
+        response = make_response.return_value
+        response.get_data.return_value = 'data'
+        response.status_code = 200
+        response.headers = {}
+
+        mixin = CachedResponseMixin()
+        mixin.args = ()
+        mixin.kwargs = {}
+        mixin.response_cache = Mock()
+        mixin.response_cache_timeout = 0
+        mixin.response_cache_stale_timeout = 5
+        mixin.is_response_cacheable = Mock(return_value=True)
+
+        entry = ('data', 200, [], None)
+        self.assertEqual((response, entry), mixin.build_response('key'))
+        mixin.response_cache.set.assert_called_once_with('key', entry, 0)
+
+    @patch('flask_views.base.make_response')
+    @patch('flask_views.base.super', create=True)
+    def test_build_response_not_cacheable(self, super_mock, make_response):
+        """
+        Test :py:meth:`.CachedResponseMixin.build_response` not cacheable.
+        """
+        mixin = CachedResponseMixin()
+        mixin.args = ()
+        mixin.kwargs = {}
+        mixin.response_cache = Mock()
+        mixin.is_response_cacheable = Mock(return_value=False)
+
+        self.assertEqual(
+            (make_response.return_value, None), mixin.build_response('key'))
+        self.assertFalse(mixin.response_cache.set.called)
+
+    @patch('flask_views.base.copy_current_request_context')
+    def test_revalidate_response(self, copy_current_request_context):
+        """
+        Test :py:meth:`.CachedResponseMixin.revalidate_response`.
+        """
+        copy_current_request_context.side_effect = lambda func: func
+
+        mixin = CachedResponseMixin()
+        mixin.response_cache = Mock()
+        mixin.response_single_flight = SingleFlight()
+        mixin.build_response = Mock()
+
+        mixin.revalidate_response('key')
+        for thread in threading.enumerate():
+            if thread is not threading.current_thread() and thread.daemon:
+                thread.join(1)
+
+        mixin.build_response.assert_called_once_with('key')
+        self.assertFalse(mixin.response_cache.delete.called)
+        self.assertFalse(mixin.response_single_flight.is_running('key'))
+
+    @patch('flask_views.base.current_app')
+    @patch('flask_views.base.copy_current_request_context')
+    def test_revalidate_response_error(
+            self, copy_current_request_context, current_app):
+        """
+        Test :py:meth:`.CachedResponseMixin.revalidate_response` failing.
+        """
+        copy_current_request_context.side_effect = lambda func: func
+
+        mixin = CachedResponseMixin()
+        mixin.response_cache = Mock()
+        mixin.response_single_flight = None
+        mixin.build_response = Mock(side_effect=Exception)
+
+        mixin.revalidate_response('key')
+        for thread in threading.enumerate():
+            if thread is not threading.current_thread() and thread.daemon:
+                thread.join(1)
+
+        mixin.response_cache.delete.assert_called_once_with('key')
+        self.assertTrue(current_app.logger.exception.called)
+
+    @patch('flask_views.base.threading')
+    def test_revalidate_response_running(self, threading_mock):
+        """
+        Test :py:meth:`.CachedResponseMixin.revalidate_response` when running.
+        """
+        mixin = CachedResponseMixin()
+        mixin.response_single_flight = SingleFlight()
+        mixin.response_single_flight.claim('key')
+
+        mixin.revalidate_response('key')
+        self.assertFalse(threading_mock.Thread.called)
+
+    @patch('flask_views.base.copy_current_request_context')
+    @patch('flask_views.base.threading')
+    def test_revalidate_response_start_error(
+            self, threading_mock, copy_current_request_context):
+        """
+        Test :py:meth:`.CachedResponseMixin.revalidate_response` start error.
+
+        This tests releasing the claim when the thread can not be started.
+
+        """
+        threading_mock.Thread.return_value.start.side_effect = RuntimeError
+
+        mixin = CachedResponseMixin()
+        mixin.response_single_flight = SingleFlight()
+
+        self.assertRaises(RuntimeError, mixin.revalidate_response, 'key')
+        self.assertFalse(mixin.response_single_flight.is_running('key'))
+
+    @patch('flask_views.base.copy_current_request_context')
+    @patch('flask_views.base.threading')
+    def test_revalidate_response_context_error(
+            self, threading_mock, copy_current_request_context):
+        """
+        Test :py:meth:`.CachedResponseMixin.revalidate_response` context error.
+
+        This tests releasing the claim when the request context can not be
+        copied.
+
+        """
+        copy_current_request_context.side_effect = RuntimeError
+
+        mixin = CachedResponseMixin()
+        mixin.response_single_flight = SingleFlight()
+
+        self.assertRaises(RuntimeError, mixin.revalidate_response, 'key')
+        self.assertFalse(mixin.response_single_flight.is_running('key'))
+        self.assertFalse(threading_mock.Thread.called)
+
+    @patch('flask_views.base.time')
+    @patch('flask_views.base.current_app')
+    @patch('flask_views.base.super', create=True)
+    @patch('flask_views.base.request')
+    def test_dispatch_request_cached(
+            self, request, super_mock, current_app, time):
+        """
+        Test :py:meth:`.CachedResponseMixin.dispatch_request` with cache hit.
+        """
+        request.method = 'GET'
+        time.return_value = 100
+
+        mixin = CachedResponseMixin()
+        mixin.response_cache = Mock()
+        mixin.response_cache.get.return_value = (
+            'data', 200, [('Content-Type', 'text/html')], 110)
+        mixin.get_response_cache_key = Mock(return_value='key')
+        mixin.revalidate_response = Mock()
+
+        self.assertEqual(
+            current_app.response_class.return_value,
+            mixin.dispatch_request(bar='foo')
+        )
+        mixin.response_cache.get.assert_called_once_with('key')
+        current_app.response_class.assert_called_once_with(
+            'data', status=200, headers=[('Content-Type', 'text/html')])
+        self.assertEqual({'bar': 'foo'}, mixin.kwargs)
+        self.assertFalse(super_mock.return_value.dispatch_request.called)
+        self.assertFalse(mixin.revalidate_response.called)
+
+    @patch('flask_views.base.time')
+    @patch('flask_views.base.current_app')
+    @patch('flask_views.base.request')
+    def test_dispatch_request_stale(self, request, current_app, time):
+        """
+        Test :py:meth:`.CachedResponseMixin.dispatch_request` with stale hit.
+        """
+        request.method = 'GET'
+        time.return_value = 120
+
+        mixin = CachedResponseMixin()
+        mixin.response_cache = Mock()
+        mixin.response_cache.get.return_value = ('data', 200, [], 110)
+        mixin.get_response_cache_key = Mock(return_value='key')
+        mixin.revalidate_response = Mock()
+
+        self.assertEqual(
+            current_app.response_class.return_value,
+            mixin.dispatch_request()
+        )
+        mixin.revalidate_response.assert_called_once_with('key')
+
+    @patch('flask_views.base.request')
+    def test_dispatch_request_not_cached(self, request):
+        """
+        Test :py:meth:`.CachedResponseMixin.dispatch_request` with cache miss.
+        """
+        request.method = 'GET'
+
+        mixin = CachedResponseMixin()
+        mixin.response_cache = Mock()
+        mixin.response_cache.get.return_value = None
+        mixin.response_single_flight = SingleFlight()
+        mixin.get_response_cache_key = Mock(return_value='key')
+        mixin.build_response = Mock(return_value=('response', 'entry'))
+
+        self.assertEqual('response', mixin.dispatch_request())
+        mixin.build_response.assert_called_once_with('key')
+
+        mixin.response_single_flight = None
+        self.assertEqual('response', mixin.dispatch_request())
+        self.assertEqual(2, mixin.build_response.call_count)
+
+    @patch('flask_views.base.current_app')
+    @patch('flask_views.base.request')
+    def test_dispatch_request_coalesced(self, request, current_app):
+        """
+        Test :py:meth:`.CachedResponseMixin.dispatch_request` coalesced.
+        """
+        request.method = 'GET'
+
+        mixin = CachedResponseMixin()
+        mixin.response_cache = Mock()
+        mixin.response_cache.get.return_value = None
+        mixin.response_single_flight = Mock()
+        mixin.response_single_flight.do.return_value = (
+            ('leader-response', ('data', 200, [], None)), True)
+        mixin.get_response_cache_key = Mock(return_value='key')
+        mixin.build_response = Mock(return_value=('response', None))
+
+        self.assertEqual(
+            current_app.response_class.return_value,
+            mixin.dispatch_request()
+        )
+        current_app.response_class.assert_called_once_with(
+            'data', status=200, headers=[])
+        self.assertFalse(mixin.build_response.called)
+
+        mixin.response_single_flight.do.return_value = (
+            ('leader-response', None), True)
+        self.assertEqual('response', mixin.dispatch_request())
+        mixin.build_response.assert_called_once_with('key')
+
 
 class TemplateResponseMixinTestCase(unittest.TestCase):
     """
     Tests for :py:class:`.TemplateResponseMixin`.
     """
+    def test_get_configuration_errors(self):
+        """
+        Test :py:meth:`.TemplateResponseMixin.get_configuration_errors`.
+        """
+        class TestMixin(TemplateResponseMixin):
+            pass
+
+        self.assertEqual([], TestMixin.get_configuration_errors(False))
+        self.assertEqual(
+            ['template_name is not set.'],
+            TestMixin.get_configuration_errors(True)
+        )
+
+        TestMixin.template_name = 'my/template.html'
+        self.assertEqual([], TestMixin.get_configuration_errors(True))
+
+        class RenderMixin(TemplateResponseMixin):
+            def render_to_response(self, context_data={}):
+                return 'response'
+
+        self.assertEqual([], RenderMixin.get_configuration_errors(True))
+
     @patch('flask_views.base.render_template')
     def test_render_to_response(self, render_template):
         """
@@ -48,6 +742,114 @@ class TemplateResponseMixinTestCase(unittest.TestCase):
             'rendered-template', mixin.render_to_response({'foo': 'bar'}))
         render_template.assert_called_once_with('my/template.html', foo='bar')
 
+    @patch('flask_views.base.render_template')
+    def test_render_to_response_fragment_cache(self, render_template):
+        """
+        Test :py:meth:`.TemplateResponseMixin.render_to_response` with cache.
+        """
+        mixin = TemplateResponseMixin()
+        mixin.template_name = 'my/template.html'
+        mixin.fragment_cache = Mock()
+
+        mixin.render_to_response({'foo': 'bar'})
+        render_template.assert_called_once_with(
+            'my/template.html', foo='bar', cache_fragment=mixin.cache_fragment)
+
+    def test_get_fragment_cache_key(self):
+        """
+        Test :py:meth:`.TemplateResponseMixin.get_fragment_cache_key`.
+        """
+        mixin = TemplateResponseMixin()
+        mixin.template_name = 'my/template.html'
+
+        self.assertEqual(
+            'flask_views.fragment:my/template.html:body:foo&3',
+            mixin.get_fragment_cache_key('body', ['foo', 3])
+        )
+
+    def test_cache_fragment(self):
+        """
+        Test :py:meth:`.TemplateResponseMixin.cache_fragment`.
+        """
+        caller = Mock(return_value='<p>body</p>')
+
+        mixin = TemplateResponseMixin()
+        mixin.fragment_cache = Mock()
+        mixin.fragment_cache.get.return_value = None
+        mixin.fragment_cache_timeout = 10
+        mixin.get_fragment_cache_key = Mock(return_value='key')
+
+        value = mixin.cache_fragment('body', 'foo', caller=caller)
+        self.assertEqual('<p>body</p>', value)
+        self.assertEqual('<p>body</p>', value.__html__())
+        mixin.get_fragment_cache_key.assert_called_once_with('body', ['foo'])
+        mixin.fragment_cache.set.assert_called_once_with(
+            'key', '<p>body</p>', 10)
+
+        caller.reset_mock()
+        mixin.fragment_cache.get.return_value = '<p>cached</p>'
+        self.assertEqual(
+            '<p>cached</p>', mixin.cache_fragment('body', caller=caller))
+        self.assertFalse(caller.called)
+
+    @patch('flask_views.base.render_template')
+    def test_render_to_response_stream(self, render_template):
+        """
+        Test :py:meth:`.TemplateResponseMixin.render_to_response` streaming.
+        """
+        mixin = TemplateResponseMixin()
+        mixin.stream = True
+        mixin.stream_template = Mock(return_value='streamed-template')
+
+        self.assertEqual(
+            'streamed-template', mixin.render_to_response({'foo': 'bar'}))
+        mixin.stream_template.assert_called_once_with({'foo': 'bar'})
+        self.assertFalse(render_template.called)
+
+    @patch('flask_views.base.stream_with_context')
+    @patch('flask_views.base.current_app')
+    def test_stream_template(self, current_app, stream_with_context):
+        """
+        Test :py:meth:`.TemplateResponseMixin.stream_template`.
+        """
+        app = current_app._get_current_object.return_value
+        template = app.jinja_env.get_or_select_template.return_value
+        template_stream = template.stream.return_value
+
+        mixin = TemplateResponseMixin()
+        mixin.template_name = 'my/template.html'
+        mixin.stream_buffer_size = 10
+
+        self.assertEqual(
+            app.response_class.return_value,
+            mixin.stream_template({'foo': 'bar'})
+        )
+        app.update_template_context.assert_called_once_with({'foo': 'bar'})
+        app.jinja_env.get_or_select_template.assert_called_once_with(
+            'my/template.html')
+        template.stream.assert_called_once_with({'foo': 'bar'})
+        template_stream.enable_buffering.assert_called_once_with(10)
+        stream_with_context.assert_called_once_with(template_stream)
+        app.response_class.assert_called_once_with(
+            stream_with_context.return_value)
+
+    @patch('flask_views.base.stream_with_context')
+    @patch('flask_views.base.current_app')
+    def test_stream_template_without_buffering(
+            self, current_app, stream_with_context):
+        """
+        Test :py:meth:`.TemplateResponseMixin.stream_template` unbuffered.
+        """
+        app = current_app._get_current_object.return_value
+        template = app.jinja_env.get_or_select_template.return_value
+
+        mixin = TemplateResponseMixin()
+        mixin.template_name = 'my/template.html'
+        mixin.stream_buffer_size = 0
+
+        mixin.stream_template()
+        self.assertFalse(template.stream.return_value.enable_buffering.called)
+
 
 class TemplateViewTestCase(unittest.TestCase):
     """
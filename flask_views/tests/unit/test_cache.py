@@ -0,0 +1,259 @@
+import shutil
+import tempfile
+import threading
+
+import unittest2 as unittest
+
+from mock import patch
+
+from flask_views.cache import (
+    BaseCache,
+    FileSystemCache,
+    LRUCache,
+    SingleFlight,
+    get_tag_version,
+    invalidate_tag,
+)
+
+
+class TagTestCase(unittest.TestCase):
+    """
+    Tests for :py:func:`.get_tag_version` and :py:func:`.invalidate_tag`.
+    """
+    def test_get_tag_version(self):
+        """
+        Test :py:func:`.get_tag_version`.
+        """
+        cache = LRUCache()
+        version = get_tag_version(cache, 'foo')
+
+        self.assertEqual(version, get_tag_version(cache, 'foo'))
+        self.assertEqual(version, cache.get('flask_views.tag:foo'))
+        self.assertNotEqual(version, get_tag_version(cache, 'bar'))
+
+    def test_invalidate_tag(self):
+        """
+        Test :py:func:`.invalidate_tag`.
+        """
+        cache = LRUCache()
+        version = get_tag_version(cache, 'foo')
+        bar_version = get_tag_version(cache, 'bar')
+
+        invalidate_tag(cache, 'foo')
+        self.assertNotEqual(version, get_tag_version(cache, 'foo'))
+        self.assertEqual(bar_version, get_tag_version(cache, 'bar'))
+
+
+class SingleFlightTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.SingleFlight`.
+    """
+    def test_do(self):
+        """
+        Test :py:meth:`.SingleFlight.do`.
+        """
+        single_flight = SingleFlight()
+        self.assertEqual(
+            ('foo', False), single_flight.do('key', lambda: 'foo'))
+        self.assertFalse(single_flight.is_running('key'))
+
+    def test_do_coalesced(self):
+        """
+        Test :py:meth:`.SingleFlight.do` with concurrent calls.
+        """
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def func():
+            calls.append(1)
+            started.set()
+            release.wait(1)
+            return 'foo'
+
+        leader = threading.Thread(
+            target=lambda: results.append(single_flight.do('key', func)))
+        leader.start()
+        started.wait(1)
+        self.assertTrue(single_flight.is_running('key'))
+
+        follower = threading.Thread(
+            target=lambda: results.append(single_flight.do('key', func)))
+        follower.start()
+        follower.join(0.1)
+        release.set()
+        leader.join(1)
+        follower.join(1)
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual([('foo', False), ('foo', True)], results)
+        self.assertFalse(single_flight.is_running('key'))
+
+    def test_do_exception(self):
+        """
+        Test :py:meth:`.SingleFlight.do` with a function raising an exception.
+        """
+        def func():
+            raise ValueError()
+
+        single_flight = SingleFlight()
+        self.assertRaises(ValueError, single_flight.do, 'key', func)
+        self.assertFalse(single_flight.is_running('key'))
+
+    def test_do_timeout(self):
+        """
+        Test :py:meth:`.SingleFlight.do` waiting longer than the timeout.
+        """
+        single_flight = SingleFlight(timeout=0.01)
+        self.assertTrue(single_flight.claim('key'))
+
+        self.assertEqual(
+            ('foo', False), single_flight.do('key', lambda: 'foo'))
+        self.assertTrue(single_flight.is_running('key'))
+
+    def test_claim(self):
+        """
+        Test :py:meth:`.SingleFlight.claim` and
+        :py:meth:`.SingleFlight.release`.
+        """
+        single_flight = SingleFlight()
+        self.assertTrue(single_flight.claim('key'))
+        self.assertFalse(single_flight.claim('key'))
+
+        results = []
+        follower = threading.Thread(target=lambda: results.append(
+            single_flight.do('key', lambda: 'bar')))
+        follower.start()
+        follower.join(0.1)
+
+        single_flight.release('key', 'foo')
+        follower.join(1)
+        self.assertEqual([('foo', True)], results)
+        self.assertFalse(single_flight.is_running('key'))
+
+    def test_release_without_value(self):
+        """
+        Test :py:meth:`.SingleFlight.release` without a value.
+        """
+        single_flight = SingleFlight()
+        single_flight.claim('key')
+
+        results = []
+        follower = threading.Thread(target=lambda: results.append(
+            single_flight.do('key', lambda: 'bar')))
+        follower.start()
+        follower.join(0.1)
+
+        single_flight.release('key')
+        follower.join(1)
+        self.assertEqual([('bar', False)], results)
+
+
+class BaseCacheTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.BaseCache`.
+    """
+    @patch('flask_views.cache.time')
+    def test_get_expires(self, time):
+        """
+        Test :py:meth:`.BaseCache.get_expires`.
+        """
+        time.return_value = 100
+        cache = BaseCache(default_timeout=10)
+        self.assertEqual(110, cache.get_expires(None))
+        self.assertEqual(105, cache.get_expires(5))
+        self.assertEqual(None, cache.get_expires(0))
+
+
+class LRUCacheTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.LRUCache`.
+    """
+    def test_get_set_delete(self):
+        """
+        Test :py:meth:`.LRUCache.get`, ``set``, ``delete`` and ``clear``.
+        """
+        cache = LRUCache()
+        self.assertEqual(None, cache.get('foo'))
+
+        cache.set('foo', 'bar')
+        cache.set('bar', 'foo')
+        self.assertEqual('bar', cache.get('foo'))
+
+        cache.delete('foo')
+        self.assertEqual(None, cache.get('foo'))
+
+        cache.clear()
+        self.assertEqual(None, cache.get('bar'))
+
+    @patch('flask_views.cache.time')
+    def test_expire(self, time):
+        """
+        Test that :py:class:`.LRUCache` items expire.
+        """
+        time.return_value = 100
+        cache = LRUCache()
+        cache.set('foo', 'bar', timeout=10)
+
+        time.return_value = 109
+        self.assertEqual('bar', cache.get('foo'))
+
+        time.return_value = 110
+        self.assertEqual(None, cache.get('foo'))
+
+    def test_max_entries(self):
+        """
+        Test that the least recently used item is removed.
+        """
+        cache = LRUCache(max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        self.assertEqual(1, cache.get('a'))
+        self.assertEqual(None, cache.get('b'))
+        self.assertEqual(3, cache.get('c'))
+
+
+class FileSystemCacheTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.FileSystemCache`.
+    """
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_get_set_delete(self):
+        """
+        Test :py:meth:`.FileSystemCache.get`, ``set``, ``delete``, ``clear``.
+        """
+        cache = FileSystemCache(self.cache_dir)
+        self.assertEqual(None, cache.get('foo'))
+
+        cache.set('foo', {'bar': 1})
+        cache.set('bar', 'foo')
+        self.assertEqual(
+            {'bar': 1}, FileSystemCache(self.cache_dir).get('foo'))
+
+        cache.delete('foo')
+        self.assertEqual(None, cache.get('foo'))
+
+        cache.clear()
+        self.assertEqual(None, cache.get('bar'))
+
+    @patch('flask_views.cache.time')
+    def test_expire(self, time):
+        """
+        Test that :py:class:`.FileSystemCache` items expire.
+        """
+        time.return_value = 100
+        cache = FileSystemCache(self.cache_dir)
+        cache.set('foo', 'bar', timeout=10)
+
+        time.return_value = 110
+        self.assertEqual(None, cache.get('foo'))
@@ -9,6 +9,28 @@ class FormMixinTestCase(unittest.TestCase):
     """
     Tests for :py:class:`.FormMixin`.
     """
+    def test_get_configuration_errors(self):
+        """
+        Test :py:meth:`.FormMixin.get_configuration_errors`.
+        """
+        class TestMixin(FormMixin):
+            pass
+
+        self.assertEqual([], TestMixin.get_configuration_errors(False))
+        self.assertEqual(
+            ['form_class is not set.'],
+            TestMixin.get_configuration_errors(True)
+        )
+
+        TestMixin.form_class = Mock()
+        self.assertEqual([], TestMixin.get_configuration_errors(True))
+
+        class FormOverrideMixin(FormMixin):
+            def get_form(self):
+                return 'form'
+
+        self.assertEqual([], FormOverrideMixin.get_configuration_errors(True))
+
     def test_initial(self):
         """
         Test :py:meth:`.FormMixin.get_initial`.
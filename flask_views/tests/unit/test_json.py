@@ -1,8 +1,56 @@
+import json
+
 import unittest2 as unittest
 
 from mock import patch, Mock
 
-from flask_views.json import JSONResponseMixin, JSONView
+from flask_views.json import (
+    JSONResponseMixin, JSONSerializer, JSONView, OrjsonSerializer)
+
+
+class JSONSerializerTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.JSONSerializer`.
+    """
+    @patch('flask_views.json.json')
+    def test_dumps(self, json_mock):
+        """
+        Test :py:meth:`.JSONSerializer.dumps`.
+        """
+        encoder_class = Mock()
+        serializer = JSONSerializer(encoder_class=encoder_class)
+
+        self.assertTrue(serializer.is_available())
+        self.assertEqual(json_mock.dumps.return_value, serializer.dumps('foo'))
+        json_mock.dumps.assert_called_once_with('foo', cls=encoder_class)
+
+
+class OrjsonSerializerTestCase(unittest.TestCase):
+    """
+    Tests for :py:class:`.OrjsonSerializer`.
+    """
+    @patch('flask_views.json.orjson', None)
+    def test_is_available(self):
+        """
+        Test :py:meth:`.OrjsonSerializer.is_available` without orjson.
+        """
+        self.assertFalse(OrjsonSerializer.is_available())
+
+    @patch('flask_views.json.orjson')
+    def test_dumps(self, orjson):
+        """
+        Test :py:meth:`.OrjsonSerializer.dumps`.
+        """
+        encoder_class = Mock()
+        serializer = OrjsonSerializer(encoder_class=encoder_class)
+
+        self.assertTrue(serializer.is_available())
+        self.assertEqual(orjson.dumps.return_value, serializer.dumps('foo'))
+        orjson.dumps.assert_called_once_with(
+            'foo',
+            default=encoder_class.return_value.default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
 
 
 class JSONResponseMixinTestCase(unittest.TestCase):
@@ -15,6 +63,7 @@ class JSONResponseMixinTestCase(unittest.TestCase):
         """
         Test :py:meth:`.JSONResponseMixin.render_to_response`.
         """
+        current_app.config = {}
         current_app.response_class.return_value = 'response-class'
         json.dumps.return_value = 'json-dump'
 
@@ -34,6 +83,7 @@ class JSONResponseMixinTestCase(unittest.TestCase):
         """
         Test :py:meth:`.JSONResponseMixin.render_to_response` with encoder cls.
         """
+        current_app.config = {}
         current_app.response_class.return_value = 'response-class'
         json.dumps.return_value = 'json-dump'
 
@@ -50,6 +100,164 @@ class JSONResponseMixinTestCase(unittest.TestCase):
             'json-dump', mimetype='application/json')
 
 
+    @patch('flask_views.json.current_app')
+    def test_get_serializer(self, current_app):
+        """
+        Test :py:meth:`.JSONResponseMixin.get_serializer`.
+        """
+        current_app.config = {}
+
+        mixin = JSONResponseMixin()
+        mixin.encoder_class = Mock()
+
+        serializer = mixin.get_serializer()
+        self.assertIsInstance(serializer, JSONSerializer)
+        self.assertEqual(mixin.encoder_class, serializer.encoder_class)
+
+    @patch('flask_views.json.orjson')
+    @patch('flask_views.json.current_app')
+    def test_get_serializer_from_config(self, current_app, orjson):
+        """
+        Test :py:meth:`.JSONResponseMixin.get_serializer` from app config.
+        """
+        current_app.config = {'VIEWS_JSON_SERIALIZER': 'orjson'}
+
+        mixin = JSONResponseMixin()
+        self.assertIsInstance(mixin.get_serializer(), OrjsonSerializer)
+
+        mixin.serializer_class = JSONSerializer
+        self.assertIsInstance(mixin.get_serializer(), JSONSerializer)
+
+    @patch('flask_views.json.current_app')
+    def test_get_serializer_class(self, current_app):
+        """
+        Test :py:meth:`.JSONResponseMixin.get_serializer_class`.
+        """
+        current_app.config = {}
+
+        mixin = JSONResponseMixin()
+        self.assertIs(JSONSerializer, mixin.get_serializer_class())
+
+        current_app.config = {'VIEWS_JSON_SERIALIZER': 'json'}
+        self.assertIs(JSONSerializer, mixin.get_serializer_class())
+
+    @patch('flask_views.json.orjson', None)
+    @patch('flask_views.json.current_app')
+    def test_get_serializer_fallback(self, current_app):
+        """
+        Test :py:meth:`.JSONResponseMixin.get_serializer` fallback.
+        """
+        current_app.config = {}
+
+        mixin = JSONResponseMixin()
+        mixin.serializer_class = OrjsonSerializer
+
+        serializer = mixin.get_serializer()
+        self.assertIs(JSONSerializer, type(serializer))
+
+    def test_generate_json_stream(self):
+        """
+        Test :py:meth:`.JSONResponseMixin.generate_json_stream`.
+        """
+        mixin = JSONResponseMixin()
+        mixin.stream_batch_size = 2
+        mixin.get_serializer = Mock(return_value=JSONSerializer())
+
+        chunks = list(mixin.generate_json_stream(
+            iter(range(5)), {'page': 1}, key='items'))
+        self.assertEqual(5, len(chunks))
+        self.assertEqual(
+            {'items': [0, 1, 2, 3, 4], 'page': 1},
+            json.loads(b''.join(chunks).decode('utf-8'))
+        )
+
+    def test_generate_json_stream_empty(self):
+        """
+        Test :py:meth:`.JSONResponseMixin.generate_json_stream` without data.
+        """
+        mixin = JSONResponseMixin()
+        mixin.get_serializer = Mock(return_value=JSONSerializer())
+
+        self.assertEqual(
+            b'{"objects":[]}', b''.join(mixin.generate_json_stream([])))
+
+    @patch('flask_views.json.stream_with_context')
+    @patch('flask_views.json.current_app')
+    def test_stream_to_response(self, current_app, stream_with_context):
+        """
+        Test :py:meth:`.JSONResponseMixin.stream_to_response`.
+        """
+        mixin = JSONResponseMixin()
+        mixin.generate_json_stream = Mock()
+
+        self.assertEqual(
+            current_app.response_class.return_value,
+            mixin.stream_to_response(['foo'], {'bar': 1}, key='items')
+        )
+        mixin.generate_json_stream.assert_called_once_with(
+            ['foo'], {'bar': 1}, 'items')
+        stream_with_context.assert_called_once_with(
+            mixin.generate_json_stream.return_value)
+        current_app.response_class.assert_called_once_with(
+            stream_with_context.return_value, mimetype='application/json')
+
+    @patch('flask_views.json.request')
+    def test_accepts_ndjson(self, request):
+        """
+        Test :py:meth:`.JSONResponseMixin.accepts_ndjson`.
+        """
+        mixin = JSONResponseMixin()
+
+        request.accept_mimetypes.best_match.return_value = 'application/json'
+        self.assertFalse(mixin.accepts_ndjson())
+
+        request.accept_mimetypes.best_match.return_value = (
+            'application/x-ndjson')
+        self.assertTrue(mixin.accepts_ndjson())
+        request.accept_mimetypes.best_match.assert_called_with(
+            ['application/json', 'application/x-ndjson'])
+
+    def test_generate_ndjson_stream(self):
+        """
+        Test :py:meth:`.JSONResponseMixin.generate_ndjson_stream`.
+        """
+        mixin = JSONResponseMixin()
+        mixin.get_serializer = Mock(return_value=JSONSerializer())
+
+        self.assertEqual(
+            [b'{"foo": 1}\n', b'{"foo": 2}\n'],
+            list(mixin.generate_ndjson_stream([{'foo': 1}, {'foo': 2}]))
+        )
+
+    @patch('flask_views.json.stream_with_context')
+    @patch('flask_views.json.current_app')
+    def test_stream_ndjson_response(self, current_app, stream_with_context):
+        """
+        Test :py:meth:`.JSONResponseMixin.stream_ndjson_response`.
+        """
+        mixin = JSONResponseMixin()
+        mixin.generate_ndjson_stream = Mock()
+
+        self.assertEqual(
+            current_app.response_class.return_value,
+            mixin.stream_ndjson_response(['foo'], headers={'X-Page': '1'})
+        )
+        mixin.generate_ndjson_stream.assert_called_once_with(['foo'])
+        current_app.response_class.assert_called_once_with(
+            stream_with_context.return_value,
+            mimetype='application/x-ndjson',
+            headers={'X-Page': '1'},
+        )
+
+    def test_get_encoder_class(self):
+        """
+        Test :py:meth:`.JSONResponseMixin.get_encoder_class`.
+        """
+        mixin = JSONResponseMixin()
+        mixin.encoder_class = Mock()
+        self.assertEqual(mixin.encoder_class, mixin.get_encoder_class())
+
+
 class JSONViewTestCase(unittest.TestCase):
     """
     Tests for :py:class:`.JSONView`.
@@ -18,6 +18,9 @@ setup(
     install_requires=[
         'Flask',
     ],
+    extras_require={
+        'orjson': ['orjson'],
+    },
     tests_require=[
         'mock',
         'wtforms',